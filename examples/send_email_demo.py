@@ -5,6 +5,82 @@ import asyncio
 from src.outlook_mcp_server.server import OutlookMCPServer
 
 
+# Example request payloads, built once at import rather than on every run
+SIMPLE_EMAIL_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": "simple-email",
+    "method": "send_email",
+    "params": {
+        "to_recipients": ["recipient@example.com"],
+        "subject": "Simple Test Email",
+        "body": "Hello! This is a simple text email sent via the MCP server.",
+        "body_format": "text"
+    }
+}
+
+RICH_EMAIL_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": "rich-email",
+    "method": "send_email",
+    "params": {
+        "to_recipients": ["primary@example.com", "secondary@example.com"],
+        "cc_recipients": ["manager@example.com"],
+        "bcc_recipients": ["archive@example.com"],
+        "subject": "📊 Weekly Report - Automated",
+        "body": """
+        <html>
+        <body>
+            <h1 style="color: #2E86AB;">Weekly Report</h1>
+            <p>Dear Team,</p>
+            <p>Please find the weekly report attached. Key highlights:</p>
+            <ul>
+                <li><strong>Tasks Completed:</strong> 25</li>
+                <li><strong>Issues Resolved:</strong> 8</li>
+                <li><strong>New Features:</strong> 3</li>
+            </ul>
+            <p>Best regards,<br>
+            <em>Automated Reporting System</em></p>
+        </body>
+        </html>
+        """,
+        "body_format": "html",
+        "importance": "high",
+        "attachments": [
+            "C:\\reports\\weekly_summary.pdf",
+            "C:\\reports\\metrics.xlsx"
+        ]
+    }
+}
+
+NOTIFICATION_EMAIL_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": "notification-email",
+    "method": "send_email",
+    "params": {
+        "to_recipients": ["admin@example.com"],
+        "subject": "🚨 System Alert: High CPU Usage Detected",
+        "body": """
+        <html>
+        <body style="font-family: Arial, sans-serif;">
+            <div style="background-color: #f8d7da; border: 1px solid #f5c6cb; padding: 15px; border-radius: 5px;">
+                <h2 style="color: #721c24; margin-top: 0;">⚠️ System Alert</h2>
+                <p><strong>Alert Type:</strong> High CPU Usage</p>
+                <p><strong>Server:</strong> web-server-01</p>
+                <p><strong>Current Usage:</strong> 95%</p>
+                <p><strong>Threshold:</strong> 80%</p>
+                <p><strong>Time:</strong> 2025-09-22 14:30:00 UTC</p>
+            </div>
+            <p>Please investigate immediately.</p>
+            <p><em>This is an automated alert from the monitoring system.</em></p>
+        </body>
+        </html>
+        """,
+        "body_format": "html",
+        "importance": "high"
+    }
+}
+
+
 async def demo_send_email():
     """Demonstrate send_email functionality."""
     
@@ -21,94 +97,20 @@ async def demo_send_email():
         
         # Example 1: Simple text email
         print("📝 Example 1: Simple Text Email")
-        simple_request = {
-            "jsonrpc": "2.0",
-            "id": "simple-email",
-            "method": "send_email",
-            "params": {
-                "to_recipients": ["recipient@example.com"],
-                "subject": "Simple Test Email",
-                "body": "Hello! This is a simple text email sent via the MCP server.",
-                "body_format": "text"
-            }
-        }
-        
         print("Request:")
-        print(json.dumps(simple_request, indent=2))
+        print(json.dumps(SIMPLE_EMAIL_REQUEST, indent=2))
         print("\n" + "─" * 50 + "\n")
         
         # Example 2: HTML email with CC and attachments
         print("📝 Example 2: Rich HTML Email with CC and Attachments")
-        rich_request = {
-            "jsonrpc": "2.0",
-            "id": "rich-email",
-            "method": "send_email",
-            "params": {
-                "to_recipients": ["primary@example.com", "secondary@example.com"],
-                "cc_recipients": ["manager@example.com"],
-                "bcc_recipients": ["archive@example.com"],
-                "subject": "📊 Weekly Report - Automated",
-                "body": """
-                <html>
-                <body>
-                    <h1 style="color: #2E86AB;">Weekly Report</h1>
-                    <p>Dear Team,</p>
-                    <p>Please find the weekly report attached. Key highlights:</p>
-                    <ul>
-                        <li><strong>Tasks Completed:</strong> 25</li>
-                        <li><strong>Issues Resolved:</strong> 8</li>
-                        <li><strong>New Features:</strong> 3</li>
-                    </ul>
-                    <p>Best regards,<br>
-                    <em>Automated Reporting System</em></p>
-                </body>
-                </html>
-                """,
-                "body_format": "html",
-                "importance": "high",
-                "attachments": [
-                    "C:\\reports\\weekly_summary.pdf",
-                    "C:\\reports\\metrics.xlsx"
-                ]
-            }
-        }
-        
         print("Request:")
-        print(json.dumps(rich_request, indent=2))
+        print(json.dumps(RICH_EMAIL_REQUEST, indent=2))
         print("\n" + "─" * 50 + "\n")
         
         # Example 3: Notification email
         print("📝 Example 3: System Notification Email")
-        notification_request = {
-            "jsonrpc": "2.0",
-            "id": "notification-email",
-            "method": "send_email",
-            "params": {
-                "to_recipients": ["admin@example.com"],
-                "subject": "🚨 System Alert: High CPU Usage Detected",
-                "body": """
-                <html>
-                <body style="font-family: Arial, sans-serif;">
-                    <div style="background-color: #f8d7da; border: 1px solid #f5c6cb; padding: 15px; border-radius: 5px;">
-                        <h2 style="color: #721c24; margin-top: 0;">⚠️ System Alert</h2>
-                        <p><strong>Alert Type:</strong> High CPU Usage</p>
-                        <p><strong>Server:</strong> web-server-01</p>
-                        <p><strong>Current Usage:</strong> 95%</p>
-                        <p><strong>Threshold:</strong> 80%</p>
-                        <p><strong>Time:</strong> 2025-09-22 14:30:00 UTC</p>
-                    </div>
-                    <p>Please investigate immediately.</p>
-                    <p><em>This is an automated alert from the monitoring system.</em></p>
-                </body>
-                </html>
-                """,
-                "body_format": "html",
-                "importance": "high"
-            }
-        }
-        
         print("Request:")
-        print(json.dumps(notification_request, indent=2))
+        print(json.dumps(NOTIFICATION_EMAIL_REQUEST, indent=2))
         print("\n" + "─" * 50 + "\n")
         
         # Show usage in n8n
@@ -14,21 +14,52 @@ import asyncio
 import json
 import re
 import sys
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, is_dataclass
 from decimal import Decimal
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from outlook_mcp_server.server import OutlookMCPServer, create_server_config
-from outlook_mcp_server.models.mcp_models import MCPRequest, MCPResponse
 from outlook_mcp_server.logging.logger import get_logger
+from outlook_mcp_server.models.folder_data import _DATACLASS_OPTIONS
 
 
-@dataclass
+# Lower-cased keywords every Agoda invoice carries; emails matching fewer than
+# _MIN_INVOICE_ANCHORS of them are not invoices and skip the regex extraction.
+# The multi-word labels are anchored on their last word because the patterns
+# allow any whitespace between words ("Total\s+Amount:").
+_INVOICE_ANCHORS = ('booking', 'hotel:', 'check-in:', 'check-out:', 'amount:', 'name:')
+_MIN_INVOICE_ANCHORS = 4
+
+# Upper bound on in-flight MCP requests, shared by the server config and the
+# email detail fan-out.
+MAX_CONCURRENT_REQUESTS = 5
+
+# Write buffer for saved reports; json.dump emits many small chunks, so a
+# large buffer turns them into a few big writes.
+REPORT_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Patterns for extracting information from email content, compiled once at
+# import time so each email is scanned without re-resolving the regex cache.
+_PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+_EXPENSE_PATTERNS = {
+    'booking_reference': re.compile(r'Booking\s+(?:Reference|ID|Number):\s*([A-Z0-9]+)', _PATTERN_FLAGS),
+    'hotel_name': re.compile(r'Hotel:\s*(.+?)(?:\n|$)', _PATTERN_FLAGS),
+    'location': re.compile(r'(?:Location|Address):\s*(.+?)(?:\n|,)', _PATTERN_FLAGS),
+    'check_in': re.compile(r'Check-in:\s*(\d{1,2}\s+\w+\s+\d{4})', _PATTERN_FLAGS),
+    'check_out': re.compile(r'Check-out:\s*(\d{1,2}\s+\w+\s+\d{4})', _PATTERN_FLAGS),
+    'total_amount': re.compile(r'Total\s+Amount:\s*([A-Z]{3})\s*([\d,]+\.?\d*)', _PATTERN_FLAGS),
+    'guest_name': re.compile(r'Guest\s+Name:\s*(.+?)(?:\n|$)', _PATTERN_FLAGS),
+}
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class TravelExpense:
     """Travel expense data structure."""
     booking_reference: str
@@ -44,7 +75,7 @@ class TravelExpense:
     email_id: str
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class TravelReport:
     """Travel expense report data structure."""
     report_generated_at: str
@@ -58,6 +89,112 @@ class TravelReport:
     summary_by_destination: Dict[str, Dict[str, Any]]
 
 
+_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11,
+    'december': 12,
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_booking_date(value: str) -> date:
+    """
+    Parse a booking date in the fixed 'DD Month YYYY' format.
+    
+    Equivalent to strptime(value, '%d %B %Y') without the per-call locale
+    and format-string handling; booking dates repeat often, so results are
+    memoized.
+    
+    Raises:
+        ValueError: If the value is not a valid 'DD Month YYYY' date
+    """
+    try:
+        day, month, year = value.split()
+        return date(int(year), _MONTHS[month.lower()], int(day))
+    except KeyError:
+        raise ValueError(f"Unknown month in date: {value!r}")
+
+
+# Mock expenses are constant; TravelExpense is frozen, so the instances can be
+# built once and shared by every generate_mock_expense_data() call.
+_MOCK_EXPENSES = (
+    TravelExpense(
+        booking_reference="AGD123456789",
+        hotel_name="Grand Hyatt Singapore",
+        location="Singapore, Singapore",
+        check_in_date="15 January 2024",
+        check_out_date="18 January 2024",
+        nights=3,
+        total_amount=Decimal("450.00"),
+        currency="USD",
+        guest_name="John Doe",
+        email_date="2024-01-10T09:30:00Z",
+        email_id="mock_email_1"
+    ),
+    TravelExpense(
+        booking_reference="AGD987654321",
+        hotel_name="Park Hyatt Tokyo",
+        location="Tokyo, Japan",
+        check_in_date="22 January 2024",
+        check_out_date="25 January 2024",
+        nights=3,
+        total_amount=Decimal("680.00"),
+        currency="USD",
+        guest_name="John Doe",
+        email_date="2024-01-18T14:15:00Z",
+        email_id="mock_email_2"
+    ),
+    TravelExpense(
+        booking_reference="AGD456789123",
+        hotel_name="Marina Bay Sands",
+        location="Singapore, Singapore",
+        check_in_date="28 January 2024",
+        check_out_date="30 January 2024",
+        nights=2,
+        total_amount=Decimal("320.00"),
+        currency="USD",
+        guest_name="John Doe",
+        email_date="2024-01-25T11:45:00Z",
+        email_id="mock_email_3"
+    ),
+    TravelExpense(
+        booking_reference="AGD789123456",
+        hotel_name="The Ritz-Carlton Bangkok",
+        location="Bangkok, Thailand",
+        check_in_date="05 February 2024",
+        check_out_date="08 February 2024",
+        nights=3,
+        total_amount=Decimal("280.00"),
+        currency="USD",
+        guest_name="John Doe",
+        email_date="2024-02-01T16:20:00Z",
+        email_id="mock_email_4"
+    ),
+    TravelExpense(
+        booking_reference="AGD321654987",
+        hotel_name="Conrad Hong Kong",
+        location="Hong Kong, Hong Kong",
+        check_in_date="12 February 2024",
+        check_out_date="15 February 2024",
+        nights=3,
+        total_amount=Decimal("520.00"),
+        currency="USD",
+        guest_name="John Doe",
+        email_date="2024-02-08T10:30:00Z",
+        email_id="mock_email_5"
+    )
+)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize report values the json module does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    return str(obj)
+
+
 class TravelExpenseAnalyzer:
     """Analyzes Agoda invoice emails to generate travel expense reports."""
     
@@ -66,15 +203,7 @@ class TravelExpenseAnalyzer:
         self.server: Optional[OutlookMCPServer] = None
         
         # Patterns for extracting information from email content
-        self.patterns = {
-            'booking_reference': r'Booking\s+(?:Reference|ID|Number):\s*([A-Z0-9]+)',
-            'hotel_name': r'Hotel:\s*(.+?)(?:\n|$)',
-            'location': r'(?:Location|Address):\s*(.+?)(?:\n|,)',
-            'check_in': r'Check-in:\s*(\d{1,2}\s+\w+\s+\d{4})',
-            'check_out': r'Check-out:\s*(\d{1,2}\s+\w+\s+\d{4})',
-            'total_amount': r'Total\s+Amount:\s*([A-Z]{3})\s*([\d,]+\.?\d*)',
-            'guest_name': r'Guest\s+Name:\s*(.+?)(?:\n|$)',
-        }
+        self.patterns = _EXPENSE_PATTERNS
     
     async def initialize_server(self) -> None:
         """Initialize the MCP server for testing."""
@@ -85,7 +214,7 @@ class TravelExpenseAnalyzer:
             config = create_server_config(
                 log_level="INFO",
                 enable_console_output=True,
-                max_concurrent_requests=5
+                max_concurrent_requests=MAX_CONCURRENT_REQUESTS
             )
             
             # Create and start server
@@ -104,6 +233,15 @@ class TravelExpenseAnalyzer:
             await self.server.stop()
             self.server = None
     
+    async def __aenter__(self):
+        """Async context manager entry; keeps one server alive across analyses."""
+        await self.initialize_server()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.cleanup_server()
+    
     async def search_agoda_invoices(self) -> List[Dict[str, Any]]:
         """
         Search for Agoda invoice emails using MCP requests.
@@ -114,28 +252,22 @@ class TravelExpenseAnalyzer:
         self.logger.info("Searching for Agoda invoice emails")
         
         try:
-            # Create MCP request to search for Agoda emails
-            search_request = MCPRequest(
-                id="search_agoda_1",
-                method="search_emails",
-                params={
+            # Build the MCP search request
+            request_data = {
+                "jsonrpc": "2.0",
+                "id": "search_agoda_1",
+                "method": "search_emails",
+                "params": {
                     "query": "from:Agoda invoice booking confirmation",
                     "limit": 50
                 }
-            )
+            }
             
             # Simulate MCP request processing
-            self.logger.info(f"Sending MCP request: {search_request.method}")
-            self.logger.debug(f"Request params: {search_request.params}")
+            self.logger.info(f"Sending MCP request: {request_data['method']}")
+            self.logger.debug(f"Request params: {request_data['params']}")
             
             # Process request through server
-            request_data = {
-                "jsonrpc": "2.0",
-                "id": search_request.id,
-                "method": search_request.method,
-                "params": search_request.params
-            }
-            
             response_data = await self.server.handle_request(request_data)
             
             # Extract results
@@ -162,19 +294,12 @@ class TravelExpenseAnalyzer:
             Email details dictionary or None if failed
         """
         try:
-            # Create MCP request to get email details
-            get_request = MCPRequest(
-                id=f"get_email_{email_id[:8]}",
-                method="get_email",
-                params={"email_id": email_id}
-            )
-            
-            # Process request
+            # Build the MCP request to get email details
             request_data = {
                 "jsonrpc": "2.0",
-                "id": get_request.id,
-                "method": get_request.method,
-                "params": get_request.params
+                "id": f"get_email_{email_id[:8]}",
+                "method": "get_email",
+                "params": {"email_id": email_id}
             }
             
             response_data = await self.server.handle_request(request_data)
@@ -197,15 +322,22 @@ class TravelExpenseAnalyzer:
             email: Email dictionary with content
             
         Returns:
-            TravelExpense object or None if extraction failed
+            TravelExpense object, or None if the email is not an invoice or
+            extraction failed
         """
         try:
             content = email.get("body", "") + " " + email.get("subject", "")
             
+            # Cheap keyword prefilter so non-invoice emails skip the regex pass
+            lowered = content.lower()
+            if sum(anchor in lowered for anchor in _INVOICE_ANCHORS) < _MIN_INVOICE_ANCHORS:
+                self.logger.debug(f"Skipping email {email.get('id', '')}: not an Agoda invoice")
+                return None
+            
             # Extract information using regex patterns
             extracted = {}
             for key, pattern in self.patterns.items():
-                match = re.search(pattern, content, re.IGNORECASE | re.MULTILINE)
+                match = pattern.search(content)
                 if match:
                     if key == 'total_amount':
                         extracted['currency'] = match.group(1)
@@ -217,22 +349,23 @@ class TravelExpenseAnalyzer:
             nights = 0
             if 'check_in' in extracted and 'check_out' in extracted:
                 try:
-                    check_in = datetime.strptime(extracted['check_in'], '%d %B %Y')
-                    check_out = datetime.strptime(extracted['check_out'], '%d %B %Y')
+                    check_in = _parse_booking_date(extracted['check_in'])
+                    check_out = _parse_booking_date(extracted['check_out'])
                     nights = (check_out - check_in).days
                 except ValueError:
                     nights = 1  # Default to 1 night if parsing fails
             
-            # Create TravelExpense object
+            # Create TravelExpense object; currency and location repeat across
+            # many bookings, so intern them to share one string per value
             expense = TravelExpense(
                 booking_reference=extracted.get('booking_reference', 'Unknown'),
                 hotel_name=extracted.get('hotel_name', 'Unknown Hotel'),
-                location=extracted.get('location', 'Unknown Location'),
+                location=sys.intern(extracted.get('location', 'Unknown Location')),
                 check_in_date=extracted.get('check_in', 'Unknown'),
                 check_out_date=extracted.get('check_out', 'Unknown'),
                 nights=nights,
                 total_amount=extracted.get('total_amount', Decimal('0')),
-                currency=extracted.get('currency', 'USD'),
+                currency=sys.intern(extracted.get('currency', 'USD')),
                 guest_name=extracted.get('guest_name', 'Unknown Guest'),
                 email_date=email.get('received_time', ''),
                 email_id=email.get('id', '')
@@ -249,75 +382,7 @@ class TravelExpenseAnalyzer:
         Generate mock expense data for demonstration purposes.
         This simulates what would be extracted from real Agoda emails.
         """
-        mock_expenses = [
-            TravelExpense(
-                booking_reference="AGD123456789",
-                hotel_name="Grand Hyatt Singapore",
-                location="Singapore, Singapore",
-                check_in_date="15 January 2024",
-                check_out_date="18 January 2024",
-                nights=3,
-                total_amount=Decimal("450.00"),
-                currency="USD",
-                guest_name="John Doe",
-                email_date="2024-01-10T09:30:00Z",
-                email_id="mock_email_1"
-            ),
-            TravelExpense(
-                booking_reference="AGD987654321",
-                hotel_name="Park Hyatt Tokyo",
-                location="Tokyo, Japan",
-                check_in_date="22 January 2024",
-                check_out_date="25 January 2024",
-                nights=3,
-                total_amount=Decimal("680.00"),
-                currency="USD",
-                guest_name="John Doe",
-                email_date="2024-01-18T14:15:00Z",
-                email_id="mock_email_2"
-            ),
-            TravelExpense(
-                booking_reference="AGD456789123",
-                hotel_name="Marina Bay Sands",
-                location="Singapore, Singapore",
-                check_in_date="28 January 2024",
-                check_out_date="30 January 2024",
-                nights=2,
-                total_amount=Decimal("320.00"),
-                currency="USD",
-                guest_name="John Doe",
-                email_date="2024-01-25T11:45:00Z",
-                email_id="mock_email_3"
-            ),
-            TravelExpense(
-                booking_reference="AGD789123456",
-                hotel_name="The Ritz-Carlton Bangkok",
-                location="Bangkok, Thailand",
-                check_in_date="05 February 2024",
-                check_out_date="08 February 2024",
-                nights=3,
-                total_amount=Decimal("280.00"),
-                currency="USD",
-                guest_name="John Doe",
-                email_date="2024-02-01T16:20:00Z",
-                email_id="mock_email_4"
-            ),
-            TravelExpense(
-                booking_reference="AGD321654987",
-                hotel_name="Conrad Hong Kong",
-                location="Hong Kong, Hong Kong",
-                check_in_date="12 February 2024",
-                check_out_date="15 February 2024",
-                nights=3,
-                total_amount=Decimal("520.00"),
-                currency="USD",
-                guest_name="John Doe",
-                email_date="2024-02-08T10:30:00Z",
-                email_id="mock_email_5"
-            )
-        ]
-        
-        return mock_expenses
+        return list(_MOCK_EXPENSES)
     
     def generate_travel_report(self, expenses: List[TravelExpense]) -> TravelReport:
         """
@@ -342,44 +407,51 @@ class TravelExpenseAnalyzer:
                 summary_by_destination={}
             )
         
-        # Calculate totals
-        total_expenses = sum(expense.total_amount for expense in expenses)
+        # Accumulate totals, destinations, date range and per-destination
+        # summaries in a single pass over the expenses
+        total_expenses = Decimal('0')
         total_bookings = len(expenses)
-        total_nights = sum(expense.nights for expense in expenses)
+        total_nights = 0
+        unique_destinations = set()
+        earliest_date = latest_date = None
+        summary_by_destination = defaultdict(lambda: {
+            "total_amount": Decimal('0'),
+            "total_nights": 0,
+            "bookings": 0,
+            "hotels": set()
+        })
         
-        # Get unique destinations
-        destinations = list(set(expense.location for expense in expenses))
+        for expense in expenses:
+            total_expenses += expense.total_amount
+            total_nights += expense.nights
+            unique_destinations.add(expense.location)
+            
+            # ISO-8601 timestamps order correctly as plain strings
+            email_date = expense.email_date
+            if email_date:
+                if earliest_date is None or email_date < earliest_date:
+                    earliest_date = email_date
+                if latest_date is None or email_date > latest_date:
+                    latest_date = email_date
+            
+            summary = summary_by_destination[expense.location]
+            summary["total_amount"] += expense.total_amount
+            summary["total_nights"] += expense.nights
+            summary["bookings"] += 1
+            summary["hotels"].add(expense.hotel_name)
         
-        # Calculate date range
-        dates = [datetime.fromisoformat(expense.email_date.replace('Z', '+00:00')) 
-                for expense in expenses if expense.email_date]
-        date_range = {
-            "start": min(dates).strftime('%Y-%m-%d') if dates else "",
-            "end": max(dates).strftime('%Y-%m-%d') if dates else ""
-        }
+        destinations = list(unique_destinations)
         
-        # Summary by destination
-        summary_by_destination = {}
-        for expense in expenses:
-            location = expense.location
-            if location not in summary_by_destination:
-                summary_by_destination[location] = {
-                    "total_amount": Decimal('0'),
-                    "total_nights": 0,
-                    "bookings": 0,
-                    "hotels": []
-                }
-            
-            summary_by_destination[location]["total_amount"] += expense.total_amount
-            summary_by_destination[location]["total_nights"] += expense.nights
-            summary_by_destination[location]["bookings"] += 1
-            summary_by_destination[location]["hotels"].append(expense.hotel_name)
+        # Hotels were collected as sets to dedupe; expose them as lists
+        summary_by_destination = dict(summary_by_destination)
+        for summary in summary_by_destination.values():
+            summary["hotels"] = list(summary["hotels"])
         
-        # Remove duplicate hotels
-        for location in summary_by_destination:
-            summary_by_destination[location]["hotels"] = list(set(
-                summary_by_destination[location]["hotels"]
-            ))
+        # Date range uses the YYYY-MM-DD prefix of the ISO timestamps
+        date_range = {
+            "start": earliest_date[:10] if earliest_date else "",
+            "end": latest_date[:10] if latest_date else ""
+        }
         
         return TravelReport(
             report_generated_at=datetime.now().isoformat(),
@@ -395,71 +467,89 @@ class TravelExpenseAnalyzer:
     
     def print_travel_report(self, report: TravelReport) -> None:
         """Print a formatted travel expense report."""
-        print("\n" + "="*80)
-        print("🧳 TRAVEL EXPENSE REPORT - AGODA BOOKINGS")
-        print("="*80)
+        # Collect all lines and write them at once instead of one print per line
+        lines = []
+        lines.append("\n" + "="*80)
+        lines.append("🧳 TRAVEL EXPENSE REPORT - AGODA BOOKINGS")
+        lines.append("="*80)
         
-        print(f"📅 Report Generated: {report.report_generated_at}")
-        print(f"📊 Analysis Period: {report.date_range['start']} to {report.date_range['end']}")
+        lines.append(f"📅 Report Generated: {report.report_generated_at}")
+        lines.append(f"📊 Analysis Period: {report.date_range['start']} to {report.date_range['end']}")
         
-        print(f"\n💰 FINANCIAL SUMMARY")
-        print(f"   Total Expenses: {report.currency} {report.total_expenses:,.2f}")
-        print(f"   Total Bookings: {report.total_bookings}")
-        print(f"   Total Nights: {report.total_nights}")
-        print(f"   Average per Night: {report.currency} {(report.total_expenses / report.total_nights):,.2f}")
+        lines.append(f"\n💰 FINANCIAL SUMMARY")
+        lines.append(f"   Total Expenses: {report.currency} {report.total_expenses:,.2f}")
+        lines.append(f"   Total Bookings: {report.total_bookings}")
+        lines.append(f"   Total Nights: {report.total_nights}")
+        lines.append(f"   Average per Night: {report.currency} {(report.total_expenses / report.total_nights):,.2f}")
         
-        print(f"\n🌍 DESTINATIONS VISITED")
+        lines.append(f"\n🌍 DESTINATIONS VISITED")
         for i, destination in enumerate(report.destinations, 1):
-            print(f"   {i}. {destination}")
+            lines.append(f"   {i}. {destination}")
         
-        print(f"\n📍 BREAKDOWN BY DESTINATION")
+        # Track the most visited destination during the breakdown pass; the
+        # strict comparison keeps the first destination on ties, like max()
+        most_visited_destination = None
+        most_visited_bookings = 0
+        lines.append(f"\n📍 BREAKDOWN BY DESTINATION")
         for location, summary in report.summary_by_destination.items():
-            print(f"\n   🏨 {location}")
-            print(f"      Amount: {report.currency} {summary['total_amount']:,.2f}")
-            print(f"      Nights: {summary['total_nights']}")
-            print(f"      Bookings: {summary['bookings']}")
-            print(f"      Hotels: {', '.join(summary['hotels'])}")
+            if summary['bookings'] > most_visited_bookings:
+                most_visited_destination = location
+                most_visited_bookings = summary['bookings']
+            lines.append(f"\n   🏨 {location}")
+            lines.append(f"      Amount: {report.currency} {summary['total_amount']:,.2f}")
+            lines.append(f"      Nights: {summary['total_nights']}")
+            lines.append(f"      Bookings: {summary['bookings']}")
+            lines.append(f"      Hotels: {', '.join(summary['hotels'])}")
         
-        print(f"\n📋 DETAILED BOOKING HISTORY")
+        lines.append(f"\n📋 DETAILED BOOKING HISTORY")
         for i, expense in enumerate(report.expenses, 1):
-            print(f"\n   {i}. {expense.hotel_name}")
-            print(f"      📍 Location: {expense.location}")
-            print(f"      📅 Dates: {expense.check_in_date} to {expense.check_out_date}")
-            print(f"      🌙 Nights: {expense.nights}")
-            print(f"      💰 Amount: {expense.currency} {expense.total_amount:,.2f}")
-            print(f"      🎫 Booking Ref: {expense.booking_reference}")
-            print(f"      👤 Guest: {expense.guest_name}")
+            lines.append(f"\n   {i}. {expense.hotel_name}")
+            lines.append(f"      📍 Location: {expense.location}")
+            lines.append(f"      📅 Dates: {expense.check_in_date} to {expense.check_out_date}")
+            lines.append(f"      🌙 Nights: {expense.nights}")
+            lines.append(f"      💰 Amount: {expense.currency} {expense.total_amount:,.2f}")
+            lines.append(f"      🎫 Booking Ref: {expense.booking_reference}")
+            lines.append(f"      👤 Guest: {expense.guest_name}")
         
-        print("\n" + "="*80)
-        print("📈 TRAVEL INSIGHTS")
-        print("="*80)
+        lines.append("\n" + "="*80)
+        lines.append("📈 TRAVEL INSIGHTS")
+        lines.append("="*80)
         
         # Calculate insights
         avg_booking_amount = report.total_expenses / report.total_bookings
         most_expensive = max(report.expenses, key=lambda x: x.total_amount)
         longest_stay = max(report.expenses, key=lambda x: x.nights)
         
-        print(f"💡 Average booking amount: {report.currency} {avg_booking_amount:,.2f}")
-        print(f"💎 Most expensive stay: {most_expensive.hotel_name} ({report.currency} {most_expensive.total_amount:,.2f})")
-        print(f"⏰ Longest stay: {longest_stay.hotel_name} ({longest_stay.nights} nights)")
-        print(f"🏆 Most visited destination: {max(report.summary_by_destination.keys(), key=lambda x: report.summary_by_destination[x]['bookings'])}")
+        lines.append(f"💡 Average booking amount: {report.currency} {avg_booking_amount:,.2f}")
+        lines.append(f"💎 Most expensive stay: {most_expensive.hotel_name} ({report.currency} {most_expensive.total_amount:,.2f})")
+        lines.append(f"⏰ Longest stay: {longest_stay.hotel_name} ({longest_stay.nights} nights)")
+        lines.append(f"🏆 Most visited destination: {most_visited_destination}")
+        
+        lines.append("\n" + "="*80)
         
-        print("\n" + "="*80)
+        sys.stdout.write("\n".join(lines) + "\n")
     
     async def run_analysis(self) -> TravelReport:
         """
         Run the complete travel expense analysis workflow.
         
+        When used inside ``async with TravelExpenseAnalyzer()`` the already
+        running server is reused; otherwise a server is started and stopped
+        around this single run.
+        
         Returns:
             TravelReport with analysis results
         """
+        owns_server = self.server is None
+        
         try:
             print("🚀 Starting Travel Expense Analysis")
             print("="*50)
             
-            # Initialize server
-            print("📡 Initializing Outlook MCP Server...")
-            await self.initialize_server()
+            # Initialize server unless the context manager already did
+            if owns_server:
+                print("📡 Initializing Outlook MCP Server...")
+                await self.initialize_server()
             
             # Search for Agoda emails
             print("🔍 Searching for Agoda invoice emails...")
@@ -470,14 +560,22 @@ class TravelExpenseAnalyzer:
             if emails:
                 print(f"📧 Processing {len(emails)} emails...")
                 
-                # Process each email to extract expense data
-                for i, email in enumerate(emails, 1):
-                    print(f"   Processing email {i}/{len(emails)}: {email.get('subject', 'No Subject')[:50]}...")
-                    
-                    # Get detailed email content
-                    email_details = await self.get_email_details(email['id'])
-                    if email_details:
-                        # Extract expense data
+                # Fetch email details concurrently, bounded by the server's limit
+                semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+                
+                async def fetch_details(index: int, email: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                    async with semaphore:
+                        print(f"   Processing email {index}/{len(emails)}: {email.get('subject', 'No Subject')[:50]}...")
+                        return await self.get_email_details(email['id'])
+                
+                details = await asyncio.gather(
+                    *(fetch_details(i, email) for i, email in enumerate(emails, 1)),
+                    return_exceptions=True
+                )
+                
+                # Extract expense data from each successfully fetched email
+                for email_details in details:
+                    if email_details and not isinstance(email_details, BaseException):
                         expense = self.extract_expense_data(email_details)
                         if expense:
                             expenses.append(expense)
@@ -497,29 +595,17 @@ class TravelExpenseAnalyzer:
             self.logger.error(f"Analysis failed: {e}", exc_info=True)
             raise
         finally:
-            # Cleanup
-            await self.cleanup_server()
+            # Cleanup only a server this run started itself
+            if owns_server:
+                await self.cleanup_server()
     
     def save_report_json(self, report: TravelReport, filename: str = "travel_expense_report.json") -> None:
         """Save the report as JSON file."""
         try:
-            # Convert Decimal objects to float for JSON serialization
-            report_dict = asdict(report)
-            
-            def decimal_to_float(obj):
-                if isinstance(obj, dict):
-                    return {k: decimal_to_float(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [decimal_to_float(item) for item in obj]
-                elif isinstance(obj, Decimal):
-                    return float(obj)
-                else:
-                    return obj
-            
-            report_dict = decimal_to_float(report_dict)
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(report_dict, f, indent=2, default=str)
+            # json.dump streams the report straight to disk; nested dataclasses
+            # and Decimals are converted lazily by _json_default as they are hit.
+            with open(filename, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER_SIZE) as f:
+                json.dump(report, f, indent=2, default=_json_default)
             
             print(f"💾 Report saved to: {filename}")
             
@@ -529,8 +615,6 @@ class TravelExpenseAnalyzer:
 
 async def main():
     """Main function to run the travel expense analysis demo."""
-    analyzer = TravelExpenseAnalyzer()
-    
     try:
         print("🧳 Outlook MCP Server - Travel Expense Analyzer Demo")
         print("="*60)
@@ -540,14 +624,15 @@ async def main():
         print("3. Generate a comprehensive travel report")
         print("="*60)
         
-        # Run the analysis
-        report = await analyzer.run_analysis()
-        
-        # Display the report
-        analyzer.print_travel_report(report)
-        
-        # Save report to file
-        analyzer.save_report_json(report)
+        async with TravelExpenseAnalyzer() as analyzer:
+            # Run the analysis
+            report = await analyzer.run_analysis()
+            
+            # Display the report
+            analyzer.print_travel_report(report)
+            
+            # Save report to file
+            analyzer.save_report_json(report)
         
         print("\n✅ Travel expense analysis completed successfully!")
         print("\n💡 This demo shows how the Outlook MCP Server can be used to:")
@@ -18,7 +18,6 @@ Output Format:
     JSON object with health status information
 """
 
-import asyncio
 import json
 import sys
 import argparse
@@ -29,26 +28,56 @@ from typing import Dict, Any, Optional
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-try:
-    from outlook_mcp_server.health import get_health_status, is_server_healthy
-    from outlook_mcp_server.server import OutlookMCPServer, create_server_config
-    from outlook_mcp_server.logging.logger import get_logger
-except ImportError as e:
-    print(json.dumps({
-        "status": "error",
-        "message": f"Failed to import required modules: {e}",
-        "timestamp": time.time()
-    }))
-    sys.exit(2)
+# asyncio and the server modules are imported once arguments are parsed, so
+# --help and usage errors do not load the event loop or Outlook COM stack.
+
+
+# Name the server is registered under by scripts/install_service.py
+SERVICE_NAME = "OutlookMCPServer"
+
+# Parsed configuration files keyed by (path, mtime_ns, size)
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+def _is_service_stopped() -> bool:
+    """
+    Check whether the Windows service is installed but stopped.
+    
+    Returns False when pywin32 is unavailable or the service is not
+    installed, so callers fall back to the full check.
+    """
+    try:
+        import win32service
+        import win32serviceutil
+        status = win32serviceutil.QueryServiceStatus(SERVICE_NAME)
+    except Exception:
+        return False
+    
+    return status[1] == win32service.SERVICE_STOPPED
+
+
+def _error_result(start_time: float, status: str, error: str, **extra: Any) -> Dict[str, Any]:
+    """Build the result for a failed check; every failure shares this shape."""
+    return {
+        "status": status,
+        "healthy": False,
+        "timestamp": time.time(),
+        "error": error,
+        **extra,
+        "check_duration": time.time() - start_time
+    }
 
 
 class HealthCheckRunner:
     """Health check runner for monitoring systems."""
     
-    def __init__(self, config_file: Optional[str] = None, timeout: int = 30):
+    def __init__(self, config_file: Optional[str] = None, timeout: int = 30,
+                 check_service: bool = False):
         self.config_file = config_file
         self.timeout = timeout
-        self.logger = None
+        # Whether the check is for the installed Windows service, rather than
+        # a server run some other way (stdio, interactive, ...)
+        self.check_service = check_service
         
     async def run_health_check(self) -> Dict[str, Any]:
         """
@@ -57,23 +86,27 @@ class HealthCheckRunner:
         Returns:
             Dictionary with health check results
         """
+        import asyncio
+        from outlook_mcp_server.health import get_health_status
+        from outlook_mcp_server.server import OutlookMCPServer
+        
         start_time = time.time()
         
         try:
-            # Initialize logger
-            self.logger = get_logger(__name__)
-            
             # Load configuration
             config = self._load_config()
             
             # Create server instance for health checking
             server = OutlookMCPServer(config)
             
-            # Perform health check with timeout
-            health_status = await asyncio.wait_for(
-                get_health_status(server),
-                timeout=self.timeout
-            )
+            try:
+                # Perform health check with timeout
+                health_status = await asyncio.wait_for(
+                    get_health_status(server),
+                    timeout=self.timeout
+                )
+            finally:
+                await server.stop()
             
             # Convert to dictionary for JSON output
             result = {
@@ -91,23 +124,12 @@ class HealthCheckRunner:
             return result
             
         except asyncio.TimeoutError:
-            return {
-                "status": "unhealthy",
-                "healthy": False,
-                "timestamp": time.time(),
-                "error": "Health check timed out",
-                "timeout_seconds": self.timeout,
-                "check_duration": time.time() - start_time
-            }
+            return _error_result(
+                start_time, "unhealthy", "Health check timed out",
+                timeout_seconds=self.timeout
+            )
         except Exception as e:
-            return {
-                "status": "error",
-                "healthy": False,
-                "timestamp": time.time(),
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "check_duration": time.time() - start_time
-            }
+            return _error_result(start_time, "error", str(e), error_type=type(e).__name__)
     
     async def run_quick_check(self) -> Dict[str, Any]:
         """
@@ -116,8 +138,19 @@ class HealthCheckRunner:
         Returns:
             Dictionary with basic health status
         """
+        import asyncio
+        from outlook_mcp_server.health import is_server_healthy
+        from outlook_mcp_server.server import OutlookMCPServer
+        
         start_time = time.time()
         
+        # A stopped service cannot be healthy; skip building a server for it
+        if self.check_service and _is_service_stopped():
+            return _error_result(
+                start_time, "unhealthy", f"Service '{SERVICE_NAME}' is stopped",
+                check_type="quick", reason="service_stopped"
+            )
+        
         try:
             # Load configuration
             config = self._load_config()
@@ -125,11 +158,14 @@ class HealthCheckRunner:
             # Create server instance
             server = OutlookMCPServer(config)
             
-            # Quick health check
-            is_healthy = await asyncio.wait_for(
-                is_server_healthy(server),
-                timeout=self.timeout
-            )
+            try:
+                # Quick health check
+                is_healthy = await asyncio.wait_for(
+                    is_server_healthy(server),
+                    timeout=self.timeout
+                )
+            finally:
+                await server.stop()
             
             return {
                 "status": "healthy" if is_healthy else "unhealthy",
@@ -140,42 +176,44 @@ class HealthCheckRunner:
             }
             
         except asyncio.TimeoutError:
-            return {
-                "status": "unhealthy",
-                "healthy": False,
-                "timestamp": time.time(),
-                "error": "Quick health check timed out",
-                "timeout_seconds": self.timeout,
-                "check_duration": time.time() - start_time
-            }
+            return _error_result(
+                start_time, "unhealthy", "Quick health check timed out",
+                timeout_seconds=self.timeout
+            )
         except Exception as e:
-            return {
-                "status": "error",
-                "healthy": False,
-                "timestamp": time.time(),
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "check_duration": time.time() - start_time
-            }
+            return _error_result(start_time, "error", str(e), error_type=type(e).__name__)
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load server configuration."""
+        """
+        Load server configuration.
+        
+        The parsed configuration file is cached per (path, mtime, size), so
+        repeated checks only re-read the file after it changes.
+        """
+        from outlook_mcp_server.server import create_server_config
+        
         if self.config_file:
             config_path = Path(self.config_file)
-            if not config_path.exists():
+            try:
+                stat = config_path.stat()
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
             
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    file_config = json.load(f)
-                
-                # Merge with default config
-                config = create_server_config()
-                config.update(file_config)
-                return config
-                
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON in configuration file: {e}")
+            cache_key = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+            file_config = _CONFIG_CACHE.get(cache_key)
+            
+            if file_config is None:
+                try:
+                    with open(config_path, 'r', encoding='utf-8') as f:
+                        file_config = json.load(f)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON in configuration file: {e}")
+                _CONFIG_CACHE[cache_key] = file_config
+            
+            # Merge with default config
+            config = create_server_config()
+            config.update(file_config)
+            return config
         else:
             # Use default configuration
             return create_server_config()
@@ -200,7 +238,7 @@ class HealthCheckRunner:
             return 2
 
 
-async def main():
+def main():
     """Main entry point for health check script."""
     parser = argparse.ArgumentParser(
         description="Outlook MCP Server Health Check",
@@ -218,6 +256,7 @@ Examples:
   %(prog)s                           Basic health check
   %(prog)s --config prod.json        Health check with custom config
   %(prog)s --quick                   Quick connectivity check only
+  %(prog)s --quick --service         Quick check of the Windows service
   %(prog)s --timeout 60              Health check with 60 second timeout
   %(prog)s --format nagios           Nagios-compatible output format
         """
@@ -242,6 +281,13 @@ Examples:
         help="Perform quick health check (connectivity only)"
     )
     
+    parser.add_argument(
+        "--service",
+        action="store_true",
+        help=f"Check the installed Windows service ({SERVICE_NAME}); "
+             "a stopped service is reported as unhealthy"
+    )
+    
     parser.add_argument(
         "--format",
         choices=["json", "nagios", "simple"],
@@ -257,10 +303,30 @@ Examples:
     
     args = parser.parse_args()
     
+    # Load the server package up front so a broken install exits with code 2
+    try:
+        import outlook_mcp_server.health
+        import outlook_mcp_server.server
+        import outlook_mcp_server.logging.logger
+    except ImportError as e:
+        print(json.dumps({
+            "status": "error",
+            "message": f"Failed to import required modules: {e}",
+            "timestamp": time.time()
+        }))
+        sys.exit(2)
+    
+    import asyncio
+    asyncio.run(_run(args))
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Run the selected health check and print the result."""
     # Create health check runner
     runner = HealthCheckRunner(
         config_file=args.config,
-        timeout=args.timeout
+        timeout=args.timeout,
+        check_service=args.service
     )
     
     try:
@@ -328,4 +394,4 @@ Examples:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
\ No newline at end of file
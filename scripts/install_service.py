@@ -18,161 +18,48 @@ Requirements:
 """
 
 import sys
-import os
-import win32serviceutil
-import win32service
-import win32event
-import servicemanager
-import socket
-import asyncio
-from pathlib import Path
+from functools import lru_cache
+from types import MappingProxyType
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
+# pywin32 and the service class (scripts/outlook_mcp_service.py) are imported
+# by the commands that need them, so the usage banner starts without them.
 
-from outlook_mcp_server.server import OutlookMCPServer, create_server_config
-from outlook_mcp_server.logging.logger import get_logger
 
-
-class OutlookMCPService(win32serviceutil.ServiceFramework):
-    """Windows service wrapper for Outlook MCP Server."""
-    
-    _svc_name_ = "OutlookMCPServer"
-    _svc_display_name_ = "Outlook MCP Server"
-    _svc_description_ = "Model Context Protocol server for Microsoft Outlook integration"
+def __getattr__(name):
+    """
+    Resolve OutlookMCPService lazily.
     
-    def __init__(self, args):
-        win32serviceutil.ServiceFramework.__init__(self, args)
-        self.hWaitStop = win32event.CreateEvent(None, 0, 0, None)
-        self.server = None
-        self.logger = None
-        socket.setdefaulttimeout(60)
-    
-    def SvcStop(self):
-        """Stop the service."""
-        self.ReportServiceStatus(win32service.SERVICE_STOP_PENDING)
-        win32event.SetEvent(self.hWaitStop)
-        
-        if self.logger:
-            self.logger.info("Service stop requested")
-        
-        # Stop the server
-        if self.server:
-            try:
-                asyncio.create_task(self.server.stop())
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(f"Error stopping server: {e}")
-    
-    def SvcDoRun(self):
-        """Run the service."""
-        try:
-            # Initialize logging
-            self.logger = get_logger(__name__)
-            
-            # Log service start
-            servicemanager.LogMsg(
-                servicemanager.EVENTLOG_INFORMATION_TYPE,
-                servicemanager.PYS_SERVICE_STARTED,
-                (self._svc_name_, '')
-            )
-            
-            self.logger.info("Outlook MCP Service starting")
-            
-            # Load configuration
-            config = self._load_service_config()
-            
-            # Create and start server
-            self.server = OutlookMCPServer(config)
-            
-            # Run the server in async context
-            asyncio.run(self._run_server())
-            
-        except Exception as e:
-            error_msg = f"Service failed to start: {e}"
-            
-            if self.logger:
-                self.logger.error(error_msg, exc_info=True)
-            
-            servicemanager.LogErrorMsg(error_msg)
-            
-            # Report service stopped
-            self.ReportServiceStatus(win32service.SERVICE_STOPPED)
+    Services installed before the class moved are registered as
+    install_service.OutlookMCPService and are still hosted from here.
+    """
+    if name == "OutlookMCPService":
+        from outlook_mcp_service import OutlookMCPService
+        return OutlookMCPService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def _service_status_names():
+    """Display names for the states reported by QueryServiceStatus."""
+    import win32service
     
-    def _load_service_config(self):
-        """Load configuration for service mode."""
-        # Default service configuration
-        config = create_server_config(
-            log_level="INFO",
-            log_dir=r"C:\ProgramData\OutlookMCPServer\logs",
-            enable_console_output=False,  # No console in service mode
-            max_concurrent_requests=20
-        )
-        
-        # Try to load config file from standard locations
-        config_locations = [
-            r"C:\ProgramData\OutlookMCPServer\config.json",
-            Path(__file__).parent.parent / "config" / "production.json",
-            Path(__file__).parent.parent / "outlook_mcp_server_config.json"
-        ]
-        
-        for config_path in config_locations:
-            if Path(config_path).exists():
-                try:
-                    import json
-                    with open(config_path, 'r') as f:
-                        file_config = json.load(f)
-                    config.update(file_config)
-                    
-                    if self.logger:
-                        self.logger.info(f"Loaded service config from: {config_path}")
-                    break
-                except Exception as e:
-                    if self.logger:
-                        self.logger.warning(f"Failed to load config from {config_path}: {e}")
-        
-        return config
-    
-    async def _run_server(self):
-        """Run the server asynchronously."""
-        try:
-            # Start the server
-            await self.server.start()
-            
-            self.logger.info("Outlook MCP Service started successfully")
-            
-            # Wait for stop signal
-            while True:
-                # Check for stop event (non-blocking)
-                result = win32event.WaitForSingleObject(self.hWaitStop, 1000)  # 1 second timeout
-                
-                if result == win32event.WAIT_OBJECT_0:
-                    # Stop event signaled
-                    break
-                
-                # Check server health
-                if not self.server.is_healthy():
-                    self.logger.warning("Server health check failed")
-                    # Could implement restart logic here
-                
-                await asyncio.sleep(1)
-            
-        except Exception as e:
-            self.logger.error(f"Server error: {e}", exc_info=True)
-            raise
-        finally:
-            # Cleanup
-            if self.server:
-                await self.server.stop()
-            
-            self.logger.info("Outlook MCP Service stopped")
+    return MappingProxyType({
+        win32service.SERVICE_STOPPED: "Stopped",
+        win32service.SERVICE_START_PENDING: "Start Pending",
+        win32service.SERVICE_STOP_PENDING: "Stop Pending",
+        win32service.SERVICE_RUNNING: "Running",
+        win32service.SERVICE_CONTINUE_PENDING: "Continue Pending",
+        win32service.SERVICE_PAUSE_PENDING: "Pause Pending",
+        win32service.SERVICE_PAUSED: "Paused"
+    })
 
 
 def install_service():
     """Install the Windows service."""
     try:
+        import win32serviceutil
+        from outlook_mcp_service import OutlookMCPService
+        
         # Install the service
         win32serviceutil.InstallService(
             OutlookMCPService._svc_reg_class_,
@@ -185,6 +72,14 @@ def install_service():
         print("   You can now start it with: python scripts/install_service.py start")
         print("   Or use Windows Services manager")
         
+        # Generate the Outlook COM wrappers now rather than on first connect
+        try:
+            from outlook_mcp_server.adapters.outlook_adapter import ensure_outlook_typelib
+            if ensure_outlook_typelib():
+                print("   Outlook type library wrappers generated")
+        except ImportError:
+            pass  # The server connects late-bound until the wrappers exist
+        
     except Exception as e:
         print(f"❌ Failed to install service: {e}")
         return False
@@ -195,6 +90,9 @@ def install_service():
 def start_service():
     """Start the Windows service."""
     try:
+        import win32serviceutil
+        from outlook_mcp_service import OutlookMCPService
+        
         win32serviceutil.StartService(OutlookMCPService._svc_name_)
         print(f"✅ Service '{OutlookMCPService._svc_display_name_}' started successfully")
         
@@ -208,6 +106,9 @@ def start_service():
 def stop_service():
     """Stop the Windows service."""
     try:
+        import win32serviceutil
+        from outlook_mcp_service import OutlookMCPService
+        
         win32serviceutil.StopService(OutlookMCPService._svc_name_)
         print(f"✅ Service '{OutlookMCPService._svc_display_name_}' stopped successfully")
         
@@ -221,6 +122,9 @@ def stop_service():
 def remove_service():
     """Remove the Windows service."""
     try:
+        import win32serviceutil
+        from outlook_mcp_service import OutlookMCPService
+        
         # Stop service first if running
         try:
             stop_service()
@@ -241,18 +145,11 @@ def remove_service():
 def service_status():
     """Check service status."""
     try:
-        status = win32serviceutil.QueryServiceStatus(OutlookMCPService._svc_name_)
-        status_map = {
-            win32service.SERVICE_STOPPED: "Stopped",
-            win32service.SERVICE_START_PENDING: "Start Pending",
-            win32service.SERVICE_STOP_PENDING: "Stop Pending",
-            win32service.SERVICE_RUNNING: "Running",
-            win32service.SERVICE_CONTINUE_PENDING: "Continue Pending",
-            win32service.SERVICE_PAUSE_PENDING: "Pause Pending",
-            win32service.SERVICE_PAUSED: "Paused"
-        }
+        import win32serviceutil
+        from outlook_mcp_service import OutlookMCPService
         
-        status_text = status_map.get(status[1], f"Unknown ({status[1]})")
+        status = win32serviceutil.QueryServiceStatus(OutlookMCPService._svc_name_)
+        status_text = _service_status_names().get(status[1], f"Unknown ({status[1]})")
         print(f"Service Status: {status_text}")
         
         return status[1]
@@ -262,24 +159,33 @@ def service_status():
         return None
 
 
+def print_usage():
+    """Print the command usage banner."""
+    print("Outlook MCP Server - Windows Service Manager")
+    print("=" * 50)
+    print("Usage:")
+    print("  python scripts/install_service.py install    Install the service")
+    print("  python scripts/install_service.py start      Start the service")
+    print("  python scripts/install_service.py stop       Stop the service")
+    print("  python scripts/install_service.py restart    Restart the service")
+    print("  python scripts/install_service.py remove     Remove the service")
+    print("  python scripts/install_service.py status     Check service status")
+    print("")
+    print("Note: Administrator privileges are required for install/remove operations")
+
+
 def main():
     """Main entry point for service management."""
     if len(sys.argv) < 2:
-        print("Outlook MCP Server - Windows Service Manager")
-        print("=" * 50)
-        print("Usage:")
-        print("  python scripts/install_service.py install    Install the service")
-        print("  python scripts/install_service.py start      Start the service")
-        print("  python scripts/install_service.py stop       Stop the service")
-        print("  python scripts/install_service.py restart    Restart the service")
-        print("  python scripts/install_service.py remove     Remove the service")
-        print("  python scripts/install_service.py status     Check service status")
-        print("")
-        print("Note: Administrator privileges are required for install/remove operations")
+        print_usage()
         return
     
     command = sys.argv[1].lower()
     
+    if command in ['-h', '--help', 'help']:
+        print_usage()
+        return
+    
     # Check if running as administrator for install/remove operations
     if command in ['install', 'remove']:
         try:
@@ -315,6 +221,9 @@ def main():
 if __name__ == '__main__':
     if len(sys.argv) == 1:
         # If no arguments, try to run as service
+        import servicemanager
+        from outlook_mcp_service import OutlookMCPService
+        
         servicemanager.Initialize()
         servicemanager.PrepareToHostSingle(OutlookMCPService)
         servicemanager.StartServiceCtrlDispatcher()
@@ -0,0 +1,180 @@
+"""
+Windows service class for Outlook MCP Server.
+
+The service control manager hosts OutlookMCPService from this module.
+scripts/install_service.py imports it only for commands that talk to the
+service, so its usage banner does not need pywin32.
+
+Requirements:
+    - pywin32 package
+    - Windows operating system
+"""
+
+import sys
+import json
+import socket
+import asyncio
+from pathlib import Path
+
+import win32serviceutil
+import win32service
+import win32event
+import servicemanager
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+SERVICE_NAME = "OutlookMCPServer"
+SERVICE_DISPLAY_NAME = "Outlook MCP Server"
+SERVICE_DESCRIPTION = "Model Context Protocol server for Microsoft Outlook integration"
+
+# Configuration files checked in order; the first one found is used
+SERVICE_CONFIG_LOCATIONS = (
+    Path(r"C:\ProgramData\OutlookMCPServer\config.json"),
+    project_root / "config" / "production.json",
+    project_root / "outlook_mcp_server_config.json"
+)
+
+# Seconds between server health checks while the service is running
+HEALTH_CHECK_INTERVAL = 30
+
+
+class OutlookMCPService(win32serviceutil.ServiceFramework):
+    """Windows service wrapper for Outlook MCP Server."""
+    
+    _svc_name_ = SERVICE_NAME
+    _svc_display_name_ = SERVICE_DISPLAY_NAME
+    _svc_description_ = SERVICE_DESCRIPTION
+    
+    def __init__(self, args):
+        win32serviceutil.ServiceFramework.__init__(self, args)
+        # Created up front: SvcStop and _run_server use it from different threads
+        self.hWaitStop = win32event.CreateEvent(None, 0, 0, None)
+        self.server = None
+        self.logger = None
+    
+    def SvcStop(self):
+        """Stop the service."""
+        self.ReportServiceStatus(win32service.SERVICE_STOP_PENDING)
+        win32event.SetEvent(self.hWaitStop)
+        
+        # The stop event wakes _run_server, which stops the server on its own
+        # event loop so cleanup finishes before the service reports stopped
+        if self.logger:
+            self.logger.info("Service stop requested")
+    
+    def SvcDoRun(self):
+        """Run the service."""
+        # Only affects sockets opened while the service is running
+        socket.setdefaulttimeout(60)
+        
+        try:
+            from outlook_mcp_server.server import OutlookMCPServer
+            from outlook_mcp_server.logging.logger import get_logger
+            
+            # Initialize logging
+            self.logger = get_logger(__name__)
+            
+            # Log service start
+            servicemanager.LogMsg(
+                servicemanager.EVENTLOG_INFORMATION_TYPE,
+                servicemanager.PYS_SERVICE_STARTED,
+                (self._svc_name_, '')
+            )
+            
+            self.logger.info("Outlook MCP Service starting")
+            
+            # Load configuration
+            config = self._load_service_config()
+            
+            # Create and start server
+            self.server = OutlookMCPServer(config)
+            
+            # Run the server in async context
+            asyncio.run(self._run_server())
+            
+        except Exception as e:
+            error_msg = f"Service failed to start: {e}"
+            
+            if self.logger:
+                self.logger.error(error_msg, exc_info=True)
+            
+            servicemanager.LogErrorMsg(error_msg)
+            
+            # Report service stopped
+            self.ReportServiceStatus(win32service.SERVICE_STOPPED)
+    
+    def _load_service_config(self):
+        """Load configuration for service mode."""
+        from outlook_mcp_server.server import create_server_config
+        
+        # Default service configuration
+        config = create_server_config(
+            log_level="INFO",
+            log_dir=r"C:\ProgramData\OutlookMCPServer\logs",
+            enable_console_output=False,  # No console in service mode
+            max_concurrent_requests=20
+        )
+        
+        # Try to load config file from standard locations. Opening each
+        # candidate directly avoids a separate exists() stat per location.
+        for config_path in SERVICE_CONFIG_LOCATIONS:
+            try:
+                with open(config_path, 'rb') as f:
+                    file_config = json.load(f)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"Failed to load config from {config_path}: {e}")
+                continue
+            
+            config.update(file_config)
+            
+            if self.logger:
+                self.logger.info(f"Loaded service config from: {config_path}")
+            break
+        
+        return config
+    
+    async def _run_server(self):
+        """Run the server asynchronously."""
+        try:
+            # Start the server
+            await self.server.start()
+            
+            self.logger.info("Outlook MCP Service started successfully")
+            
+            # Wait for the stop event on a worker thread so the event loop
+            # stays idle; wake up only for the periodic health check
+            loop = asyncio.get_running_loop()
+            stop_signal = loop.run_in_executor(
+                None, win32event.WaitForSingleObject, self.hWaitStop, win32event.INFINITE
+            )
+            
+            while True:
+                done, _ = await asyncio.wait({stop_signal}, timeout=HEALTH_CHECK_INTERVAL)
+                
+                if done:
+                    # Stop event signaled
+                    break
+                
+                # Check server health
+                if not self.server.is_healthy():
+                    self.logger.warning("Server health check failed")
+                    # Could implement restart logic here
+            
+        except Exception as e:
+            self.logger.error(f"Server error: {e}", exc_info=True)
+            raise
+        finally:
+            # Release the stop-event waiter if we are exiting for another reason
+            win32event.SetEvent(self.hWaitStop)
+            
+            # Cleanup
+            if self.server:
+                await self.server.stop()
+            
+            self.logger.info("Outlook MCP Service stopped")
@@ -1,20 +1,48 @@
 """Outlook MCP Server package."""
 
-from .server import OutlookMCPServer, create_server_config
-from .mcp_stdio_server import MCPStdioServer, run_stdio_server
-from .error_handler import ErrorHandler, ErrorContext, ErrorSeverity
-from .logging import Logger, get_logger, configure_logging
+import importlib
+
+from ._version import __version__
 
-__version__ = "1.0.0"
 __all__ = [
     "OutlookMCPServer",
-    "MCPStdioServer", 
+    "MCPStdioServer",
     "create_server_config",
     "run_stdio_server",
-    "ErrorHandler", 
-    "ErrorContext", 
+    "ErrorHandler",
+    "ErrorContext",
     "ErrorSeverity",
-    "Logger", 
-    "get_logger", 
+    "Logger",
+    "get_logger",
     "configure_logging"
-]
\ No newline at end of file
+]
+
+# Public names are imported on first access so that lightweight entry points
+# (CLI help, create-config) do not pull in the server and Outlook COM stack.
+_LAZY_EXPORTS = {
+    "OutlookMCPServer": ".server",
+    "create_server_config": ".server",
+    "MCPStdioServer": ".mcp_stdio_server",
+    "run_stdio_server": ".mcp_stdio_server",
+    "ErrorHandler": ".error_handler",
+    "ErrorContext": ".error_handler",
+    "ErrorSeverity": ".error_handler",
+    "Logger": ".logging",
+    "get_logger": ".logging",
+    "configure_logging": ".logging",
+}
+
+
+def __getattr__(name):
+    """Resolve public names lazily (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
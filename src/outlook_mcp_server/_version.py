@@ -0,0 +1,3 @@
+"""Package version, kept dependency-free so it can be read without importing the server."""
+
+__version__ = "1.0.0"
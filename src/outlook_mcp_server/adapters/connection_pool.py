@@ -3,65 +3,106 @@
 import logging
 import threading
 import time
-from typing import Optional, List, Dict, Any
-from queue import Queue, Empty, Full
+import weakref
+from typing import Optional, List, Dict, Any, Deque
+from collections import deque
+from queue import SimpleQueue, Empty
 from contextlib import contextmanager
 import win32com.client
 import pythoncom
 from ..models.exceptions import OutlookConnectionError
+from .outlook_adapter import ensure_outlook_typelib
 
 
 logger = logging.getLogger(__name__)
 
 
 class OutlookConnection:
-    """Represents a single Outlook COM connection."""
+    """
+    Represents a single Outlook COM connection.
     
-    def __init__(self, connection_id: str):
-        """Initialize Outlook connection."""
+    Not thread-safe by design: the pool hands a connection to at most one
+    thread between borrow and return, so no per-connection lock is needed.
+    """
+    
+    # Whether the last GetActiveObject probe found a running Outlook. Once it
+    # fails, later connections go straight to Dispatch, which also attaches
+    # to a running instance because Outlook is single-instance.
+    _active_probe_result: Optional[bool] = None
+    
+    def __init__(self, connection_id: str, health_check_skip_window: float = 30.0):
+        """
+        Initialize Outlook connection.
+        
+        Args:
+            connection_id: Identifier used in log messages
+            health_check_skip_window: Seconds after a successful check during
+                which is_healthy() trusts the connection without calling Outlook
+        """
         self.connection_id = connection_id
+        self.health_check_skip_window = health_check_skip_window
         self.outlook_app: Optional[Any] = None
         self.namespace: Optional[Any] = None
         self.created_at = time.time()
         self.last_used = time.time()
         self.use_count = 0
         self.is_active = False
-        self._lock = threading.Lock()
+        # Position in the owning pool's slot list while the pool tracks it
+        self.slot_index: Optional[int] = None
+        # Result of the last check against Outlook; is_healthy() trusts it
+        # within the skip window instead of calling Outlook on every borrow
+        self.healthy = False
+        # Exception raised while the connection was last borrowed, if any
+        self.last_error: Optional[BaseException] = None
+        self._last_verified = 0.0
+        # Thread that initialized COM for this connection in connect()
+        self._owner_thread_id: Optional[int] = None
     
     def connect(self) -> bool:
         """Establish COM connection to Outlook."""
-        with self._lock:
-            try:
-                logger.debug(f"Creating Outlook connection {self.connection_id}")
-                
-                # Initialize COM for this thread
-                pythoncom.CoInitialize()
-                
-                # Try to get existing Outlook instance first
+        try:
+            logger.debug("Creating Outlook connection %s", self.connection_id)
+            
+            # Initialize COM for this thread
+            pythoncom.CoInitialize()
+            self._owner_thread_id = threading.get_ident()
+            
+            # Generate the Outlook wrappers so the objects below are early-bound
+            ensure_outlook_typelib()
+            
+            # Try to get existing Outlook instance first, unless an earlier
+            # probe already found none
+            self.outlook_app = None
+            if OutlookConnection._active_probe_result is not False:
                 try:
                     self.outlook_app = win32com.client.GetActiveObject("Outlook.Application")
-                    logger.debug(f"Connected to existing Outlook instance: {self.connection_id}")
+                    OutlookConnection._active_probe_result = True
+                    logger.debug("Connected to existing Outlook instance: %s", self.connection_id)
                 except:
-                    # If no existing instance, create new one
-                    self.outlook_app = win32com.client.Dispatch("Outlook.Application")
-                    logger.debug(f"Created new Outlook instance: {self.connection_id}")
-                
-                # Get the MAPI namespace
-                self.namespace = self.outlook_app.GetNamespace("MAPI")
-                
-                # Test the connection
-                self._test_connection()
-                
-                self.is_active = True
-                self.last_used = time.time()
-                
-                logger.info(f"Outlook connection {self.connection_id} established successfully")
-                return True
-                
-            except Exception as e:
-                logger.error(f"Failed to create Outlook connection {self.connection_id}: {str(e)}")
-                self._cleanup()
-                raise OutlookConnectionError(f"Failed to create connection: {str(e)}")
+                    OutlookConnection._active_probe_result = False
+            
+            if self.outlook_app is None:
+                # If no existing instance, create new one
+                self.outlook_app = win32com.client.Dispatch("Outlook.Application")
+                logger.debug("Created new Outlook instance: %s", self.connection_id)
+            
+            # Get the MAPI namespace
+            self.namespace = self.outlook_app.GetNamespace("MAPI")
+            
+            # Test the connection; this counts as its first health check
+            self._test_connection()
+            
+            self.is_active = True
+            self.healthy = True
+            self.last_used = self._last_verified = time.time()
+            
+            logger.info(f"Outlook connection {self.connection_id} established successfully")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to create Outlook connection {self.connection_id}: {str(e)}")
+            self._cleanup()
+            raise OutlookConnectionError(f"Failed to create connection: {str(e)}")
     
     def _test_connection(self) -> None:
         """Test the connection by accessing basic functionality."""
@@ -74,45 +115,64 @@ class OutlookConnection:
             if not inbox:
                 raise OutlookConnectionError("Cannot access default inbox folder")
             
-            logger.debug(f"Connection test successful for {self.connection_id}")
+            logger.debug("Connection test successful for %s", self.connection_id)
             
         except Exception as e:
             logger.error(f"Connection test failed for {self.connection_id}: {str(e)}")
             raise OutlookConnectionError(f"Connection test failed: {str(e)}")
     
     def is_healthy(self) -> bool:
-        """Check if connection is healthy and usable."""
-        with self._lock:
-            if not self.is_active or not self.outlook_app or not self.namespace:
-                return False
-            
-            try:
-                # Test connection by accessing a basic property
-                self.namespace.GetDefaultFolder(6)  # Try to access inbox
-                return True
-            except:
-                self.is_active = False
-                return False
+        """
+        Check if connection is healthy and usable.
+        
+        The COM round-trip to Outlook is skipped if the connection was
+        verified within the last health_check_skip_window seconds.
+        """
+        if (self.healthy and
+                time.time() - self._last_verified < self.health_check_skip_window):
+            return True
+        
+        return self.check_health()
+    
+    def check_health(self) -> bool:
+        """Verify the connection with Outlook and record the result in ``healthy``."""
+        if not self.is_active or not self.outlook_app or not self.namespace:
+            self.healthy = False
+            return False
+        
+        try:
+            # Test connection by accessing a basic property
+            self.namespace.GetDefaultFolder(6)  # Try to access inbox
+            self._last_verified = time.time()
+            self.healthy = True
+        except:
+            self.is_active = False
+            self.healthy = False
+        
+        return self.healthy
     
     def mark_used(self) -> None:
         """Mark connection as recently used."""
-        with self._lock:
-            self.last_used = time.time()
-            self.use_count += 1
+        self.last_used = time.time()
+        self.use_count += 1
+    
+    def mark_verified(self) -> None:
+        """Record that the connection just worked, restarting the health check skip window."""
+        if self.healthy:
+            self._last_verified = time.time()
     
-    def get_age(self) -> float:
-        """Get connection age in seconds."""
-        return time.time() - self.created_at
+    def get_age(self, now: Optional[float] = None) -> float:
+        """Get connection age in seconds, optionally relative to a cached time.time()."""
+        return (time.time() if now is None else now) - self.created_at
     
-    def get_idle_time(self) -> float:
-        """Get time since last use in seconds."""
-        return time.time() - self.last_used
+    def get_idle_time(self, now: Optional[float] = None) -> float:
+        """Get time since last use in seconds, optionally relative to a cached time.time()."""
+        return (time.time() if now is None else now) - self.last_used
     
     def disconnect(self) -> None:
         """Disconnect and cleanup resources."""
-        with self._lock:
-            logger.debug(f"Disconnecting Outlook connection {self.connection_id}")
-            self._cleanup()
+        logger.debug("Disconnecting Outlook connection %s", self.connection_id)
+        self._cleanup()
     
     def _cleanup(self) -> None:
         """Clean up COM objects and connection state."""
@@ -120,12 +180,16 @@ class OutlookConnection:
             self.namespace = None
             self.outlook_app = None
             self.is_active = False
+            self.healthy = False
             
-            # Uninitialize COM
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass  # Ignore errors during COM cleanup
+            # Uninitialize COM only on the thread that initialized it; other
+            # threads must not touch that thread's COM state
+            if self._owner_thread_id == threading.get_ident():
+                try:
+                    pythoncom.CoUninitialize()
+                except:
+                    pass  # Ignore errors during COM cleanup
+            self._owner_thread_id = None
                 
         except Exception as e:
             logger.error(f"Error during connection cleanup {self.connection_id}: {str(e)}")
@@ -139,7 +203,8 @@ class OutlookConnectionPool:
                  max_connections: int = 5,
                  max_idle_time: int = 300,  # 5 minutes
                  max_connection_age: int = 3600,  # 1 hour
-                 health_check_interval: int = 60):  # 1 minute
+                 health_check_interval: int = 60,  # 1 minute
+                 health_check_skip_window: int = 30):
         """
         Initialize connection pool.
         
@@ -148,21 +213,36 @@ class OutlookConnectionPool:
             max_connections: Maximum number of connections allowed
             max_idle_time: Maximum idle time before connection is closed (seconds)
             max_connection_age: Maximum age of connection before renewal (seconds)
-            health_check_interval: Interval for health checks (seconds)
+            health_check_interval: Interval between maintenance runs (seconds)
+            health_check_skip_window: How long a successful connection check
+                is trusted before the next one calls Outlook again (seconds)
         """
         self.min_connections = min_connections
         self.max_connections = max_connections
         self.max_idle_time = max_idle_time
         self.max_connection_age = max_connection_age
         self.health_check_interval = health_check_interval
+        self.health_check_skip_window = health_check_skip_window
         
-        self._pool: Queue[OutlookConnection] = Queue(maxsize=max_connections)
-        self._all_connections: Dict[str, OutlookConnection] = {}
+        # Idle connections, used as a LIFO stack so the most recently used
+        # (warmest) connection is handed out first
+        self._pool: Deque[OutlookConnection] = deque()
+        # Every tracked connection, idle or borrowed, by slot index
+        self._slots: List[Optional[OutlookConnection]] = [None] * max_connections
+        self._active_count = 0
+        # Borrowers blocked on an exhausted pool, served in FIFO order
+        self._waiters: Deque[SimpleQueue] = deque()
+        # Weak reference to the connection each thread used last. COM objects
+        # are apartment-bound, so a thread gets its own connection back when
+        # it is idle rather than one created on another thread.
+        self._tls = threading.local()
         self._connection_counter = 0
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
         self._shutdown = False
         
-        # Statistics
+        # Statistics, guarded by their own lock so that reading them never
+        # waits on the pool lock
+        self._stats_lock = threading.Lock()
         self._stats = {
             "connections_created": 0,
             "connections_destroyed": 0,
@@ -172,6 +252,9 @@ class OutlookConnectionPool:
             "pool_misses": 0
         }
         
+        # Set to wake the maintenance thread early, e.g. on shutdown
+        self._maintenance_event = threading.Event()
+        
         # Start background maintenance thread
         self._maintenance_thread = threading.Thread(
             target=self._maintenance_worker,
@@ -183,17 +266,31 @@ class OutlookConnectionPool:
         logger.info(f"Outlook connection pool initialized: min={min_connections}, max={max_connections}")
     
     def initialize(self) -> None:
-        """Initialize the pool with minimum connections."""
-        with self._lock:
-            logger.info("Initializing connection pool with minimum connections")
+        """
+        Fill the pool up to min_connections.
+        
+        The connections are created on the calling thread, because COM objects
+        belong to the apartment that created them; the pool lock is not held
+        while connecting.
+        """
+        logger.info("Initializing connection pool with minimum connections")
+        
+        for _ in range(self.min_connections):
+            with self._lock:
+                if self._shutdown or self._active_count >= self.max_connections:
+                    break
+                connection = self._reserve_connection()
             
-            for _ in range(self.min_connections):
-                try:
-                    connection = self._create_connection()
-                    self._pool.put_nowait(connection)
-                except Exception as e:
-                    logger.error(f"Failed to create initial connection: {str(e)}")
-                    # Continue trying to create other connections
+            try:
+                self._open_connection(connection)
+            except Exception as e:
+                logger.error(f"Failed to create initial connection: {str(e)}")
+                # Continue trying to create other connections
+                continue
+            
+            with self._lock:
+                if not self._wake_waiter(connection):
+                    self._pool.append(connection)
     
     @contextmanager
     def get_connection(self, timeout: float = 10.0):
@@ -213,106 +310,241 @@ class OutlookConnectionPool:
         try:
             connection = self._borrow_connection(timeout)
             yield connection
+        except Exception as e:
+            if connection:
+                connection.last_error = e
+            raise
         finally:
             if connection:
                 self._return_connection(connection)
     
     def _borrow_connection(self, timeout: float) -> OutlookConnection:
-        """Borrow a connection from the pool."""
-        with self._lock:
-            if self._shutdown:
-                raise OutlookConnectionError("Connection pool is shutdown")
+        """
+        Borrow a connection from the pool.
+        
+        The pool lock is only held to pop an idle connection or reserve a
+        slot for a new one; connecting to Outlook happens outside it.
+        When the pool is exhausted the caller joins a FIFO queue of waiters
+        and a returning connection is handed to it directly.
+        """
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            last_used = getattr(self._tls, "connection", None)
+            preferred = last_used() if last_used is not None else None
             
-            start_time = time.time()
+            # Prefer the connection this thread used last, otherwise take
+            # the most recently returned one
+            with self._lock:
+                if self._shutdown:
+                    raise OutlookConnectionError("Connection pool is shutdown")
+                if preferred is not None and preferred in self._pool:
+                    self._pool.remove(preferred)
+                    connection = preferred
+                else:
+                    connection = self._pool.pop() if self._pool else None
             
-            while time.time() - start_time < timeout:
-                try:
-                    # Try to get connection from pool
-                    connection = self._pool.get_nowait()
-                    
-                    # Check if connection is healthy
-                    if connection.is_healthy():
-                        connection.mark_used()
-                        self._stats["connections_borrowed"] += 1
-                        self._stats["pool_hits"] += 1
-                        logger.debug(f"Borrowed healthy connection {connection.connection_id}")
-                        return connection
-                    else:
-                        # Connection is unhealthy, destroy it
-                        logger.warning(f"Removing unhealthy connection {connection.connection_id}")
-                        self._destroy_connection(connection)
-                        
-                except Empty:
-                    # Pool is empty, try to create new connection
-                    if len(self._all_connections) < self.max_connections:
-                        try:
-                            connection = self._create_connection()
-                            connection.mark_used()
-                            self._stats["connections_borrowed"] += 1
-                            self._stats["pool_misses"] += 1
-                            logger.debug(f"Created new connection {connection.connection_id}")
-                            return connection
-                        except Exception as e:
-                            logger.error(f"Failed to create new connection: {str(e)}")
+            if connection is not None:
+                # Only calls Outlook if the connection has not worked recently
+                if connection.is_healthy():
+                    self._tls.connection = weakref.ref(connection)
+                    connection.mark_used()
+                    self._count("connections_borrowed", "pool_hits")
+                    logger.debug("Borrowed healthy connection %s", connection.connection_id)
+                    return connection
                 
-                # Wait a bit before retrying
-                time.sleep(0.1)
+                # Connection is unhealthy, destroy it and retry immediately
+                logger.warning(f"Removing unhealthy connection {connection.connection_id}")
+                self._destroy_connection(connection)
+                continue
+            
+            remaining = deadline - time.monotonic()
+            waiter = None
+            
+            # Pool is empty, claim a slot for a new connection or queue up for one
+            with self._lock:
+                if self._active_count < self.max_connections:
+                    connection = self._reserve_connection()
+                elif remaining > 0:
+                    waiter = SimpleQueue()
+                    self._waiters.append(waiter)
             
-            raise OutlookConnectionError(f"No connection available within {timeout} seconds")
+            if connection is not None:
+                try:
+                    self._open_connection(connection)
+                    self._tls.connection = weakref.ref(connection)
+                    connection.mark_used()
+                    self._count("connections_borrowed", "pool_misses")
+                    logger.debug("Created new connection %s", connection.connection_id)
+                    return connection
+                except Exception as e:
+                    logger.error(f"Failed to create new connection: {str(e)}")
+            
+            if remaining <= 0:
+                break
+            
+            if waiter is None:
+                # Creating a connection failed; back off before trying again
+                time.sleep(min(0.1, remaining))
+                continue
+            
+            connection = self._wait_for_handoff(waiter, remaining)
+            if connection is None:
+                # Woken because capacity was freed, or timed out
+                continue
+            
+            self._tls.connection = weakref.ref(connection)
+            connection.mark_used()
+            self._count("connections_borrowed", "pool_hits")
+            logger.debug("Received connection %s by hand-off", connection.connection_id)
+            return connection
+        
+        raise OutlookConnectionError(f"No connection available within {timeout} seconds")
     
-    def _return_connection(self, connection: OutlookConnection) -> None:
-        """Return a connection to the pool."""
+    def _wait_for_handoff(self, waiter: SimpleQueue, timeout: float) -> Optional[OutlookConnection]:
+        """
+        Block until a returning connection is handed to this waiter.
+        
+        Returns None on timeout, or when the waiter is woken without a
+        connection because a slot was freed or the pool is shutting down.
+        """
+        try:
+            return waiter.get(timeout=timeout)
+        except Empty:
+            pass
+        
         with self._lock:
-            if self._shutdown:
-                self._destroy_connection(connection)
-                return
+            try:
+                self._waiters.remove(waiter)
+                return None
+            except ValueError:
+                pass
+        
+        # A returner dequeued this waiter before the timeout was noticed;
+        # its item is already in the queue
+        return waiter.get_nowait()
+    
+    def _wake_waiter(self, item: Optional[OutlookConnection]) -> bool:
+        """Hand an item to the longest-waiting borrower. Caller holds the lock."""
+        if not self._waiters:
+            return False
+        self._waiters.popleft().put(item)
+        return True
+    
+    def _return_connection(self, connection: OutlookConnection) -> None:
+        """Return a connection to the pool, or hand it to a waiting borrower."""
+        if self._shutdown:
+            self._destroy_connection(connection)
+            return
+        
+        # A successful use proves the connection works. After a failure it
+        # may be the connection itself that broke, so check with Outlook.
+        if connection.last_error is not None:
+            connection.last_error = None
+            connection.check_health()
+        else:
+            connection.mark_verified()
+        
+        # Check if connection is still healthy and not too old
+        if (connection.healthy and 
+            connection.get_age() < self.max_connection_age):
             
-            # Check if connection is still healthy and not too old
-            if (connection.is_healthy() and 
-                connection.get_age() < self.max_connection_age):
-                
-                try:
-                    self._pool.put_nowait(connection)
-                    self._stats["connections_returned"] += 1
-                    logger.debug(f"Returned connection {connection.connection_id} to pool")
-                except Full:
-                    # Pool is full, destroy the connection
-                    logger.debug(f"Pool full, destroying connection {connection.connection_id}")
-                    self._destroy_connection(connection)
+            with self._lock:
+                # Waiters are served first, bypassing the idle stack
+                handed_off = self._wake_waiter(connection)
+                returned = handed_off or len(self._pool) < self.max_connections
+                if not handed_off and returned:
+                    self._pool.append(connection)
+                if returned:
+                    self._count("connections_returned")
+            
+            if handed_off:
+                logger.debug("Handed connection %s to a waiting borrower", connection.connection_id)
+            elif returned:
+                logger.debug("Returned connection %s to pool", connection.connection_id)
             else:
-                # Connection is unhealthy or too old
-                logger.debug(f"Destroying aged/unhealthy connection {connection.connection_id}")
+                # Pool is full, destroy the connection
+                logger.debug("Pool full, destroying connection %s", connection.connection_id)
                 self._destroy_connection(connection)
+        else:
+            # Connection is unhealthy or too old
+            logger.debug("Destroying aged/unhealthy connection %s", connection.connection_id)
+            self._destroy_connection(connection)
     
-    def _create_connection(self) -> OutlookConnection:
-        """Create a new Outlook connection."""
-        with self._lock:
-            self._connection_counter += 1
-            connection_id = f"outlook-conn-{self._connection_counter}"
-            
-            connection = OutlookConnection(connection_id)
+    def _reserve_connection(self) -> OutlookConnection:
+        """
+        Claim a free slot for a new, not yet connected connection.
+        
+        Caller holds the lock. Reserving counts against max_connections, so
+        the slow connect() can then run without the lock.
+        """
+        try:
+            slot_index = self._slots.index(None)
+        except ValueError:
+            raise OutlookConnectionError("Connection pool is full")
+        
+        self._connection_counter += 1
+        connection_id = f"outlook-conn-{self._connection_counter}"
+        
+        connection = OutlookConnection(connection_id, self.health_check_skip_window)
+        connection.slot_index = slot_index
+        self._slots[slot_index] = connection
+        self._active_count += 1
+        return connection
+    
+    def _open_connection(self, connection: OutlookConnection) -> OutlookConnection:
+        """Connect a reserved connection; call without holding the lock."""
+        try:
             connection.connect()
-            
-            self._all_connections[connection_id] = connection
-            self._stats["connections_created"] += 1
-            
-            logger.debug(f"Created new Outlook connection: {connection_id}")
-            return connection
+        except Exception:
+            with self._lock:
+                self._release_slot(connection)
+            raise
+        
+        with self._lock:
+            # Shutdown forgets every slot, including ones still connecting
+            shut_down = connection.slot_index is None
+        if shut_down:
+            self._disconnect_connection(connection)
+            raise OutlookConnectionError("Connection pool is shutdown")
+        
+        self._count("connections_created")
+        logger.debug("Created new Outlook connection: %s", connection.connection_id)
+        return connection
     
     def _destroy_connection(self, connection: OutlookConnection) -> None:
         """Destroy a connection and remove from tracking."""
         with self._lock:
-            try:
-                connection.disconnect()
-                
-                if connection.connection_id in self._all_connections:
-                    del self._all_connections[connection.connection_id]
-                
-                self._stats["connections_destroyed"] += 1
-                logger.debug(f"Destroyed connection: {connection.connection_id}")
-                
-            except Exception as e:
-                logger.error(f"Error destroying connection {connection.connection_id}: {str(e)}")
+            self._forget_connection(connection)
+        
+        # COM teardown can block; never do it while holding the pool lock
+        self._disconnect_connection(connection)
+    
+    def _forget_connection(self, connection: OutlookConnection) -> None:
+        """Stop tracking a connection. Caller holds the lock."""
+        if self._release_slot(connection):
+            self._count("connections_destroyed")
+    
+    def _release_slot(self, connection: OutlookConnection) -> bool:
+        """Free a connection's slot if it still holds one. Caller holds the lock."""
+        slot_index = connection.slot_index
+        if slot_index is None or self._slots[slot_index] is not connection:
+            return False
+        
+        self._slots[slot_index] = None
+        connection.slot_index = None
+        self._active_count -= 1
+        # Let a waiting borrower use the freed slot
+        self._wake_waiter(None)
+        return True
+    
+    def _disconnect_connection(self, connection: OutlookConnection) -> None:
+        """Release a connection's COM objects. Call without holding the lock."""
+        try:
+            connection.disconnect()
+            logger.debug("Destroyed connection: %s", connection.connection_id)
+        except Exception as e:
+            logger.error(f"Error destroying connection {connection.connection_id}: {str(e)}")
     
     def _maintenance_worker(self) -> None:
         """Background worker for pool maintenance."""
@@ -320,7 +552,8 @@ class OutlookConnectionPool:
         
         while not self._shutdown:
             try:
-                time.sleep(self.health_check_interval)
+                if self._maintenance_event.wait(timeout=self.health_check_interval):
+                    self._maintenance_event.clear()
                 
                 if self._shutdown:
                     break
@@ -331,68 +564,69 @@ class OutlookConnectionPool:
                 logger.error(f"Error in pool maintenance: {str(e)}")
     
     def _perform_maintenance(self) -> None:
-        """Perform pool maintenance tasks."""
+        """
+        Perform pool maintenance tasks.
+        
+        Maintenance never calls Outlook: COM objects belong to the apartment
+        that created them, so connections are health-checked by is_healthy()
+        on the borrowing thread instead, and new ones are only created by
+        initialize() and by borrowers.
+        """
         with self._lock:
             logger.debug("Performing connection pool maintenance")
             
-            # Remove idle and aged connections
-            connections_to_remove = []
+            # Read the limits and the clock once for this cycle
+            max_idle_time = self.max_idle_time
+            max_connection_age = self.max_connection_age
+            now = time.time()
             
-            for connection in list(self._all_connections.values()):
-                if (connection.get_idle_time() > self.max_idle_time or
-                    connection.get_age() > self.max_connection_age or
-                    not connection.is_healthy()):
-                    
-                    connections_to_remove.append(connection)
+            # Remove idle and aged connections. Borrowed connections are left
+            # alone; they are checked when they are returned.
+            connections_to_remove = [
+                connection for connection in self._pool
+                if (connection.get_idle_time(now) > max_idle_time or
+                    connection.get_age(now) > max_connection_age)
+            ]
             
-            # Remove connections from pool queue
-            temp_connections = []
-            while not self._pool.empty():
-                try:
-                    conn = self._pool.get_nowait()
-                    if conn not in connections_to_remove:
-                        temp_connections.append(conn)
-                except Empty:
-                    break
+            # Remove them from the idle stack in one pass, keeping the order of the rest
+            if connections_to_remove:
+                victim_ids = {conn.connection_id for conn in connections_to_remove}
+                self._pool = deque(
+                    conn for conn in self._pool if conn.connection_id not in victim_ids
+                )
             
-            # Put back good connections
-            for conn in temp_connections:
-                try:
-                    self._pool.put_nowait(conn)
-                except Full:
-                    break
-            
-            # Destroy bad connections
+            # Stop tracking bad connections; they are disconnected below
             for connection in connections_to_remove:
-                self._destroy_connection(connection)
-            
-            # Ensure minimum connections
-            current_pool_size = self._pool.qsize()
-            if current_pool_size < self.min_connections:
-                needed = self.min_connections - current_pool_size
-                for _ in range(needed):
-                    if len(self._all_connections) < self.max_connections:
-                        try:
-                            connection = self._create_connection()
-                            self._pool.put_nowait(connection)
-                        except Exception as e:
-                            logger.error(f"Failed to create maintenance connection: {str(e)}")
-                            break
-            
-            logger.debug(f"Pool maintenance complete. Active connections: {len(self._all_connections)}, "
-                        f"Pool size: {self._pool.qsize()}")
+                self._forget_connection(connection)
+        
+        for connection in connections_to_remove:
+            self._disconnect_connection(connection)
+        
+        logger.debug("Pool maintenance complete. Active connections: %d, Pool size: %d",
+                     self._active_count, len(self._pool))
+    
+    def _count(self, *names: str) -> None:
+        """Increment the named statistics counters."""
+        with self._stats_lock:
+            for name in names:
+                self._stats[name] += 1
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get connection pool statistics."""
-        with self._lock:
+        """
+        Get connection pool statistics.
+        
+        Does not take the pool lock; the pool and connection counts are a
+        point-in-time read that may be momentarily out of date.
+        """
+        with self._stats_lock:
             stats = self._stats.copy()
-            stats.update({
-                "active_connections": len(self._all_connections),
-                "pool_size": self._pool.qsize(),
-                "max_connections": self.max_connections,
-                "min_connections": self.min_connections
-            })
-            return stats
+        stats.update({
+            "active_connections": self._active_count,
+            "pool_size": len(self._pool),
+            "max_connections": self.max_connections,
+            "min_connections": self.min_connections
+        })
+        return stats
     
     def shutdown(self) -> None:
         """Shutdown the connection pool."""
@@ -401,21 +635,22 @@ class OutlookConnectionPool:
         with self._lock:
             self._shutdown = True
             
-            # Destroy all connections
-            while not self._pool.empty():
-                try:
-                    connection = self._pool.get_nowait()
-                    self._destroy_connection(connection)
-                except Empty:
-                    break
-            
-            # Destroy any remaining tracked connections
-            for connection in list(self._all_connections.values()):
-                self._destroy_connection(connection)
+            # Wake blocked borrowers so they see the shutdown
+            while self._wake_waiter(None):
+                pass
             
-            self._all_connections.clear()
+            # Stop tracking all connections, idle or borrowed
+            self._pool.clear()
+            connections = [conn for conn in self._slots if conn is not None]
+            for connection in connections:
+                self._forget_connection(connection)
+        
+        # Destroy them outside the lock
+        for connection in connections:
+            self._disconnect_connection(connection)
         
-        # Wait for maintenance thread to finish
+        # Wake the maintenance thread and wait for it to finish
+        self._maintenance_event.set()
         if self._maintenance_thread.is_alive():
             self._maintenance_thread.join(timeout=5.0)
         
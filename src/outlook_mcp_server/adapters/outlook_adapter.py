@@ -1,18 +1,25 @@
 """Outlook COM adapter for interfacing with Microsoft Outlook."""
 
+import asyncio
+import heapq
 import logging
 import re
+import threading
 import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime
-from typing import Optional, List, Any, Tuple
-from unittest.mock import Mock
+from functools import lru_cache, partial, wraps
+from typing import Optional, List, Any, Iterator, Tuple
 import win32com.client
 import pythoncom
 from ..models.exceptions import (
     OutlookConnectionError,
     FolderNotFoundError,
     EmailNotFoundError,
-    PermissionError,
+    PermissionError as OutlookPermissionError,
     ValidationError
 )
 from ..models.folder_data import FolderData
@@ -21,6 +28,198 @@ from ..models.email_data import EmailData
 
 logger = logging.getLogger(__name__)
 
+# Outlook object library (msoutl.olb) as (CLSID, LCID, major, minor version)
+_OUTLOOK_TYPELIB = ("{00062FFF-0000-0000-C000-000000000046}", 0, 9, 0)
+
+# English names of the default folders by olDefaultFolders constant
+_DEFAULT_FOLDER_NAMES = {
+    6: "Inbox",          # olFolderInbox
+    5: "Sent Items",     # olFolderSentMail
+    4: "Outbox",         # olFolderOutbox
+    3: "Deleted Items",  # olFolderDeletedItems
+    16: "Drafts",        # olFolderDrafts
+    23: "Junk Email",    # olFolderJunk
+    9: "Calendar",       # olFolderCalendar
+    10: "Contacts",      # olFolderContacts
+    13: "Journal",       # olFolderJournal
+    12: "Tasks",         # olFolderTasks
+}
+
+# olDefaultFolders constants for default folder names, including localized names
+_DEFAULT_FOLDERS = {
+    # English names
+    **{name: folder_id for folder_id, name in _DEFAULT_FOLDER_NAMES.items()},
+    # Chinese Traditional names
+    "收件匣": 6,      # olFolderInbox
+    "收件夾": 6,      # olFolderInbox (alternative)
+    "寄件匣": 4,      # olFolderOutbox
+    "寄件備份": 5,    # olFolderSentMail
+    "已傳送的郵件": 5, # olFolderSentMail (alternative)
+    "刪除的郵件": 3,  # olFolderDeletedItems
+    "已刪除的郵件": 3, # olFolderDeletedItems (alternative)
+    "已刪除的項目": 3, # olFolderDeletedItems (alternative)
+    "草稿": 16,      # olFolderDrafts
+    "垃圾郵件": 23,   # olFolderJunk
+    # Chinese Simplified names
+    "收件箱": 6,      # olFolderInbox
+    "发件箱": 4,      # olFolderOutbox
+    "已发送邮件": 5,  # olFolderSentMail
+    "已删除邮件": 3,  # olFolderDeletedItems
+    "草稿箱": 16,     # olFolderDrafts
+    "垃圾邮件": 23,   # olFolderJunk
+    # Japanese names
+    "受信トレイ": 6,   # olFolderInbox
+    "送信トレイ": 4,   # olFolderOutbox
+    "送信済みアイテム": 5, # olFolderSentMail
+    "削除済みアイテム": 3, # olFolderDeletedItems
+    "下書き": 16,     # olFolderDrafts
+    "迷惑メール": 23,  # olFolderJunk
+}
+
+# Main default folders as (olDefaultFolders constant, display name)
+_MAIN_FOLDERS = (
+    (6, "Inbox"),           # olFolderInbox
+    (5, "Sent Items"),      # olFolderSentMail
+    (16, "Drafts"),         # olFolderDrafts
+    (3, "Deleted Items"),   # olFolderDeletedItems
+    (4, "Outbox"),          # olFolderOutbox
+    (9, "Calendar"),        # olFolderCalendar
+    (10, "Contacts"),       # olFolderContacts
+    (13, "Journal"),        # olFolderJournal
+    (12, "Tasks"),          # olFolderTasks
+)
+
+# Outlook search syntax prefixes; queries without one search subject and body
+_QUERY_OPS_RE = re.compile(r'\b(subject|body|from|to|received):', re.IGNORECASE)
+
+# Keywords that classify COM error messages
+_ACCESS_ERR_RE = re.compile(r'access|permission|denied|unauthorized', re.IGNORECASE)
+_SEND_ACCESS_ERR_RE = re.compile(r'access|permission|denied|unauthorized|policy', re.IGNORECASE)
+_SEND_INVALID_ERR_RE = re.compile(r'invalid|malformed|resolve|recipient', re.IGNORECASE)
+
+# DASL properties searched for each kind of parsed search term
+_DASL_SUBJECT = '"urn:schemas:httpmail:subject"'
+_DASL_BODY = '"urn:schemas:httpmail:textdescription"'
+_DASL_SENDER = ('"urn:schemas:httpmail:fromname"', '"urn:schemas:httpmail:fromemail"')
+_DASL_FIELDS = {
+    'subject': (_DASL_SUBJECT,),
+    'body': (_DASL_BODY,),
+    'from': _DASL_SENDER,
+    'general': (_DASL_SUBJECT,) + _DASL_SENDER,
+}
+
+# Mail folders searched, with their subfolders, by a global AdvancedSearch
+_SEARCH_SCOPE_FOLDERS = (6, 5, 16, 3, 4)
+
+# Seconds to wait for AdvancedSearch before using the results found so far
+_ADVANCED_SEARCH_TIMEOUT = 5.0
+
+# Emails kept by get_email_by_id(), and seconds before one is fetched again
+# so read state and flags changed in Outlook are picked up
+_EMAIL_CACHE_SIZE = 512
+_EMAIL_CACHE_TTL = 60.0
+
+# Seconds the mail folder list searched folder by folder is reused
+_MAIL_FOLDERS_TTL = 60.0
+
+# Seconds a folder name that was not found is reported missing without
+# walking the folder tree again, so folders created in Outlook show up
+_FOLDER_MISS_TTL = 30.0
+
+# str.translate table that deletes ASCII control characters
+_CONTROL_CHARS = dict.fromkeys(range(32))
+
+# One '@' with a non-empty local part, and a domain of two or more
+# non-empty dot-separated labels
+_EMAIL_FORMAT_RE = re.compile(r'[^@]+@[^@.]+(?:\.[^@.]+)+')
+
+# Characters dropped when a display name is turned into an address local
+# part; \w is exactly str.isalnum() plus '_', so Unicode names are kept
+_NON_ADDRESS_CHARS_RE = re.compile(r'[^\w.-]')
+
+# Patterns used to strip tags from and normalize email bodies
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_INTER_TAG_SPACE_RE = re.compile(r'>\s+<')
+
+# Importance names by OlImportance value, and the values send_email() accepts
+_IMPORTANCE_NAMES = {0: "Low", 1: "Normal", 2: "High"}
+_IMPORTANCE_VALUES = {"low": 0, "normal": 1, "high": 2}
+
+# OlBodyFormat values by the body_format names send_email() accepts
+_BODY_FORMATS = {"html": 2, "text": 1, "rtf": 3}
+
+# Folders searched by name when the full folder list is unavailable
+_FALLBACK_SEARCH_FOLDERS = ("Inbox", "Sent Items", "Drafts")
+
+# Folder type names by DefaultItemType (OlItemType)
+_ITEM_TYPE_MAPPING = {
+    0: "Mail",      # olMailItem
+    1: "Contact",   # olContactItem
+    2: "Task",      # olTaskItem
+    3: "Journal",   # olJournalItem
+    4: "Note",      # olNoteItem
+    5: "Post"       # olPostItem
+}
+
+
+@lru_cache(maxsize=1)
+def ensure_outlook_typelib() -> bool:
+    """
+    Make sure the makepy wrappers for the Outlook object library exist.
+    
+    With the wrappers in the win32com gencache, Dispatch() and
+    GetActiveObject() return early-bound objects that invoke members by
+    DISPID instead of resolving every name with GetIDsOfNames first.
+    
+    Returns:
+        bool: True if early binding is available, False if late binding is used
+    """
+    try:
+        win32com.client.gencache.EnsureModule(*_OUTLOOK_TYPELIB)
+        return True
+    except Exception as e:
+        logger.debug("Outlook type library unavailable, using late binding: %s", e)
+        return False
+
+
+def _received_time_key(email: EmailData) -> datetime:
+    """Sort key ordering emails by received time, undated emails last."""
+    return email.received_time or datetime.min
+
+
+def _is_access_error(error: Exception) -> bool:
+    """Return True if an exception message points to denied access."""
+    return _ACCESS_ERR_RE.search(str(error)) is not None
+
+
+class _AdvancedSearchEvents:
+    """Outlook Application event sink that records finished AdvancedSearch tags."""
+    
+    def __init__(self):
+        self.completed_tags = set()
+    
+    def OnAdvancedSearchComplete(self, search):
+        self.completed_tags.add(search.Tag)
+
+
+def _on_com_thread(method):
+    """
+    Run an adapter method on the adapter's COM thread.
+    
+    Outlook objects created by connect() belong to that thread, so calls made
+    from any other thread are handed to it and wait for the result. Adapters
+    without a COM thread (e.g. wrapping a pooled connection) run the method
+    directly.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        executor = self._com_executor
+        if executor is None or threading.get_ident() == self._com_thread_id:
+            return method(self, *args, **kwargs)
+        return executor.submit(method, self, *args, **kwargs).result()
+    return wrapper
+
 
 class OutlookAdapter:
     """Low-level interface with Microsoft Outlook COM objects."""
@@ -30,6 +229,62 @@ class OutlookAdapter:
         self._outlook_app: Optional[Any] = None
         self._namespace: Optional[Any] = None
         self._connected = False
+        # Inbox handle reused by is_connected() as a cheap liveness probe
+        self._probe_folder: Optional[Any] = None
+        # Default folder handles keyed by olDefaultFolders constant
+        self._default_folder_cache: dict = {}
+        # Folder handles found by get_folder_by_name(), and when it last
+        # failed to find each missing name
+        self._folder_cache: dict = {}
+        self._folder_miss_cache: dict = {}
+        # (folder, name) of the mail folders searched by _search_all_folders()
+        # and when they were listed
+        self._mail_folders: Optional[List[Tuple[Any, str]]] = None
+        self._mail_folders_time = 0.0
+        # (fetch time, EmailData) keyed by EntryID, least recently used first
+        self._email_cache: OrderedDict = OrderedDict()
+        # Per-thread record of whether COM has been initialized by this adapter
+        self._tls = threading.local()
+        # Single COM thread that owns the Outlook objects, started by connect()
+        self._com_executor: Optional[ThreadPoolExecutor] = None
+        self._com_thread_id: Optional[int] = None
+        
+    def _ensure_com_on_thread(self) -> None:
+        """Initialize COM once for the calling thread."""
+        if not getattr(self._tls, 'initialized', False):
+            pythoncom.CoInitialize()
+            self._tls.initialized = True
+    
+    def _init_com_thread(self) -> None:
+        """Initializer for the COM thread."""
+        self._com_thread_id = threading.get_ident()
+        self._ensure_com_on_thread()
+    
+    def _get_call_namespace(self, purpose: str) -> Any:
+        """
+        Return the MAPI namespace to use for the current call.
+        
+        Adapters with a COM thread already run there and reuse the namespace
+        created by connect(). Adapters without one (e.g. wrapping a pooled
+        connection) may be called from any thread, so they initialize COM for
+        it and create a thread-local Outlook connection.
+        
+        Args:
+            purpose: Name of the calling method, used in log messages
+        """
+        if self._com_executor is not None:
+            return self._namespace
+        
+        self._ensure_com_on_thread()
+        try:
+            outlook_app = win32com.client.Dispatch("Outlook.Application")
+            namespace = outlook_app.GetNamespace("MAPI")
+            logger.debug("Created thread-local Outlook connection for %s", purpose)
+            return namespace
+        except Exception as e:
+            logger.error(f"Failed to create thread-local Outlook connection: {e}")
+            # Fall back to original namespace
+            return self._namespace
         
     def connect(self) -> bool:
         """
@@ -41,11 +296,21 @@ class OutlookAdapter:
         Raises:
             OutlookConnectionError: If connection cannot be established
         """
+        # Start the COM thread so the Outlook objects are created on it
+        self._get_com_executor()
+        return self._connect()
+    
+    @_on_com_thread
+    def _connect(self) -> bool:
+        """Establish the connection on the COM thread."""
         try:
             logger.info("Attempting to connect to Microsoft Outlook")
             
             # Initialize COM
-            pythoncom.CoInitialize()
+            self._ensure_com_on_thread()
+            
+            # Generate the Outlook wrappers so the objects below are early-bound
+            ensure_outlook_typelib()
             
             # Try to get existing Outlook instance first
             try:
@@ -59,8 +324,10 @@ class OutlookAdapter:
             # Get the MAPI namespace
             self._namespace = self._outlook_app.GetNamespace("MAPI")
             
-            # Test the connection by trying to access folders
-            self._test_connection()
+            # Test the connection by trying to access folders, keeping the
+            # inbox as the liveness probe for is_connected()
+            self._probe_folder = self._test_connection()
+            self._default_folder_cache[6] = self._probe_folder
             
             self._connected = True
             logger.info("Successfully connected to Outlook")
@@ -71,10 +338,13 @@ class OutlookAdapter:
             self._cleanup_connection()
             raise OutlookConnectionError(f"Failed to connect to Outlook: {str(e)}")
     
-    def _test_connection(self) -> None:
+    def _test_connection(self) -> Any:
         """
         Test the Outlook connection by accessing basic functionality.
         
+        Returns:
+            COM object: The default inbox folder
+            
         Raises:
             OutlookConnectionError: If connection test fails
         """
@@ -89,6 +359,7 @@ class OutlookAdapter:
                 raise OutlookConnectionError("Cannot access default inbox folder")
                 
             logger.debug("Connection test successful - can access inbox")
+            return inbox
             
         except Exception as e:
             logger.error(f"Connection test failed: {str(e)}")
@@ -98,27 +369,80 @@ class OutlookAdapter:
         """Disconnect from Outlook and cleanup resources."""
         try:
             logger.info("Disconnecting from Outlook")
-            self._cleanup_connection()
+            executor = self._com_executor
+            if executor is not None:
+                # Release the Outlook objects on the thread that owns them
+                self._cleanup_on_com_thread()
+                self._com_executor = None
+                self._com_thread_id = None
+                executor.shutdown(wait=False)
+            else:
+                self._cleanup_connection()
             logger.info("Successfully disconnected from Outlook")
         except Exception as e:
             logger.error(f"Error during disconnect: {str(e)}")
     
+    @_on_com_thread
+    def _cleanup_on_com_thread(self) -> None:
+        """Clean up the connection from the COM thread."""
+        self._cleanup_connection()
+    
+    def _get_com_executor(self) -> ThreadPoolExecutor:
+        """Return the single-thread executor that owns this adapter's COM objects."""
+        if self._com_executor is None:
+            self._com_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="outlook-com",
+                initializer=self._init_com_thread
+            )
+        return self._com_executor
+    
+    async def _run_on_com_thread(self, func, *args, **kwargs) -> Any:
+        """Run a blocking adapter call on the COM thread without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_com_executor(), partial(func, *args, **kwargs))
+    
+    async def ais_connected(self) -> bool:
+        """Asynchronous variant of is_connected()."""
+        return await self._run_on_com_thread(self.is_connected)
+    
+    async def aget_folders(self) -> List[FolderData]:
+        """Asynchronous variant of get_folders()."""
+        return await self._run_on_com_thread(self.get_folders)
+    
+    async def aget_email_by_id(self, email_id: str) -> EmailData:
+        """Asynchronous variant of get_email_by_id()."""
+        return await self._run_on_com_thread(self.get_email_by_id, email_id)
+    
+    async def asearch_emails(self, query: str, folder_identifier: str = None, limit: int = 50) -> List[EmailData]:
+        """Asynchronous variant of search_emails()."""
+        return await self._run_on_com_thread(
+            self.search_emails, query, folder_identifier=folder_identifier, limit=limit
+        )
+    
     def _cleanup_connection(self) -> None:
         """Clean up COM objects and connection state."""
         try:
             self._namespace = None
             self._outlook_app = None
             self._connected = False
-            
-            # Uninitialize COM
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass  # Ignore errors during COM cleanup
+            self._probe_folder = None
+            self._default_folder_cache.clear()
+            self.invalidate_folder_cache()
+            self.clear_email_cache()
+            
+            # Uninitialize COM if this thread initialized it
+            if getattr(self._tls, 'initialized', False):
+                self._tls.initialized = False
+                try:
+                    pythoncom.CoUninitialize()
+                except:
+                    pass  # Ignore errors during COM cleanup
                 
         except Exception as e:
             logger.error(f"Error during connection cleanup: {str(e)}")
     
+    @_on_com_thread
     def is_connected(self) -> bool:
         """
         Check if adapter is connected to Outlook.
@@ -126,7 +450,7 @@ class OutlookAdapter:
         Returns:
             bool: True if connected, False otherwise
         """
-        logger.debug(f"Checking connection: _connected={self._connected}, _outlook_app={self._outlook_app is not None}, _namespace={self._namespace is not None}")
+        logger.debug("Checking connection: _connected=%s, _outlook_app=%s, _namespace=%s", self._connected, self._outlook_app is not None, self._namespace is not None)
         
         if not self._connected or not self._outlook_app or not self._namespace:
             logger.debug("Basic connection check failed")
@@ -134,7 +458,7 @@ class OutlookAdapter:
             
         try:
             # Initialize COM for this thread if needed
-            pythoncom.CoInitialize()
+            self._ensure_com_on_thread()
             
             # Test connection by accessing a basic property
             # Try multiple approaches to verify connection
@@ -144,6 +468,12 @@ class OutlookAdapter:
                 logger.debug("Namespace is None")
                 return False
             
+            # Once the inbox has been resolved, reading a property on the
+            # cached handle is enough to prove the connection is alive
+            if self._probe_folder is not None:
+                self._probe_folder.EntryID
+                return True
+            
             # Try to get the default folder (inbox)
             logger.debug("Attempting to access inbox folder")
             inbox = self._namespace.GetDefaultFolder(6)  # olFolderInbox = 6
@@ -151,6 +481,7 @@ class OutlookAdapter:
             # If we can access the inbox, connection is good
             if inbox is not None:
                 logger.debug("Successfully accessed inbox folder")
+                self._probe_folder = inbox
                 return True
             else:
                 logger.debug("Inbox folder is None")
@@ -165,14 +496,37 @@ class OutlookAdapter:
                 return self._connected
             else:
                 # Log the specific error for debugging
-                logger.debug(f"Connection test failed with exception: {str(e)}")
+                logger.debug("Connection test failed with exception: %s", e)
                 self._connected = False
+                self._probe_folder = None
                 return False
-        finally:
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass  # Ignore cleanup errors
+    
+    def _get_default_folder(self, folder_id: int) -> Any:
+        """
+        Get a default folder, reusing the handle from earlier lookups.
+        
+        Args:
+            folder_id: olDefaultFolders constant of the folder
+            
+        Returns:
+            COM object: The folder object (may be None)
+        """
+        folder = self._default_folder_cache.get(folder_id)
+        if folder is None:
+            folder = self._namespace.GetDefaultFolder(folder_id)
+            if folder:
+                self._default_folder_cache[folder_id] = folder
+        return folder
+    
+    def invalidate_folder_cache(self) -> None:
+        """Forget folders resolved by name, e.g. after folders are created or renamed."""
+        self._folder_cache.clear()
+        self._folder_miss_cache.clear()
+        self._mail_folders = None
+    
+    def clear_email_cache(self) -> None:
+        """Forget emails cached by get_email_by_id(), e.g. after they are moved or deleted."""
+        self._email_cache.clear()
     
     def get_namespace(self) -> Any:
         """
@@ -189,6 +543,7 @@ class OutlookAdapter:
         
         return self._namespace
     
+    @_on_com_thread
     def get_folder_by_id(self, folder_id: str) -> Any:
         """
         Get folder by ID from Outlook.
@@ -211,31 +566,19 @@ class OutlookAdapter:
             raise FolderNotFoundError(folder_id or "")
         
         try:
-            logger.debug(f"Looking for folder by ID: {folder_id}")
+            logger.debug("Looking for folder by ID: %s", folder_id)
             
             # Use existing namespace to avoid COM threading issues
             # Get main folders and check their IDs
-            main_folders = [
-                (6, "Inbox"),           # olFolderInbox
-                (5, "Sent Items"),      # olFolderSentMail  
-                (16, "Drafts"),         # olFolderDrafts
-                (3, "Deleted Items"),   # olFolderDeletedItems
-                (4, "Outbox"),          # olFolderOutbox
-                (9, "Calendar"),        # olFolderCalendar
-                (10, "Contacts"),       # olFolderContacts
-                (13, "Journal"),        # olFolderJournal
-                (12, "Tasks")           # olFolderTasks
-            ]
-            
-            for folder_id_num, folder_name in main_folders:
+            for folder_id_num, folder_name in _MAIN_FOLDERS:
                 try:
                     folder = self._namespace.GetDefaultFolder(folder_id_num)
-                    if folder and hasattr(folder, 'EntryID'):
+                    if folder:
                         if folder.EntryID == folder_id:
-                            logger.debug(f"Found folder by ID: {folder_id} -> {folder_name}")
+                            logger.debug("Found folder by ID: %s -> %s", folder_id, folder_name)
                             return folder
                 except Exception as e:
-                    logger.debug(f"Error checking folder {folder_name}: {e}")
+                    logger.debug("Error checking folder %s: %s", folder_name, e)
                     continue
                 
             
@@ -249,8 +592,8 @@ class OutlookAdapter:
             raise
         except Exception as e:
             logger.error(f"Error accessing folder by ID '{folder_id}': {str(e)}")
-            if "access" in str(e).lower() or "permission" in str(e).lower():
-                raise PermissionError(folder_id, f"Access denied to folder ID '{folder_id}'")
+            if _is_access_error(e):
+                raise OutlookPermissionError(folder_id, f"Access denied to folder ID '{folder_id}'")
             raise FolderNotFoundError(folder_id)
     
     def _search_folder_by_id_recursive(self, folder: Any, target_id: str) -> Optional[Any]:
@@ -266,22 +609,22 @@ class OutlookAdapter:
         """
         try:
             # Check if current folder matches
-            if hasattr(folder, 'EntryID') and folder.EntryID == target_id:
+            if getattr(folder, 'EntryID', None) == target_id:
                 return folder
             
             # Search in subfolders
-            if hasattr(folder, 'Folders'):
-                for subfolder in folder.Folders:
-                    result = self._search_folder_by_id_recursive(subfolder, target_id)
-                    if result:
-                        return result
+            for subfolder in getattr(folder, 'Folders', ()):
+                result = self._search_folder_by_id_recursive(subfolder, target_id)
+                if result:
+                    return result
             
             return None
             
         except Exception as e:
-            logger.debug(f"Error searching in folder by ID: {str(e)}")
+            logger.debug("Error searching in folder by ID: %s", e)
             return None
     
+    @_on_com_thread
     def get_folder_by_name_or_id(self, identifier: str) -> Any:
         """
         Get folder by name or ID from Outlook.
@@ -305,20 +648,25 @@ class OutlookAdapter:
         
         # First try as folder ID (if it looks like an EntryID - long hex string)
         if len(identifier) > 50 and all(c in '0123456789ABCDEFabcdef' for c in identifier):
-            logger.debug(f"Identifier looks like folder ID, trying ID lookup: {identifier[:20]}...")
+            logger.debug("Identifier looks like folder ID, trying ID lookup: %s...", identifier[:20])
             try:
                 return self.get_folder_by_id(identifier)
             except FolderNotFoundError:
-                logger.debug(f"Not found as ID, trying as name: {identifier[:20]}...")
+                logger.debug("Not found as ID, trying as name: %s...", identifier[:20])
         
         # Try as folder name
-        logger.debug(f"Trying as folder name: {identifier}")
+        logger.debug("Trying as folder name: %s", identifier)
         return self.get_folder_by_name(identifier)
     
+    @_on_com_thread
     def get_folder_by_name(self, name: str) -> Any:
         """
         Get folder by name from Outlook.
         
+        Found folders are cached per name until invalidate_folder_cache() is
+        called or the adapter disconnects; names that were not found are
+        reported missing again for _FOLDER_MISS_TTL seconds.
+        
         Args:
             name: Name of the folder to retrieve
             
@@ -336,120 +684,99 @@ class OutlookAdapter:
         if not name or not isinstance(name, str):
             raise FolderNotFoundError(name or "")
         
+        folder = self._folder_cache.get(name)
+        if folder is not None:
+            return folder
+        missed_at = self._folder_miss_cache.get(name)
+        if missed_at is not None:
+            if time.monotonic() - missed_at < _FOLDER_MISS_TTL:
+                raise FolderNotFoundError(name)
+            del self._folder_miss_cache[name]
+        
         try:
-            logger.debug(f"Looking for folder: {name}")
+            logger.debug("Looking for folder: %s", name)
             
             # Try to get folder by name
-            # First check default folders with localized names
-            default_folders = {
-                # English names
-                "Inbox": 6,      # olFolderInbox
-                "Outbox": 4,     # olFolderOutbox
-                "Sent Items": 5, # olFolderSentMail
-                "Deleted Items": 3, # olFolderDeletedItems
-                "Drafts": 16,    # olFolderDrafts
-                "Junk Email": 23, # olFolderJunk
-                # Chinese Traditional names
-                "收件匣": 6,      # olFolderInbox
-                "收件夾": 6,      # olFolderInbox (alternative)
-                "寄件匣": 4,      # olFolderOutbox
-                "寄件備份": 5,    # olFolderSentMail
-                "已傳送的郵件": 5, # olFolderSentMail (alternative)
-                "刪除的郵件": 3,  # olFolderDeletedItems
-                "已刪除的郵件": 3, # olFolderDeletedItems (alternative)
-                "草稿": 16,      # olFolderDrafts
-                "垃圾郵件": 23,   # olFolderJunk
-                # Chinese Simplified names
-                "收件箱": 6,      # olFolderInbox
-                "发件箱": 4,      # olFolderOutbox
-                "已发送邮件": 5,  # olFolderSentMail
-                "已删除邮件": 3,  # olFolderDeletedItems
-                "草稿箱": 16,     # olFolderDrafts
-                "垃圾邮件": 23,   # olFolderJunk
-                # Japanese names
-                "受信トレイ": 6,   # olFolderInbox
-                "送信トレイ": 4,   # olFolderOutbox
-                "送信済みアイテム": 5, # olFolderSentMail
-                "削除済みアイテム": 3, # olFolderDeletedItems
-                "下書き": 16,     # olFolderDrafts
-                "迷惑メール": 23,  # olFolderJunk
-            }
-            
-            # Try exact match first
-            if name in default_folders:
+            # First check default folders with localized names (exact match)
+            if name in _DEFAULT_FOLDERS:
                 try:
-                    folder = self._namespace.GetDefaultFolder(default_folders[name])
+                    folder = self._get_default_folder(_DEFAULT_FOLDERS[name])
                     if folder:
-                        logger.debug(f"Found default folder by exact match: {name}")
+                        logger.debug("Found default folder by exact match: %s", name)
+                        self._folder_cache[name] = folder
                         return folder
                 except Exception as e:
-                    logger.debug(f"Error accessing default folder {name}: {e}")
+                    logger.debug("Error accessing default folder %s: %s", name, e)
             
             # Try to get default folders and match by actual name
             try:
-                logger.debug(f"Trying to match folder name '{name}' with actual folder names")
+                logger.debug("Trying to match folder name '%s' with actual folder names", name)
                 for folder_id in [6, 5, 4, 3, 16, 23]:  # Common default folders
                     try:
-                        folder = self._namespace.GetDefaultFolder(folder_id)
-                        if folder and hasattr(folder, 'Name'):
+                        folder = self._get_default_folder(folder_id)
+                        if folder:
                             actual_name = folder.Name
-                            logger.debug(f"Checking folder ID {folder_id}: '{actual_name}' vs '{name}'")
+                            logger.debug("Checking folder ID %s: '%s' vs '%s'", folder_id, actual_name, name)
                             if actual_name == name:
-                                logger.debug(f"Found default folder by name match: {name} (ID: {folder_id})")
+                                logger.debug("Found default folder by name match: %s (ID: %s)", name, folder_id)
+                                self._folder_cache[name] = folder
                                 return folder
                     except Exception as e:
-                        logger.debug(f"Error checking folder ID {folder_id}: {e}")
+                        logger.debug("Error checking folder ID %s: %s", folder_id, e)
                         continue
             except Exception as e:
-                logger.debug(f"Error during folder name matching: {e}")
+                logger.debug("Error during folder name matching: %s", e)
             
             # If not a default folder, search through all folders
-            folders = self._namespace.Folders
-            for folder in folders:
-                if self._search_folder_recursive(folder, name):
-                    logger.debug(f"Found folder: {name}")
-                    return self._search_folder_recursive(folder, name)
+            result = self._search_folder_iterative(self._namespace.Folders, name)
+            if result:
+                logger.debug("Found folder: %s", name)
+                self._folder_cache[name] = result
+                return result
             
             logger.warning(f"Folder not found: {name}")
+            self._folder_miss_cache[name] = time.monotonic()
             raise FolderNotFoundError(name)
             
         except FolderNotFoundError:
             raise
         except Exception as e:
             logger.error(f"Error accessing folder '{name}': {str(e)}")
-            if "access" in str(e).lower() or "permission" in str(e).lower():
-                raise PermissionError(name, f"Access denied to folder '{name}'")
+            if _is_access_error(e):
+                raise OutlookPermissionError(name, f"Access denied to folder '{name}'")
             raise FolderNotFoundError(name)
     
-    def _search_folder_recursive(self, folder: Any, target_name: str) -> Optional[Any]:
+    def _search_folder_iterative(self, roots: Any, target_name: str) -> Optional[Any]:
         """
-        Recursively search for a folder by name.
+        Search folder trees for a folder by name.
+        
+        All trees are walked breadth-first with one explicit queue, so the
+        shallowest match in any store is found first; a folder that cannot
+        be read is skipped together with its subfolders.
         
         Args:
-            folder: The folder to search in
+            roots: The folders to search in, e.g. the namespace's stores
             target_name: Name of the target folder
             
         Returns:
             COM object or None: The found folder or None if not found
         """
-        try:
-            # Check if current folder matches
-            if hasattr(folder, 'Name') and folder.Name == target_name:
-                return folder
-            
-            # Search in subfolders
-            if hasattr(folder, 'Folders'):
-                for subfolder in folder.Folders:
-                    result = self._search_folder_recursive(subfolder, target_name)
-                    if result:
-                        return result
-            
-            return None
-            
-        except Exception as e:
-            logger.debug(f"Error searching in folder: {str(e)}")
-            return None
+        pending = deque(roots)
+        while pending:
+            current = pending.popleft()
+            try:
+                # Check if current folder matches
+                if current.Name == target_name:
+                    return current
+                
+                # Queue subfolders
+                pending.extend(current.Folders)
+            except Exception as e:
+                logger.debug("Error searching in folder: %s", e)
+        
+        return None
     
+    @_on_com_thread
     def get_folders(self) -> List[FolderData]:
         """
         Get all available Outlook folders.
@@ -457,6 +784,24 @@ class OutlookAdapter:
         Returns:
             List[FolderData]: List of all available folders
             
+        Raises:
+            OutlookConnectionError: If not connected to Outlook
+            PermissionError: If access to folders is denied
+        """
+        folders = list(self.iter_folders())
+        logger.debug("Retrieved %s folders", len(folders))
+        return folders
+    
+    def iter_folders(self) -> Iterator[FolderData]:
+        """
+        Yield the available Outlook folders one at a time.
+        
+        Each folder is read from Outlook only when the caller asks for it, so
+        callers that stop early skip the remaining folders.
+        
+        Yields:
+            FolderData: The next available folder
+            
         Raises:
             OutlookConnectionError: If not connected to Outlook
             PermissionError: If access to folders is denied
@@ -465,73 +810,52 @@ class OutlookAdapter:
             raise OutlookConnectionError("Not connected to Outlook")
         
         try:
-            # Initialize COM for this thread
-            pythoncom.CoInitialize()
-            
             logger.debug("Retrieving all Outlook folders")
             
-            # For HTTP requests, we need to create a new Outlook connection in this thread
-            # because COM objects cannot be shared across threads
-            try:
-                outlook_app = win32com.client.Dispatch("Outlook.Application")
-                namespace = outlook_app.GetNamespace("MAPI")
-                
-                # Test the connection
-                namespace.GetDefaultFolder(6)  # Try to access inbox
-                
-                logger.debug("Created thread-local Outlook connection")
-                
-            except Exception as e:
-                logger.error(f"Failed to create thread-local Outlook connection: {e}")
-                # Fall back to original namespace (might work in some cases)
-                namespace = self._namespace
-            
-            folders = []
-            
             # Get only the main default folders (faster approach)
             logger.debug("Getting main Outlook folders only (non-recursive)")
             
-            # Define the main folders we want to retrieve
-            main_folders = [
-                (6, "Inbox"),           # olFolderInbox
-                (5, "Sent Items"),      # olFolderSentMail  
-                (16, "Drafts"),         # olFolderDrafts
-                (3, "Deleted Items"),   # olFolderDeletedItems
-                (4, "Outbox"),          # olFolderOutbox
-                (9, "Calendar"),        # olFolderCalendar
-                (10, "Contacts"),       # olFolderContacts
-                (13, "Journal"),        # olFolderJournal
-                (12, "Tasks")           # olFolderTasks
-            ]
-            
-            for folder_id, folder_name in main_folders:
-                try:
-                    logger.debug(f"Retrieving folder: {folder_name} (ID: {folder_id})")
-                    folder = namespace.GetDefaultFolder(folder_id)
-                    
-                    if folder:
-                        folder_data = self._transform_folder_to_data_simple(folder, "")
-                        if folder_data:
-                            folders.append(folder_data)
-                            logger.debug(f"Successfully added folder: {folder_data.name}")
-                        
-                except Exception as e:
-                    logger.warning(f"Could not access {folder_name}: {str(e)}")
-                    continue
-            
-            logger.debug(f"Retrieved {len(folders)} folders")
-            return folders
+            # Retrieve the main folders
+            for folder_id, folder_name in _MAIN_FOLDERS:
+                folder_data = self._read_main_folder(folder_id, folder_name)
+                if folder_data:
+                    yield folder_data
             
         except Exception as e:
             logger.error(f"Error retrieving folders: {str(e)}")
-            if "access" in str(e).lower() or "permission" in str(e).lower():
-                raise PermissionError("", f"Access denied to folders: {str(e)}")
+            if _is_access_error(e):
+                raise OutlookPermissionError("", f"Access denied to folders: {str(e)}")
             raise OutlookConnectionError(f"Failed to retrieve folders: {str(e)}")
-        finally:
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass  # Ignore cleanup errors
+    
+    @_on_com_thread
+    def _read_main_folder(self, folder_id: int, folder_name: str) -> Optional[FolderData]:
+        """
+        Read one of the main default folders.
+        
+        Args:
+            folder_id: olDefaultFolders constant of the folder
+            folder_name: English name of the folder, for logging
+            
+        Returns:
+            FolderData object or None if the folder is not accessible
+        """
+        try:
+            # Initialize COM for this thread
+            self._ensure_com_on_thread()
+            
+            logger.debug("Retrieving folder: %s (ID: %s)", folder_name, folder_id)
+            folder = self._get_default_folder(folder_id)
+            
+            if folder:
+                folder_data = self._transform_folder_to_data_simple(folder, "")
+                if folder_data:
+                    logger.debug("Successfully added folder: %s", folder_data.name)
+                return folder_data
+                
+        except Exception as e:
+            logger.warning(f"Could not access {folder_name}: {str(e)}")
+        
+        return None
     
     def _transform_folder_to_data_simple(self, folder: Any, parent_path: str) -> Optional[FolderData]:
         """
@@ -554,14 +878,14 @@ class OutlookAdapter:
                 return None
                 
             # Clean the folder name of any problematic characters
-            clean_name = ''.join(c for c in folder_name if ord(c) >= 32)  # Remove control chars
+            clean_name = folder_name.translate(_CONTROL_CHARS)  # Remove control chars
             if not clean_name:
                 clean_name = "Unknown_Folder"
             
-            # Get item counts safely
+            # Get item counts safely; Items.Count is a single MAPI property,
+            # while len() on the collection enumerates every item
             try:
-                item_count = getattr(folder, 'Items', None)
-                item_count = len(item_count) if item_count else 0
+                item_count = folder.Items.Count
             except:
                 item_count = 0
                 
@@ -600,22 +924,27 @@ class OutlookAdapter:
             folder_list.append(folder_data)
             
             # Process subfolders
-            if hasattr(folder, 'Folders') and folder.Folders:
+            subfolders = getattr(folder, 'Folders', None)
+            if subfolders:
                 current_path = folder_data.full_path
-                for subfolder in folder.Folders:
+                for subfolder in subfolders:
                     try:
                         self._collect_folders_recursive(subfolder, folder_list, current_path)
                     except Exception as e:
-                        logger.debug(f"Error processing subfolder: {str(e)}")
+                        logger.debug("Error processing subfolder: %s", e)
                         continue
                         
         except Exception as e:
-            logger.debug(f"Error collecting folder data: {str(e)}")
+            logger.debug("Error collecting folder data: %s", e)
     
+    @_on_com_thread
     def _transform_folder_to_data(self, folder: Any, parent_path: str) -> FolderData:
         """
         Transform Outlook COM folder object to FolderData.
         
+        Runs on the COM thread because callers such as FolderService pass in
+        folder objects returned by get_folder_by_name(), which belong to it.
+        
         Args:
             folder: The COM folder object
             parent_path: Path of the parent folder
@@ -643,12 +972,12 @@ class OutlookAdapter:
             unread_count = 0
             
             try:
-                if hasattr(folder, 'Items'):
-                    item_count = folder.Items.Count
-                if hasattr(folder, 'UnReadItemCount'):
-                    unread_count = folder.UnReadItemCount
+                items = getattr(folder, 'Items', None)
+                if items is not None:
+                    item_count = items.Count
+                unread_count = getattr(folder, 'UnReadItemCount', 0)
             except Exception as e:
-                logger.debug(f"Error getting folder counts: {str(e)}")
+                logger.debug("Error getting folder counts: %s", e)
             
             # Determine folder type
             folder_type = self._get_folder_type(folder)
@@ -695,17 +1024,9 @@ class OutlookAdapter:
         """
         try:
             # Check if folder has DefaultItemType property
-            if hasattr(folder, 'DefaultItemType'):
-                item_type = folder.DefaultItemType
-                type_mapping = {
-                    0: "Mail",      # olMailItem
-                    1: "Contact",   # olContactItem
-                    2: "Task",      # olTaskItem
-                    3: "Journal",   # olJournalItem
-                    4: "Note",      # olNoteItem
-                    5: "Post"       # olPostItem
-                }
-                return type_mapping.get(item_type, "Mail")
+            item_type = getattr(folder, 'DefaultItemType', None)
+            if item_type is not None:
+                return _ITEM_TYPE_MAPPING.get(item_type, "Mail")
             
             # Fallback: check folder name for common patterns
             folder_name = getattr(folder, 'Name', '').lower()
@@ -721,9 +1042,10 @@ class OutlookAdapter:
                 return "Mail"
                 
         except Exception as e:
-            logger.debug(f"Error determining folder type: {str(e)}")
+            logger.debug("Error determining folder type: %s", e)
             return "Mail"
     
+    @_on_com_thread
     def validate_folder_access(self, folder_name: str) -> bool:
         """
         Validate that a folder exists and is accessible.
@@ -740,12 +1062,13 @@ class OutlookAdapter:
         try:
             folder = self.get_folder_by_name(folder_name)
             return folder is not None
-        except (FolderNotFoundError, PermissionError):
+        except (FolderNotFoundError, OutlookPermissionError):
             return False
         except Exception as e:
-            logger.debug(f"Error validating folder access: {str(e)}")
+            logger.debug("Error validating folder access: %s", e)
             return False
     
+    @_on_com_thread
     def get_default_folder_names(self) -> dict:
         """
         Get the actual names of default Outlook folders for debugging.
@@ -757,20 +1080,8 @@ class OutlookAdapter:
             return {}
         
         folder_names = {}
-        default_folder_ids = {
-            6: "Inbox",
-            5: "Sent Items", 
-            4: "Outbox",
-            3: "Deleted Items",
-            16: "Drafts",
-            23: "Junk Email",
-            9: "Calendar",
-            10: "Contacts",
-            13: "Journal",
-            12: "Tasks"
-        }
         
-        for folder_id, english_name in default_folder_ids.items():
+        for folder_id, english_name in _DEFAULT_FOLDER_NAMES.items():
             try:
                 folder = self._namespace.GetDefaultFolder(folder_id)
                 if folder and hasattr(folder, 'Name'):
@@ -780,7 +1091,7 @@ class OutlookAdapter:
                         'actual_name': actual_name,
                         'accessible': True
                     }
-                    logger.debug(f"Default folder {folder_id} ({english_name}): '{actual_name}'")
+                    logger.debug("Default folder %s (%s): '%s'", folder_id, english_name, actual_name)
                 else:
                     folder_names[folder_id] = {
                         'english_name': english_name,
@@ -794,10 +1105,11 @@ class OutlookAdapter:
                     'accessible': False,
                     'error': str(e)
                 }
-                logger.debug(f"Error accessing folder {folder_id} ({english_name}): {e}")
+                logger.debug("Error accessing folder %s (%s): %s", folder_id, english_name, e)
         
         return folder_names
     
+    @_on_com_thread
     def get_email_by_id(self, email_id: str) -> EmailData:
         """
         Get detailed email information by ID from Outlook.
@@ -813,60 +1125,49 @@ class OutlookAdapter:
             EmailNotFoundError: If email is not found or invalid ID
             PermissionError: If access to email is denied
         """
-        logger.info(f"🔧 DEBUG: *** GET_EMAIL_BY_ID CALLED *** ID: {email_id[:50]}...")
-        
         if not self.is_connected():
-            logger.info(f"🔧 DEBUG: Not connected to Outlook")
+            logger.debug("Not connected to Outlook")
             raise OutlookConnectionError("Not connected to Outlook")
         
         if not email_id or not isinstance(email_id, str):
-            logger.info(f"🔧 DEBUG: Invalid email_id: {email_id}")
+            logger.debug("Invalid email_id: %s", email_id)
             raise EmailNotFoundError(email_id or "")
         
         # Validate email ID format
         if not EmailData.validate_email_id(email_id):
-            logger.info(f"🔧 DEBUG: Email ID validation failed: {email_id}")
+            logger.debug("Email ID validation failed: %s", email_id)
             raise EmailNotFoundError(email_id)
         
+        cached = self._email_cache.get(email_id)
+        if cached is not None:
+            if time.monotonic() - cached[0] < _EMAIL_CACHE_TTL:
+                self._email_cache.move_to_end(email_id)
+                # Callers may modify the result (e.g. compress the body)
+                return replace(cached[1])
+            del self._email_cache[email_id]
+        
         try:
-            # Initialize COM for this thread
-            pythoncom.CoInitialize()
-            logger.info(f"🔧 DEBUG: COM initialized for get_email_by_id")
-            
-            logger.debug(f"Retrieving detailed email with ID: {email_id}")
-            logger.info(f"🔧 DEBUG: About to create thread-local Outlook connection")
+            logger.debug("Retrieving detailed email with ID: %s", email_id)
             
-            # Create thread-local Outlook connection (same as list_inbox_emails)
-            try:
-                logger.info(f"🔧 DEBUG: Creating thread-local Outlook connection")
-                outlook_app = win32com.client.Dispatch("Outlook.Application")
-                namespace = outlook_app.GetNamespace("MAPI")
-                
-                logger.debug("Created thread-local Outlook connection for get_email_by_id")
-                logger.info(f"🔧 DEBUG: Thread-local connection created successfully")
-                
-            except Exception as e:
-                logger.error(f"Failed to create thread-local Outlook connection: {e}")
-                logger.info(f"🔧 DEBUG: Falling back to original namespace")
-                # Fall back to original namespace
-                namespace = self._namespace
+            # Reuse the COM thread's namespace (same as list_inbox_emails)
+            namespace = self._get_call_namespace("get_email_by_id")
             
             # CRITICAL FIX: Instead of using GetItemFromID (which doesn't work properly),
             # find the email by searching through the inbox using the same method as list_inbox_emails
             logger.debug("Using list-based approach to find email (more reliable than GetItemFromID)")
-            logger.info(f"🔧 DEBUG: Starting email search process")
+            logger.debug("Starting email search process")
             
             email_item = None
             
             # Get all emails from inbox using the working method
             try:
-                logger.info(f"🔧 DEBUG: Getting namespace folders")
+                logger.debug("Getting namespace folders")
                 # Get inbox folder using the same reliable method as list_inbox_emails
                 try:
                     folders = namespace.Folders
-                    logger.info(f"🔧 DEBUG: Got {folders.Count} folders")
+                    logger.debug("Got %s folders", folders.Count)
                 except Exception as e:
-                    logger.info(f"🔧 DEBUG: Error accessing namespace.Folders: {e}")
+                    logger.debug("Error accessing namespace.Folders: %s", e)
                     raise e
                 inbox_folder = None
                 
@@ -874,99 +1175,100 @@ class OutlookAdapter:
                     try:
                         if hasattr(f, 'Items') and hasattr(f, 'Name'):
                             folder_name = f.Name
-                            logger.info(f"🔧 DEBUG: Checking folder: {folder_name}")
+                            logger.debug("Checking folder: %s", folder_name)
                             
                             # Check if this is the inbox folder directly
                             if ("收件" in folder_name or "inbox" in folder_name.lower() or "æ¶ä»¶" in folder_name):
                                 inbox_folder = f
-                                logger.debug(f"Found inbox folder: {folder_name}")
-                                logger.info(f"🔧 DEBUG: Found inbox folder: {folder_name}")
+                                logger.debug("Found inbox folder: %s", folder_name)
+                                logger.debug("Found inbox folder: %s", folder_name)
                                 break
                             
                             # Check if this is a user mailbox folder that contains subfolders
                             elif "@" in folder_name and not folder_name.startswith("公用"):
-                                logger.info(f"🔧 DEBUG: Checking subfolders in mailbox: {folder_name}")
+                                logger.debug("Checking subfolders in mailbox: %s", folder_name)
                                 try:
                                     subfolders = f.Folders
-                                    logger.info(f"🔧 DEBUG: Found {subfolders.Count} subfolders in {folder_name}")
+                                    logger.debug("Found %s subfolders in %s", subfolders.Count, folder_name)
                                     for sf in subfolders:
                                         try:
                                             if hasattr(sf, 'Items') and hasattr(sf, 'Name'):
                                                 subfolder_name = sf.Name
-                                                logger.info(f"🔧 DEBUG: Checking subfolder: {subfolder_name}")
+                                                logger.debug("Checking subfolder: %s", subfolder_name)
                                                 if ("收件" in subfolder_name or "inbox" in subfolder_name.lower() or "æ¶ä»¶" in subfolder_name):
                                                     inbox_folder = sf
-                                                    logger.debug(f"Found inbox subfolder: {subfolder_name}")
-                                                    logger.info(f"🔧 DEBUG: Found inbox subfolder: {subfolder_name}")
+                                                    logger.debug("Found inbox subfolder: %s", subfolder_name)
+                                                    logger.debug("Found inbox subfolder: %s", subfolder_name)
                                                     break
                                         except Exception as e:
-                                            logger.info(f"🔧 DEBUG: Error checking subfolder: {e}")
+                                            logger.debug("Error checking subfolder: %s", e)
                                             continue
                                     if inbox_folder:
                                         break
                                 except Exception as e:
-                                    logger.info(f"🔧 DEBUG: Error accessing subfolders of {folder_name}: {e}")
+                                    logger.debug("Error accessing subfolders of %s: %s", folder_name, e)
                                     continue
                     except Exception as e:
-                        logger.debug(f"Error checking folder: {e}")
-                        logger.info(f"🔧 DEBUG: Error checking folder: {e}")
+                        logger.debug("Error checking folder: %s", e)
+                        logger.debug("Error checking folder: %s", e)
                         continue
                 
                 if not inbox_folder:
-                    logger.info(f"🔧 DEBUG: No inbox folder found!")
+                    logger.debug("No inbox folder found!")
                     raise FolderNotFoundError("Inbox")
                 
-                logger.info(f"🔧 DEBUG: Inbox folder found, proceeding with search")
+                logger.debug("Inbox folder found, proceeding with search")
                 
                 # Try Method 1: Use Outlook's GetItemFromID (most reliable)
                 try:
-                    logger.debug(f"Trying GetItemFromID for: {email_id[:50]}...")
+                    logger.debug("Trying GetItemFromID for: %s...", email_id[:50])
                     email_item = namespace.GetItemFromID(email_id)
-                    if email_item and hasattr(email_item, 'Class') and email_item.Class == 43:
-                        logger.debug(f"✅ Found email using GetItemFromID")
+                    if email_item and getattr(email_item, 'Class', None) == 43:
+                        logger.debug("✅ Found email using GetItemFromID")
                     else:
-                        logger.debug(f"❌ GetItemFromID returned invalid item")
+                        logger.debug("❌ GetItemFromID returned invalid item")
                         email_item = None
                 except Exception as e:
-                    logger.debug(f"❌ GetItemFromID failed: {e}")
+                    logger.debug("❌ GetItemFromID failed: %s", e)
                     email_item = None
                 
                 # Method 2: If GetItemFromID fails, search through inbox items
                 if not email_item:
-                    logger.debug(f"🔍 Falling back to inbox search...")
+                    logger.debug("🔍 Falling back to inbox search...")
                     items = inbox_folder.Items
-                    logger.debug(f"📧 Searching through {items.Count} inbox items...")
+                    # Items.Count is a COM call; only make it when it is logged
+                    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                    if debug_enabled:
+                        logger.debug("📧 Searching through %s inbox items...", items.Count)
                     
                     checked_count = 0
                     for item in items:
                         try:
                             checked_count += 1
-                            if checked_count <= 5:  # Log first 5 for debugging
+                            if debug_enabled and checked_count <= 5:  # Log first 5 for debugging
                                 item_id = getattr(item, 'EntryID', 'NO_ID')
-                                logger.debug(f"   Item {checked_count}: {item_id[:50]}...")
+                                logger.debug("   Item %s: %s...", checked_count, item_id[:50])
                             
-                            if (hasattr(item, 'EntryID') and 
-                                hasattr(item, 'Class') and 
-                                item.Class == 43 and  # olMail
-                                item.EntryID == email_id):
+                            if (getattr(item, 'Class', None) == 43 and  # olMail
+                                getattr(item, 'EntryID', None) == email_id):
                                 email_item = item
-                                logger.debug(f"✅ Found email by ID in inbox search (item {checked_count})")
+                                logger.debug("✅ Found email by ID in inbox search (item %s)", checked_count)
                                 break
                         except Exception as e:
-                            logger.debug(f"Error checking item {checked_count}: {e}")
+                            logger.debug("Error checking item %s: %s", checked_count, e)
                             continue
                     
-                    logger.debug(f"📊 Searched {checked_count} items, found: {'YES' if email_item else 'NO'}")
+                    logger.debug("📊 Searched %s items, found: %s", checked_count, 'YES' if email_item else 'NO')
                         
             except Exception as e:
-                logger.debug(f"Error finding email in inbox: {e}")
+                logger.debug("Error finding email in inbox: %s", e)
             
             if not email_item:
                 logger.warning(f"Email not found: {email_id}")
                 raise EmailNotFoundError(email_id)
             
             # Verify it's a mail item (type 43 = olMail)
-            if not hasattr(email_item, 'Class') or email_item.Class != 43:
+            if getattr(email_item, 'Class', None) != 43:
                 logger.warning(f"Item is not a mail item: {email_id}")
                 raise EmailNotFoundError(email_id)
             
@@ -978,32 +1280,28 @@ class OutlookAdapter:
                 if parent_folder:
                     folder_name = getattr(parent_folder, 'Name', 'Unknown')
             except Exception as e:
-                logger.debug(f"Could not get folder name: {e}")
+                logger.debug("Could not get folder name: %s", e)
             
             email_data = self._transform_email_to_data(email_item, folder_name)
             
-            logger.debug(f"Successfully retrieved detailed email: {email_id}")
-            return email_data
+            self._email_cache[email_id] = (time.monotonic(), email_data)
+            if len(self._email_cache) > _EMAIL_CACHE_SIZE:
+                self._email_cache.popitem(last=False)
+            
+            logger.debug("Successfully retrieved detailed email: %s", email_id)
+            return replace(email_data)
             
         except EmailNotFoundError:
             raise
         except Exception as e:
             logger.error(f"Error retrieving email '{email_id}': {str(e)}")
             
-            # Check for permission-related errors
-            if any(keyword in str(e).lower() for keyword in ['access', 'permission', 'denied', 'unauthorized']):
-                raise PermissionError(email_id, f"Access denied to email '{email_id}': {str(e)}")
-            
-            # Check for invalid ID errors
-            if any(keyword in str(e).lower() for keyword in ['invalid', 'malformed', 'corrupt']):
-                raise EmailNotFoundError(email_id)
+            # Check for permission-related errors; anything else, including
+            # invalid or malformed IDs, means the email was not found
+            if _is_access_error(e):
+                raise OutlookPermissionError(email_id, f"Access denied to email '{email_id}': {str(e)}")
             
             raise EmailNotFoundError(email_id)
-        finally:
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass  # Ignore cleanup errors
     
     def _find_email_by_id_in_folders(self, email_id: str, namespace) -> Any:
         """
@@ -1018,7 +1316,7 @@ class OutlookAdapter:
             Email item if found, None otherwise
         """
         try:
-            logger.debug(f"Searching for email ID {email_id[:20]}... in all folders")
+            logger.debug("Searching for email ID %s... in all folders", email_id[:20])
             
             # Get all folders
             folders = namespace.Folders
@@ -1034,28 +1332,27 @@ class OutlookAdapter:
                             if count >= 100:  # Limit search for performance
                                 break
                             try:
-                                if (hasattr(item, 'EntryID') and 
-                                    hasattr(item, 'Class') and 
-                                    item.Class == 43 and  # olMail
-                                    item.EntryID == email_id):
-                                    logger.debug(f"Found email in folder: {folder.Name}")
+                                if (getattr(item, 'Class', None) == 43 and  # olMail
+                                    getattr(item, 'EntryID', None) == email_id):
+                                    logger.debug("Found email in folder: %s", folder.Name)
                                     return item
                                 count += 1
                             except Exception as e:
-                                logger.debug(f"Error checking item: {e}")
+                                logger.debug("Error checking item: %s", e)
                                 continue
                                 
                 except Exception as e:
-                    logger.debug(f"Error searching folder: {e}")
+                    logger.debug("Error searching folder: %s", e)
                     continue
             
-            logger.debug(f"Email ID {email_id[:20]}... not found in any folder")
+            logger.debug("Email ID %s... not found in any folder", email_id[:20])
             return None
             
         except Exception as e:
-            logger.debug(f"Error in folder search: {e}")
+            logger.debug("Error in folder search: %s", e)
             return None
     
+    @_on_com_thread
     def search_emails(self, query: str, folder_identifier: str = None, limit: int = 50) -> List[EmailData]:
         """
         Search emails based on query with enhanced functionality.
@@ -1081,7 +1378,8 @@ class OutlookAdapter:
             logger.debug("Empty or invalid query provided")
             return []
         
-        if not query.strip():
+        query = query.strip()
+        if not query:
             logger.debug("Empty or whitespace-only query provided")
             return []
         
@@ -1089,7 +1387,7 @@ class OutlookAdapter:
             limit = 50  # Default limit
         
         try:
-            logger.debug(f"Searching emails with query: '{query}', folder: {folder_identifier or 'all folders'}, limit: {limit}")
+            logger.debug("Searching emails with query: '%s', folder: %s, limit: %s", query, folder_identifier or 'all folders', limit)
             
             # Process search query to ensure Outlook compatibility
             processed_query = self._process_search_query(query)
@@ -1101,12 +1399,12 @@ class OutlookAdapter:
                 # Search across all accessible folders
                 return self._search_all_folders(processed_query, limit)
             
-        except (FolderNotFoundError, PermissionError):
+        except (FolderNotFoundError, OutlookPermissionError):
             raise
         except Exception as e:
             logger.error(f"Error searching emails: {str(e)}")
-            if "access" in str(e).lower() or "permission" in str(e).lower():
-                raise PermissionError(folder_identifier or "folders", f"Access denied during search: {str(e)}")
+            if _is_access_error(e):
+                raise OutlookPermissionError(folder_identifier or "folders", f"Access denied during search: {str(e)}")
             return []
     
     def _process_search_query(self, query: str) -> str:
@@ -1114,26 +1412,19 @@ class OutlookAdapter:
         Process and validate search query for Outlook compatibility.
         
         Args:
-            query: Raw search query
+            query: Search query, already stripped by search_emails()
             
         Returns:
             Processed query string compatible with Outlook search
         """
-        try:
-            # Clean up the query
-            processed_query = query.strip()
-            
-            # If query doesn't contain Outlook search syntax, make it search in subject and body
-            if not any(keyword in processed_query.lower() for keyword in ['subject:', 'body:', 'from:', 'to:', 'received:']):
-                # Search in subject and body by default
-                processed_query = f'(subject:"{processed_query}" OR body:"{processed_query}")'
-            
-            logger.debug(f"Processed search query: {processed_query}")
-            return processed_query
-            
-        except Exception as e:
-            logger.debug(f"Error processing search query: {str(e)}")
-            return query  # Return original query if processing fails
+        # Queries that already use Outlook search syntax are passed through
+        if _QUERY_OPS_RE.search(query):
+            return query
+        
+        # Otherwise search in subject and body by default
+        processed_query = f'(subject:"{query}" OR body:"{query}")'
+        logger.debug("Processed search query: %s", processed_query)
+        return processed_query
     
     def _search_in_folder(self, query: str, folder_identifier: str, limit: int) -> List[EmailData]:
         """
@@ -1148,22 +1439,9 @@ class OutlookAdapter:
             List[EmailData]: List of matching email data objects
         """
         try:
-            # Initialize COM for this thread
-            pythoncom.CoInitialize()
+            namespace = self._get_call_namespace("search")
             
-            # Create thread-local Outlook connection
-            try:
-                outlook_app = win32com.client.Dispatch("Outlook.Application")
-                namespace = outlook_app.GetNamespace("MAPI")
-                
-                logger.debug("Created thread-local Outlook connection for search")
-                
-            except Exception as e:
-                logger.error(f"Failed to create thread-local Outlook connection: {e}")
-                # Fall back to original namespace
-                namespace = self._namespace
-            
-            # Get the target folder (by name or ID) using thread-local connection
+            # Get the target folder (by name or ID) from that namespace
             if len(folder_identifier) > 50 and all(c in '0123456789ABCDEFabcdef' for c in folder_identifier):
                 # This looks like a folder ID
                 folder = self._get_folder_by_id_thread_local(folder_identifier, namespace)
@@ -1176,26 +1454,21 @@ class OutlookAdapter:
             
             # Get the actual folder name for logging
             folder_name = getattr(folder, 'Name', folder_identifier)
-            logger.debug(f"Searching in folder: {folder_name} (identifier: {folder_identifier})")
+            logger.debug("Searching in folder: %s (identifier: %s)", folder_name, folder_identifier)
             
             # Perform search in the folder
             results = self._perform_folder_search(folder, query, limit, folder_name)
             
-            logger.debug(f"Found {len(results)} emails in folder '{folder_name}'")
+            logger.debug("Found %s emails in folder '%s'", len(results), folder_name)
             return results
             
-        except (FolderNotFoundError, PermissionError):
+        except (FolderNotFoundError, OutlookPermissionError):
             raise
         except Exception as e:
             logger.error(f"Error searching in folder '{folder_identifier}': {str(e)}")
-            if "access" in str(e).lower() or "permission" in str(e).lower():
-                raise PermissionError(folder_identifier, f"Access denied to folder '{folder_identifier}': {str(e)}")
+            if _is_access_error(e):
+                raise OutlookPermissionError(folder_identifier, f"Access denied to folder '{folder_identifier}': {str(e)}")
             return []
-        finally:
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass  # Ignore cleanup errors
     
     def _search_all_folders(self, query: str, limit: int) -> List[EmailData]:
         """
@@ -1211,48 +1484,56 @@ class OutlookAdapter:
         try:
             logger.debug("Searching across all accessible folders")
             
+            # A single store-side search over every mail folder, when available
+            advanced_results = self._advanced_search(query, limit)
+            if advanced_results is not None:
+                logger.debug("Global search complete: %s results from AdvancedSearch", len(advanced_results))
+                return advanced_results
+            
             all_results = []
             folders_searched = 0
             
-            # Get all folders
+            # Get all mail folders
             try:
-                all_folders = self.get_folders()
+                mail_folders = self._get_mail_folders()
             except Exception as e:
                 logger.warning(f"Could not get all folders, searching in default folders: {str(e)}")
                 # Fallback to searching in default folders
                 return self._search_default_folders(query, limit)
             
-            # Search in each folder
-            for folder_data in all_folders:
+            # Search in each folder through the handles already held
+            for folder, folder_name in mail_folders:
                 if len(all_results) >= limit:
                     break
                 
                 try:
-                    # Skip non-mail folders
-                    if folder_data.folder_type != "Mail":
-                        continue
-                    
+                    # Fails once the handle is stale, e.g. its store was removed
+                    folder.EntryID
+                except Exception as e:
+                    logger.debug("Folder '%s' is no longer accessible: %s", folder_name, e)
+                    self._default_folder_cache.clear()
+                    self.invalidate_folder_cache()
+                    continue
+                
+                try:
                     # Get remaining limit for this folder
                     remaining_limit = limit - len(all_results)
                     
                     # Search in this folder
-                    folder_results = self._search_in_folder(query, folder_data.name, remaining_limit)
+                    folder_results = self._perform_folder_search(folder, query, remaining_limit, folder_name)
                     all_results.extend(folder_results)
                     folders_searched += 1
                     
-                    logger.debug(f"Searched folder '{folder_data.name}': {len(folder_results)} results")
+                    logger.debug("Searched folder '%s': %s results", folder_name, len(folder_results))
                     
                 except Exception as e:
-                    logger.debug(f"Error searching folder '{folder_data.name}': {str(e)}")
+                    logger.debug("Error searching folder '%s': %s", folder_name, e)
                     continue
             
-            # Sort results by received time (newest first)
-            all_results.sort(key=lambda x: x.received_time or datetime.min, reverse=True)
-            
-            # Apply final limit
-            final_results = all_results[:limit]
+            # Newest results first, up to the limit
+            final_results = heapq.nlargest(limit, all_results, key=_received_time_key)
             
-            logger.debug(f"Global search complete: {len(final_results)} results from {folders_searched} folders")
+            logger.debug("Global search complete: %s results from %s folders", len(final_results), folders_searched)
             return final_results
             
         except Exception as e:
@@ -1260,6 +1541,105 @@ class OutlookAdapter:
             # Fallback to searching in default folders
             return self._search_default_folders(query, limit)
     
+    def _get_mail_folders(self) -> List[Tuple[Any, str]]:
+        """
+        Get the main mail folders, reusing the list for _MAIL_FOLDERS_TTL seconds.
+        
+        Only folders holding mail items are included, so Calendar, Contacts,
+        Journal and Tasks are not searched.
+        
+        Returns:
+            List of (COM folder, folder name) pairs
+        """
+        now = time.monotonic()
+        if self._mail_folders is None or now - self._mail_folders_time >= _MAIL_FOLDERS_TTL:
+            mail_folders = []
+            for folder_id, english_name in _MAIN_FOLDERS:
+                try:
+                    folder = self._get_default_folder(folder_id)
+                    if folder and folder.DefaultItemType == 0:  # olMailItem
+                        mail_folders.append((folder, folder.Name))
+                except Exception as e:
+                    logger.debug("Could not access %s: %s", english_name, e)
+            self._mail_folders = mail_folders
+            self._mail_folders_time = now
+        return self._mail_folders
+    
+    def _advanced_search(self, query: str, limit: int) -> Optional[List[EmailData]]:
+        """
+        Search the main mail folders and their subfolders with AdvancedSearch.
+        
+        Outlook runs one search over all scope folders and raises
+        AdvancedSearchComplete when it finishes; the event is delivered while
+        this thread pumps messages.
+        
+        Args:
+            query: Processed search query
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of matching email data objects, or None if AdvancedSearch
+            could not be used
+        """
+        dasl_filter = self._build_dasl_filter(self._parse_search_query(query))
+        if not dasl_filter or self._outlook_app is None:
+            return None
+        
+        try:
+            scope_paths = []
+            for folder_id in _SEARCH_SCOPE_FOLDERS:
+                try:
+                    folder_path = self._get_default_folder(folder_id).FolderPath
+                    scope_paths.append("'" + folder_path.replace("'", "''") + "'")
+                except Exception as e:
+                    logger.debug("Default folder %s left out of search scope: %s", folder_id, e)
+            if not scope_paths:
+                return None
+            
+            events = win32com.client.WithEvents(self._outlook_app, _AdvancedSearchEvents)
+            try:
+                tag = f"mcp_search_{uuid.uuid4().hex}"
+                # AdvancedSearch takes the DASL query without the @SQL= prefix
+                search = self._outlook_app.AdvancedSearch(
+                    ",".join(scope_paths), dasl_filter[len("@SQL="):], True, tag
+                )
+                
+                deadline = time.monotonic() + _ADVANCED_SEARCH_TIMEOUT
+                while tag not in events.completed_tags:
+                    if time.monotonic() >= deadline:
+                        logger.debug("AdvancedSearch timed out, using results found so far")
+                        search.Stop()
+                        break
+                    pythoncom.PumpWaitingMessages()
+                    time.sleep(0.05)
+            finally:
+                events.close()
+            
+            matches = search.Results
+            matches.Sort("[ReceivedTime]", True)  # Newest first
+            
+            results = []
+            for item in matches:
+                if len(results) >= limit:
+                    break
+                
+                try:
+                    # Check if it's a mail item (type 43 = olMail)
+                    if item.Class != 43:
+                        continue
+                    
+                    results.append(self._transform_email_to_data(item, self._extract_folder_name(item)))
+                    
+                except Exception as e:
+                    logger.debug("Error processing item in search: %s", e)
+                    continue
+            
+            return results
+            
+        except Exception as e:
+            logger.debug("AdvancedSearch unavailable, searching folders one by one: %s", e)
+            return None
+    
     def _search_default_folders(self, query: str, limit: int) -> List[EmailData]:
         """
         Search in default Outlook folders as fallback.
@@ -1274,10 +1654,9 @@ class OutlookAdapter:
         try:
             logger.debug("Searching in default folders as fallback")
             
-            default_folders = ["Inbox", "Sent Items", "Drafts"]
             all_results = []
             
-            for folder_name in default_folders:
+            for folder_name in _FALLBACK_SEARCH_FOLDERS:
                 if len(all_results) >= limit:
                     break
                 
@@ -1287,13 +1666,11 @@ class OutlookAdapter:
                     all_results.extend(folder_results)
                     
                 except Exception as e:
-                    logger.debug(f"Error searching default folder '{folder_name}': {str(e)}")
+                    logger.debug("Error searching default folder '%s': %s", folder_name, e)
                     continue
             
-            # Sort results by received time (newest first)
-            all_results.sort(key=lambda x: x.received_time or datetime.min, reverse=True)
-            
-            return all_results[:limit]
+            # Newest results first, up to the limit
+            return heapq.nlargest(limit, all_results, key=_received_time_key)
             
         except Exception as e:
             logger.error(f"Error searching default folders: {str(e)}")
@@ -1316,16 +1693,47 @@ class OutlookAdapter:
             # Get folder items
             items = folder.Items
             
-            # Sort by received time (newest first) for consistent results
-            items.Sort("[ReceivedTime]", True)  # True for descending order
-            
             results = []
             count = 0
             
             # Parse the search query to extract search terms and fields
             search_terms = self._parse_search_query(query)
             
-            logger.debug(f"Searching folder '{folder_name}' with terms: {search_terms}")
+            logger.debug("Searching folder '%s' with terms: %s", folder_name, search_terms)
+            
+            # Let the store evaluate the query so only matching items cross COM
+            dasl_filter = self._build_dasl_filter(search_terms)
+            if dasl_filter:
+                try:
+                    matches = items.Restrict(dasl_filter)
+                    matches.Sort("[ReceivedTime]", True)  # Newest first
+                    
+                    for item in matches:
+                        if count >= limit:
+                            break
+                        
+                        try:
+                            # Check if it's a mail item (type 43 = olMail)
+                            if item.Class != 43:
+                                continue
+                            
+                            results.append(self._transform_email_to_data(item, folder_name))
+                            count += 1
+                            
+                        except Exception as e:
+                            logger.debug("Error processing item in search: %s", e)
+                            continue
+                    
+                    logger.debug("Restricted search in folder '%s' found %s matches", folder_name, len(results))
+                    return results
+                    
+                except Exception as e:
+                    logger.debug("Restrict failed in folder '%s', scanning items: %s", folder_name, e)
+                    results = []
+                    count = 0
+            
+            # Sort by received time (newest first) for consistent results
+            items.Sort("[ReceivedTime]", True)  # True for descending order
             
             # Manual search through items (more reliable than Outlook's Find method)
             items_checked = 0
@@ -1339,7 +1747,7 @@ class OutlookAdapter:
                 
                 try:
                     # Check if it's a mail item (type 43 = olMail)
-                    if not hasattr(item, 'Class') or item.Class != 43:
+                    if getattr(item, 'Class', None) != 43:
                         continue
                     
                     # Check if item matches search criteria
@@ -1350,10 +1758,10 @@ class OutlookAdapter:
                         count += 1
                     
                 except Exception as e:
-                    logger.debug(f"Error processing item in search: {str(e)}")
+                    logger.debug("Error processing item in search: %s", e)
                     continue
             
-            logger.debug(f"Search in folder '{folder_name}' checked {items_checked} items, found {len(results)} matches")
+            logger.debug("Search in folder '%s' checked %s items, found %s matches", folder_name, items_checked, len(results))
             return results
             
         except Exception as e:
@@ -1411,14 +1819,38 @@ class OutlookAdapter:
                 if clean_query:
                     search_terms['general'].append(clean_query)
             
-            logger.debug(f"Parsed search terms: {search_terms}")
+            logger.debug("Parsed search terms: %s", search_terms)
             return search_terms
             
         except Exception as e:
-            logger.debug(f"Error parsing search query: {e}")
+            logger.debug("Error parsing search query: %s", e)
             # Fallback: treat entire query as general search
             return {'subject': [], 'body': [], 'from': [], 'to': [], 'general': [query.lower()]}
     
+    def _build_dasl_filter(self, search_terms: dict) -> Optional[str]:
+        """
+        Translate parsed search terms into an Items.Restrict DASL filter.
+        
+        The filter matches the same fields as _item_matches_search(); DASL
+        LIKE comparisons are case-insensitive.
+        
+        Args:
+            search_terms: Parsed search terms
+            
+        Returns:
+            DASL filter string, or None if there is nothing to search for
+        """
+        clauses = []
+        for field, properties in _DASL_FIELDS.items():
+            for term in search_terms.get(field, ()):
+                pattern = term.replace("'", "''")
+                for prop in properties:
+                    clauses.append(f"{prop} LIKE '%{pattern}%'")
+        
+        if not clauses:
+            return None
+        return "@SQL=" + " OR ".join(clauses)
+    
     def _item_matches_search(self, item: Any, search_terms: dict) -> bool:
         """
         Check if an email item matches the search criteria.
@@ -1441,25 +1873,25 @@ class OutlookAdapter:
             if search_terms['body']:
                 body = str(getattr(item, 'Body', '')).lower()
             
-            logger.debug(f"Checking item: subject='{subject[:50]}...', sender='{sender_name}'")
+            logger.debug("Checking item: subject='%s...', sender='%s'", subject[:50], sender_name)
             
             # Check subject matches
             for term in search_terms['subject']:
                 if term.lower() in subject:
-                    logger.debug(f"Subject match found: '{term}' in '{subject[:50]}...'")
+                    logger.debug("Subject match found: '%s' in '%s...'", term, subject[:50])
                     return True
             
             # Check body matches (only if body terms exist)
             if search_terms['body']:
                 for term in search_terms['body']:
                     if term.lower() in body:
-                        logger.debug(f"Body match found: '{term}'")
+                        logger.debug("Body match found: '%s'", term)
                         return True
             
             # Check from matches
             for term in search_terms['from']:
                 if term.lower() in sender_name or term.lower() in sender_email:
-                    logger.debug(f"From match found: '{term}' in '{sender_name}' or '{sender_email}'")
+                    logger.debug("From match found: '%s' in '%s' or '%s'", term, sender_name, sender_email)
                     return True
             
             # Check general matches (search in subject and sender, skip body for performance)
@@ -1467,13 +1899,13 @@ class OutlookAdapter:
                 if (term.lower() in subject or 
                     term.lower() in sender_name or 
                     term.lower() in sender_email):
-                    logger.debug(f"General match found: '{term}' in subject or sender")
+                    logger.debug("General match found: '%s' in subject or sender", term)
                     return True
             
             return False
             
         except Exception as e:
-            logger.debug(f"Error checking item match: {e}")
+            logger.debug("Error checking item match: %s", e)
             return False
     
     def __enter__(self):
@@ -1481,6 +1913,24 @@ class OutlookAdapter:
         self.connect()
         return self
     
+    def _restrict_to_unread(self, items: Any) -> Tuple[Any, bool]:
+        """
+        Filter a folder's items down to unread ones with Items.Restrict.
+        
+        Args:
+            items: The folder's Items collection
+            
+        Returns:
+            Tuple of the items to iterate and whether callers must still
+            check UnRead on each item because the store rejected the filter
+        """
+        try:
+            return items.Restrict("[UnRead] = True"), False
+        except Exception as e:
+            logger.debug("Restrict failed, filtering unread items one by one: %s", e)
+            return items, True
+    
+    @_on_com_thread
     def list_inbox_emails(self, unread_only: bool = False, limit: int = 50) -> List[EmailData]:
         """
         List emails from the default inbox folder.
@@ -1503,22 +1953,9 @@ class OutlookAdapter:
             limit = 50  # Default limit
         
         try:
-            # Initialize COM for this thread
-            pythoncom.CoInitialize()
+            logger.debug("Listing emails from inbox, unread_only: %s, limit: %s", unread_only, limit)
             
-            logger.debug(f"Listing emails from inbox, unread_only: {unread_only}, limit: {limit}")
-            
-            # Create thread-local Outlook connection
-            try:
-                outlook_app = win32com.client.Dispatch("Outlook.Application")
-                namespace = outlook_app.GetNamespace("MAPI")
-                
-                logger.debug("Created thread-local Outlook connection for list_inbox_emails")
-                
-            except Exception as e:
-                logger.error(f"Failed to create thread-local Outlook connection: {e}")
-                # Fall back to original namespace
-                namespace = self._namespace
+            namespace = self._get_call_namespace("list_inbox_emails")
             
             # Get the inbox folder using the EXACT same method as list_emails
             # Find the inbox folder by looking for the folder with Chinese name "收件匣"
@@ -1536,12 +1973,12 @@ class OutlookAdapter:
                             item_count = f.Items.Count
                             folder_name = f.Name
                             
-                            logger.debug(f"Checking folder: {folder_name} with {item_count} items")
+                            logger.debug("Checking folder: %s with %s items", folder_name, item_count)
                             
                             # Look for inbox-like names (Chinese, English, etc.)
                             if ("收件" in folder_name or "inbox" in folder_name.lower() or 
                                 "æ¶ä»¶" in folder_name):
-                                logger.debug(f"Found inbox by name: {folder_name}")
+                                logger.debug("Found inbox by name: %s", folder_name)
                                 folder = f
                                 break
                             
@@ -1551,16 +1988,16 @@ class OutlookAdapter:
                                 inbox_candidate = f
                                 
                     except Exception as e:
-                        logger.debug(f"Error checking folder: {e}")
+                        logger.debug("Error checking folder: %s", e)
                         continue
                 
                 # If we didn't find by name, use the folder with most items
                 if not folder and inbox_candidate:
                     folder = inbox_candidate
-                    logger.debug(f"Using folder with most items as inbox: {inbox_candidate.Name} ({max_items} items)")
+                    logger.debug("Using folder with most items as inbox: %s (%s items)", inbox_candidate.Name, max_items)
                     
             except Exception as e:
-                logger.debug(f"Error searching folders: {e}")
+                logger.debug("Error searching folders: %s", e)
             
             # Final fallback: try GetDefaultFolder
             if not folder:
@@ -1568,19 +2005,24 @@ class OutlookAdapter:
                 try:
                     folder = namespace.GetDefaultFolder(6)  # olFolderInbox
                 except Exception as e:
-                    logger.debug(f"GetDefaultFolder failed: {e}")
+                    logger.debug("GetDefaultFolder failed: %s", e)
             
             if not folder:
                 raise FolderNotFoundError("Inbox")
             
-            # Get folder items
+            # Get folder items, narrowed to unread ones by the store if requested
             items = folder.Items
+            check_unread = unread_only
+            if unread_only:
+                items, check_unread = self._restrict_to_unread(items)
             
             # Sort by received time (newest first)
             items.Sort("[ReceivedTime]", True)  # True for descending order
             
             emails = []
             count = 0
+            # The folder name is the same for every item; read it once
+            folder_name = getattr(folder, 'Name', "Inbox")
             
             # Iterate through items and apply filters
             for item in items:
@@ -1589,39 +2031,34 @@ class OutlookAdapter:
                 
                 try:
                     # Check if it's a mail item (type 43 = olMail)
-                    if not hasattr(item, 'Class') or item.Class != 43:
+                    if getattr(item, 'Class', None) != 43:
                         continue
                     
-                    # Apply unread filter if specified
-                    if unread_only and getattr(item, 'UnRead', True) is False:
+                    # Apply unread filter if the store did not
+                    if check_unread and getattr(item, 'UnRead', True) is False:
                         continue
                     
                     # Transform email to EmailData
-                    folder_name = getattr(folder, 'Name', "Inbox")
                     email_data = self._transform_email_to_data(item, folder_name)
                     emails.append(email_data)
                     count += 1
                     
                 except Exception as e:
-                    logger.debug(f"Error processing email item: {str(e)}")
+                    logger.debug("Error processing email item: %s", e)
                     continue
             
-            logger.debug(f"Retrieved {len(emails)} emails from folder")
+            logger.debug("Retrieved %s emails from folder", len(emails))
             return emails
             
-        except (FolderNotFoundError, PermissionError):
+        except (FolderNotFoundError, OutlookPermissionError):
             raise
         except Exception as e:
             logger.error(f"Error listing emails from inbox: {str(e)}")
-            if "access" in str(e).lower() or "permission" in str(e).lower():
-                raise PermissionError("Inbox", f"Access denied to inbox: {str(e)}")
+            if _is_access_error(e):
+                raise OutlookPermissionError("Inbox", f"Access denied to inbox: {str(e)}")
             raise OutlookConnectionError(f"Failed to list emails: {str(e)}")
-        finally:
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass  # Ignore cleanup errors
     
+    @_on_com_thread
     def list_emails(self, folder_id: str, unread_only: bool = False, limit: int = 50) -> List[EmailData]:
         """
         List emails from a specific folder by folder ID.
@@ -1650,22 +2087,9 @@ class OutlookAdapter:
             limit = 50  # Default limit
         
         try:
-            # Initialize COM for this thread
-            pythoncom.CoInitialize()
+            logger.debug("Listing emails from folder ID: %s..., unread_only: %s, limit: %s", folder_id[:20], unread_only, limit)
             
-            logger.debug(f"Listing emails from folder ID: {folder_id[:20]}..., unread_only: {unread_only}, limit: {limit}")
-            
-            # Create thread-local Outlook connection
-            try:
-                outlook_app = win32com.client.Dispatch("Outlook.Application")
-                namespace = outlook_app.GetNamespace("MAPI")
-                
-                logger.debug("Created thread-local Outlook connection for list_emails")
-                
-            except Exception as e:
-                logger.error(f"Failed to create thread-local Outlook connection: {e}")
-                # Fall back to original namespace
-                namespace = self._namespace
+            namespace = self._get_call_namespace("list_emails")
             
             # Get the folder by ID
             folder = self._get_folder_by_id_thread_local(folder_id, namespace)
@@ -1673,14 +2097,19 @@ class OutlookAdapter:
             if not folder:
                 raise FolderNotFoundError(folder_id)
             
-            # Get folder items
+            # Get folder items, narrowed to unread ones by the store if requested
             items = folder.Items
+            check_unread = unread_only
+            if unread_only:
+                items, check_unread = self._restrict_to_unread(items)
             
             # Sort by received time (newest first)
             items.Sort("[ReceivedTime]", True)  # True for descending order
             
             emails = []
             count = 0
+            # The folder name is the same for every item; read it once
+            folder_name = getattr(folder, 'Name', folder_id)
             
             # Iterate through items and apply filters
             for item in items:
@@ -1689,75 +2118,57 @@ class OutlookAdapter:
                 
                 try:
                     # Check if it's a mail item (type 43 = olMail)
-                    if not hasattr(item, 'Class') or item.Class != 43:
+                    if getattr(item, 'Class', None) != 43:
                         continue
                     
-                    # Apply unread filter if specified
-                    if unread_only and getattr(item, 'UnRead', True) is False:
+                    # Apply unread filter if the store did not
+                    if check_unread and getattr(item, 'UnRead', True) is False:
                         continue
                     
                     # Transform email to EmailData
-                    folder_name = getattr(folder, 'Name', folder_id)
                     email_data = self._transform_email_to_data(item, folder_name)
                     emails.append(email_data)
                     count += 1
                     
                 except Exception as e:
-                    logger.debug(f"Error processing email item: {str(e)}")
+                    logger.debug("Error processing email item: %s", e)
                     continue
             
-            logger.debug(f"Retrieved {len(emails)} emails from folder ID: {folder_id[:20]}...")
+            logger.debug("Retrieved %s emails from folder ID: %s...", len(emails), folder_id[:20])
             return emails
             
-        except (FolderNotFoundError, PermissionError, ValidationError):
+        except (FolderNotFoundError, OutlookPermissionError, ValidationError):
             raise
         except Exception as e:
             logger.error(f"Error listing emails from folder ID '{folder_id[:20]}...': {str(e)}")
-            if "access" in str(e).lower() or "permission" in str(e).lower():
-                raise PermissionError(folder_id, f"Access denied to folder: {str(e)}")
+            if _is_access_error(e):
+                raise OutlookPermissionError(folder_id, f"Access denied to folder: {str(e)}")
             raise OutlookConnectionError(f"Failed to list emails: {str(e)}")
-        finally:
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass  # Ignore cleanup errors
     
     def _get_folder_by_id_thread_local(self, folder_id: str, namespace: Any) -> Any:
         """
-        Get folder by ID using thread-local namespace.
+        Get folder by ID from the namespace returned by _get_call_namespace().
         
         Args:
             folder_id: ID of the folder to retrieve
-            namespace: Thread-local namespace object
+            namespace: MAPI namespace for the current thread
             
         Returns:
             COM object: The folder object
         """
         try:
-            logger.debug(f"Looking for folder by ID (thread-local): {folder_id[:20]}...")
+            logger.debug("Looking for folder by ID (thread-local): %s...", folder_id[:20])
             
             # Check main default folders
-            main_folders = [
-                (6, "Inbox"),           # olFolderInbox
-                (5, "Sent Items"),      # olFolderSentMail  
-                (16, "Drafts"),         # olFolderDrafts
-                (3, "Deleted Items"),   # olFolderDeletedItems
-                (4, "Outbox"),          # olFolderOutbox
-                (9, "Calendar"),        # olFolderCalendar
-                (10, "Contacts"),       # olFolderContacts
-                (13, "Journal"),        # olFolderJournal
-                (12, "Tasks")           # olFolderTasks
-            ]
-            
-            for folder_id_num, folder_name in main_folders:
+            for folder_id_num, folder_name in _MAIN_FOLDERS:
                 try:
                     folder = namespace.GetDefaultFolder(folder_id_num)
-                    if folder and hasattr(folder, 'EntryID'):
+                    if folder:
                         if folder.EntryID == folder_id:
-                            logger.debug(f"Found folder by ID: {folder_id[:20]}... -> {folder_name}")
+                            logger.debug("Found folder by ID: %s... -> %s", folder_id[:20], folder_name)
                             return folder
                 except Exception as e:
-                    logger.debug(f"Error checking folder {folder_name}: {e}")
+                    logger.debug("Error checking folder %s: %s", folder_name, e)
                     continue
             
             logger.warning(f"Folder not found by ID: {folder_id[:20]}...")
@@ -1769,32 +2180,24 @@ class OutlookAdapter:
     
     def _get_folder_by_name_thread_local(self, folder_name: str, namespace: Any) -> Any:
         """
-        Get folder by name using thread-local namespace.
+        Get folder by name from the namespace returned by _get_call_namespace().
         
         Args:
             folder_name: Name of the folder to retrieve
-            namespace: Thread-local namespace object
+            namespace: MAPI namespace for the current thread
             
         Returns:
             COM object: The folder object
         """
         try:
-            logger.debug(f"Looking for folder by name (thread-local): {folder_name}")
+            logger.debug("Looking for folder by name (thread-local): %s", folder_name)
             
             # Try default folders first
-            default_folders = {
-                "Inbox": 6, "收件匣": 6,
-                "Sent Items": 5, "寄件備份": 5, "已傳送的郵件": 5,
-                "Drafts": 16, "草稿": 16,
-                "Deleted Items": 3, "已刪除的項目": 3,
-                "Outbox": 4, "寄件匣": 4
-            }
-            
-            if folder_name in default_folders:
-                folder_id = default_folders[folder_name]
+            if folder_name in _DEFAULT_FOLDERS:
+                folder_id = _DEFAULT_FOLDERS[folder_name]
                 folder = namespace.GetDefaultFolder(folder_id)
                 if folder:
-                    logger.debug(f"Found folder by name: {folder_name}")
+                    logger.debug("Found folder by name: %s", folder_name)
                     return folder
             
             logger.warning(f"Folder not found by name: {folder_name}")
@@ -1816,8 +2219,7 @@ class OutlookAdapter:
             EmailData: Transformed email data
         """
         try:
-            logger.info(f"🔧 DEBUG: *** TRANSFORM EMAIL TO DATA CALLED *** folder: {folder_name}")
-            logger.info(f"🔧 DEBUG: Starting email transformation for folder: {folder_name}")
+            logger.debug("Starting email transformation for folder: %s", folder_name)
             
             # Force COM object to load all properties by accessing them in a specific way
             # This is critical to ensure all email properties are accessible
@@ -1825,90 +2227,67 @@ class OutlookAdapter:
                 # Force the COM object to fully initialize by accessing key properties
                 _ = email_item.Class  # Force COM object initialization
                 _ = email_item.MessageClass  # Force message type loading
-                logger.info(f"🔧 DEBUG: COM object initialized successfully")
+                logger.debug("COM object initialized successfully")
             except Exception as com_e:
-                logger.info(f"🔧 DEBUG: COM object initialization failed: {com_e}")
-            
-            # Get basic email properties first
-            email_id = self._get_email_property(email_item, 'EntryID', f"unknown_{id(email_item)}")
-            subject = self._get_email_property(email_item, 'Subject', '')
-            logger.info(f"🔧 DEBUG: Basic properties - ID: {email_id[:20]}..., Subject: '{subject[:50]}'")
-            
-            # Get sender information
-            sender_name = self._get_email_property(email_item, 'SenderName', '')
-            sender_email = self._get_email_property(email_item, 'SenderEmailAddress', '')
-            logger.info(f"🔧 DEBUG: Raw sender - Name: '{sender_name}', Email: '{sender_email}'")
-            logger.info(f"🔧 DEBUG: About to continue with property loading...")
+                logger.debug("COM object initialization failed: %s", com_e)
             
-            # Force property loading by trying to access them
+            # Each property below is a cross-process COM call, so every one is
+            # read once; getattr() with a default replaces hasattr() checks,
+            # which would fetch the property a second time
             try:
-                _ = email_item.Subject
-                _ = email_item.Body
-                _ = email_item.SenderName
+                email_id = str(getattr(email_item, 'EntryID', ''))
             except Exception as e:
-                logger.debug(f"Error forcing COM property access: {e}")
-            
-            logger.info(f"🔧 DEBUG: Property loading completed, continuing with email processing...")
-            
-            # Get basic email properties with FORCED property access
-            sender_name = ''
-            
-            try:
-                # Use direct property access with error handling
-                email_id = str(email_item.EntryID) if hasattr(email_item, 'EntryID') else ''
-            except Exception as e:
-                logger.debug(f"Error getting EntryID: {e}")
+                logger.debug("Error getting EntryID: %s", e)
                 email_id = f"unknown_{id(email_item)}"
             
             try:
-                subject = str(email_item.Subject) if hasattr(email_item, 'Subject') else ''
+                subject = str(getattr(email_item, 'Subject', ''))
             except Exception as e:
-                logger.debug(f"Error getting Subject: {e}")
+                logger.debug("Error getting Subject: %s", e)
                 subject = '(No Subject)'
             
             try:
-                sender_name = str(email_item.SenderName) if hasattr(email_item, 'SenderName') else ''
+                sender_name = str(getattr(email_item, 'SenderName', ''))
             except Exception as e:
-                logger.debug(f"Error getting SenderName: {e}")
+                logger.debug("Error getting SenderName: %s", e)
                 sender_name = 'Unknown Sender'
+            logger.debug("Basic properties - ID: %s..., Subject: '%s'", email_id[:20], subject[:50])
             
             # Try multiple ways to get sender email address with FORCED access
             sender_email = ''
-            logger.info(f"🔧 DEBUG: Starting sender email extraction methods...")
+            logger.debug("Starting sender email extraction methods...")
             try:
                 # Method 1: Direct property with forced access
                 try:
-                    if hasattr(email_item, 'SenderEmailAddress'):
-                        sender_email = str(email_item.SenderEmailAddress)
-                        logger.info(f"🔧 DEBUG: Method 1 - SenderEmailAddress: '{sender_email}'")
+                    sender_email = str(getattr(email_item, 'SenderEmailAddress', ''))
+                    logger.debug("Method 1 - SenderEmailAddress: '%s'", sender_email)
                 except Exception as e:
-                    logger.info(f"🔧 DEBUG: Method 1 failed: {e}")
+                    logger.debug("Method 1 failed: %s", e)
                 
                 # Method 2: If empty or invalid, try Sender property
                 if not sender_email or '@' not in sender_email:
-                    logger.info(f"🔧 DEBUG: Trying Method 2 - Sender.Address...")
+                    logger.debug("Trying Method 2 - Sender.Address...")
                     try:
-                        if hasattr(email_item, 'Sender'):
-                            sender_obj = email_item.Sender
-                            if sender_obj and hasattr(sender_obj, 'Address'):
-                                sender_email = str(sender_obj.Address)
-                                logger.info(f"🔧 DEBUG: Method 2 - Sender.Address: '{sender_email}'")
+                        sender_obj = getattr(email_item, 'Sender', None)
+                        sender_address = getattr(sender_obj, 'Address', None) if sender_obj else None
+                        if sender_address is not None:
+                            sender_email = str(sender_address)
+                            logger.debug("Method 2 - Sender.Address: '%s'", sender_email)
                     except Exception as e:
-                        logger.debug(f"Method 2 failed: {e}")
+                        logger.debug("Method 2 failed: %s", e)
                 
                 # Method 3: Try Reply Recipients
                 if not sender_email or '@' not in sender_email:
                     try:
-                        if hasattr(email_item, 'ReplyRecipients'):
-                            reply_recipients = email_item.ReplyRecipients
-                            if reply_recipients and reply_recipients.Count > 0:
-                                sender_email = str(reply_recipients.Item(1).Address)
-                                logger.debug(f"Method 3 - ReplyRecipients: '{sender_email}'")
+                        reply_recipients = getattr(email_item, 'ReplyRecipients', None)
+                        if reply_recipients and reply_recipients.Count > 0:
+                            sender_email = str(reply_recipients.Item(1).Address)
+                            logger.debug("Method 3 - ReplyRecipients: '%s'", sender_email)
                     except Exception as e:
-                        logger.debug(f"Method 3 failed: {e}")
+                        logger.debug("Method 3 failed: %s", e)
                         
             except Exception as e:
-                logger.debug(f"Error getting sender email: {e}")
+                logger.debug("Error getting sender email: %s", e)
                 sender_email = ''
             
             # Ensure we have a valid ID
@@ -1920,51 +2299,50 @@ class OutlookAdapter:
             cc_recipients = []
             bcc_recipients = []
             
-            logger.info(f"🔧 DEBUG: Starting recipient extraction (duplicate section)...")
             try:
-                if hasattr(email_item, 'Recipients'):
-                    logger.info(f"🔧 DEBUG: Found {email_item.Recipients.Count} recipients in duplicate section")
-                    for recipient in email_item.Recipients:
-                        recipient_email = getattr(recipient, 'Address', '')
-                        recipient_name = getattr(recipient, 'Name', '')
-                        recipient_type = getattr(recipient, 'Type', 1)  # 1=To, 2=CC, 3=BCC
-                        
-                        logger.info(f"🔧 DEBUG: Processing recipient (duplicate) - Email: '{recipient_email}', Name: '{recipient_name}', Type: {recipient_type}")
+                item_recipients = getattr(email_item, 'Recipients', None)
+                if item_recipients is not None:
+                    # List to add an address to, by OlMailRecipientType
+                    appenders = {1: recipients.append, 2: cc_recipients.append, 3: bcc_recipients.append}
+                    for recipient in item_recipients:
+                        # Outlook may report a missing address or name as None
+                        recipient_email = getattr(recipient, 'Address', None) or ''
+                        recipient_name = getattr(recipient, 'Name', None) or ''
+                        recipient_type = getattr(recipient, 'Type', None)  # 1=To, 2=CC, 3=BCC
+                        if recipient_type is None:
+                            recipient_type = 1
                         
                         # Handle Exchange internal addresses
                         if recipient_email and (recipient_email.startswith('/o=') or recipient_email.startswith('/O=')):
-                            logger.info(f"🔧 DEBUG: Found Exchange recipient address (duplicate): '{recipient_email}' - converting...")
+                            logger.debug("Found Exchange recipient address: '%s' - converting...", recipient_email)
                             # Convert Exchange address to valid format
                             if recipient_name and recipient_name != recipient_email:
-                                clean_name = ''.join(c for c in recipient_name if c.isalnum() or c in '._-')
+                                clean_name = _NON_ADDRESS_CHARS_RE.sub('', recipient_name)
                                 recipient_email = f"{clean_name}@internal.exchange" if clean_name else "unknown@internal.exchange"
-                                logger.info(f"🔧 DEBUG: Converted recipient using name: '{recipient_email}'")
+                                logger.debug("Converted recipient using name: '%s'", recipient_email)
                             else:
                                 # Extract CN from Exchange address
                                 if 'cn=' in recipient_email.lower():
                                     try:
                                         cn_part = recipient_email.lower().split('cn=')[-1].split('/')[0].split('-')[0]
                                         recipient_email = f"{cn_part}@internal.exchange"
-                                        logger.info(f"🔧 DEBUG: Converted recipient using CN: '{recipient_email}'")
+                                        logger.debug("Converted recipient using CN: '%s'", recipient_email)
                                     except:
                                         recipient_email = "unknown@internal.exchange"
-                                        logger.info(f"🔧 DEBUG: Recipient conversion failed, using default: '{recipient_email}'")
+                                        logger.debug("Recipient conversion failed, using default: '%s'", recipient_email)
                                 else:
                                     recipient_email = "unknown@internal.exchange"
-                                    logger.info(f"🔧 DEBUG: No CN found in recipient, using default: '{recipient_email}'")
+                                    logger.debug("No CN found in recipient, using default: '%s'", recipient_email)
                         
                         # Only add if we have a valid email format
                         if recipient_email and '@' in recipient_email:
-                            if recipient_type == 1:  # To
-                                recipients.append(recipient_email)
-                            elif recipient_type == 2:  # CC
-                                cc_recipients.append(recipient_email)
-                            elif recipient_type == 3:  # BCC
-                                bcc_recipients.append(recipient_email)
+                            append = appenders.get(recipient_type)
+                            if append is not None:
+                                append(recipient_email)
                         else:
-                            logger.info(f"🔧 DEBUG: Skipping invalid recipient email: '{recipient_email}'")
+                            logger.debug("Skipping invalid recipient address: %s", recipient_email)
             except Exception as e:
-                logger.debug(f"Error processing recipients: {str(e)}")
+                logger.debug("Error processing recipients: %s", e)
             
             # Get email body with SIMPLIFIED and RELIABLE extraction
             body = ''
@@ -1975,55 +2353,48 @@ class OutlookAdapter:
                 
                 # Method 1: Simple direct access to Body property
                 try:
-                    if hasattr(email_item, 'Body'):
-                        body_raw = email_item.Body
-                        if body_raw is not None:
-                            body = str(body_raw).strip()
-                            if body:
-                                logger.debug(f"Body extraction SUCCESS: {len(body)} chars")
-                            else:
-                                logger.debug("Body property exists but is empty")
+                    body_raw = getattr(email_item, 'Body', None)
+                    if body_raw is not None:
+                        body = str(body_raw).strip()
+                        if body:
+                            logger.debug("Body extraction SUCCESS: %s chars", len(body))
                         else:
-                            logger.debug("Body property is None")
+                            logger.debug("Body property exists but is empty")
                     else:
-                        logger.debug("Email item has no Body property")
+                        logger.debug("Body property is missing or None")
                 except Exception as e:
-                    logger.debug(f"Body access failed: {e}")
+                    logger.debug("Body access failed: %s", e)
                 
                 # Method 2: Simple direct access to HTMLBody property
                 try:
-                    if hasattr(email_item, 'HTMLBody'):
-                        html_body_raw = email_item.HTMLBody
-                        if html_body_raw is not None:
-                            body_html = str(html_body_raw).strip()
-                            if body_html:
-                                logger.debug(f"HTMLBody extraction SUCCESS: {len(body_html)} chars")
-                                
-                                # If we have HTML but no plain text, extract it now
-                                if not body:
-                                    try:
-                                        import re
-                                        # Extract text from HTML
-                                        text_from_html = re.sub(r'<[^>]+>', '', body_html)
-                                        text_from_html = text_from_html.replace('&nbsp;', ' ')
-                                        text_from_html = text_from_html.replace('&lt;', '<')
-                                        text_from_html = text_from_html.replace('&gt;', '>')
-                                        text_from_html = text_from_html.replace('&amp;', '&')
-                                        text_from_html = text_from_html.strip()
-                                        
-                                        if text_from_html:
-                                            body = text_from_html
-                                            logger.debug(f"Extracted text from HTML: {len(body)} chars")
-                                    except Exception as e:
-                                        logger.debug(f"Failed to extract text from HTML: {e}")
-                            else:
-                                logger.debug("HTMLBody property exists but is empty")
+                    html_body_raw = getattr(email_item, 'HTMLBody', None)
+                    if html_body_raw is not None:
+                        body_html = str(html_body_raw).strip()
+                        if body_html:
+                            logger.debug("HTMLBody extraction SUCCESS: %s chars", len(body_html))
+                            
+                            # If we have HTML but no plain text, extract it now
+                            if not body:
+                                try:
+                                    # Extract text from HTML
+                                    text_from_html = _HTML_TAG_RE.sub('', body_html)
+                                    text_from_html = text_from_html.replace('&nbsp;', ' ')
+                                    text_from_html = text_from_html.replace('&lt;', '<')
+                                    text_from_html = text_from_html.replace('&gt;', '>')
+                                    text_from_html = text_from_html.replace('&amp;', '&')
+                                    text_from_html = text_from_html.strip()
+                                    
+                                    if text_from_html:
+                                        body = text_from_html
+                                        logger.debug("Extracted text from HTML: %s chars", len(body))
+                                except Exception as e:
+                                    logger.debug("Failed to extract text from HTML: %s", e)
                         else:
-                            logger.debug("HTMLBody property is None")
+                            logger.debug("HTMLBody property exists but is empty")
                     else:
-                        logger.debug("Email item has no HTMLBody property")
+                        logger.debug("HTMLBody property is missing or None")
                 except Exception as e:
-                    logger.debug(f"HTMLBody access failed: {e}")
+                    logger.debug("HTMLBody access failed: %s", e)
                 
                 # Method 3: If both are still empty, try simple COM object refresh
                 if not body and not body_html:
@@ -2033,20 +2404,18 @@ class OutlookAdapter:
                         _ = email_item.Size
                         
                         # Try body again after refresh
-                        if hasattr(email_item, 'Body'):
-                            body_raw = email_item.Body
-                            if body_raw:
-                                body = str(body_raw).strip()
-                                logger.debug(f"Post-refresh Body: {len(body)} chars")
+                        body_raw = getattr(email_item, 'Body', None)
+                        if body_raw:
+                            body = str(body_raw).strip()
+                            logger.debug("Post-refresh Body: %s chars", len(body))
                         
-                        if hasattr(email_item, 'HTMLBody'):
-                            html_body_raw = email_item.HTMLBody
-                            if html_body_raw:
-                                body_html = str(html_body_raw).strip()
-                                logger.debug(f"Post-refresh HTMLBody: {len(body_html)} chars")
+                        html_body_raw = getattr(email_item, 'HTMLBody', None)
+                        if html_body_raw:
+                            body_html = str(html_body_raw).strip()
+                            logger.debug("Post-refresh HTMLBody: %s chars", len(body_html))
                                 
                     except Exception as e:
-                        logger.debug(f"Simple refresh failed: {e}")
+                        logger.debug("Simple refresh failed: %s", e)
                 
 
                 
@@ -2061,7 +2430,7 @@ class OutlookAdapter:
                         # Don't set placeholder text - leave body empty so we can identify the real issue
                         
                     except Exception as e:
-                        logger.debug(f"Final check failed: {e}")
+                        logger.debug("Final check failed: %s", e)
                 
             except Exception as e:
                 logger.error(f"CRITICAL ERROR in body extraction: {e}")
@@ -2073,21 +2442,21 @@ class OutlookAdapter:
             sent_time = None
             
             try:
-                if hasattr(email_item, 'ReceivedTime'):
-                    received_time = email_item.ReceivedTime
-                if hasattr(email_item, 'SentOn'):
-                    sent_time = email_item.SentOn
+                received_time = getattr(email_item, 'ReceivedTime', None)
+                sent_time = getattr(email_item, 'SentOn', None)
             except Exception as e:
-                logger.debug(f"Error processing timestamps: {str(e)}")
+                logger.debug("Error processing timestamps: %s", e)
             
             # Get other properties
             is_read = not getattr(email_item, 'UnRead', True)
-            has_attachments = getattr(email_item, 'Attachments', Mock()).Count > 0 if hasattr(email_item, 'Attachments') else False
+            try:
+                has_attachments = email_item.Attachments.Count > 0
+            except AttributeError:
+                has_attachments = False
             
             # Get importance
             importance_value = getattr(email_item, 'Importance', 1)  # 0=Low, 1=Normal, 2=High
-            importance_map = {0: "Low", 1: "Normal", 2: "High"}
-            importance = importance_map.get(importance_value, "Normal")
+            importance = _IMPORTANCE_NAMES.get(importance_value, "Normal")
             
             # Get size
             size = getattr(email_item, 'Size', 0)
@@ -2098,10 +2467,10 @@ class OutlookAdapter:
             
             # Only use fallback email if we truly can't find the real one
             if not sender_email or '@' not in sender_email:
-                logger.debug(f"Could not find valid sender email for: {subject[:50]}...")
+                logger.debug("Could not find valid sender email for: %s...", subject[:50])
                 if sender_name:
                     # Create a more recognizable placeholder
-                    clean_name = ''.join(c for c in sender_name if c.isalnum() or c in '._-')
+                    clean_name = _NON_ADDRESS_CHARS_RE.sub('', sender_name)
                     sender_email = f"{clean_name}@email-not-available.com" if clean_name else "unknown@email-not-available.com"
                 else:
                     sender_email = "unknown@email-not-available.com"
@@ -2131,7 +2500,7 @@ class OutlookAdapter:
             
         except Exception as e:
             logger.error(f"Error transforming email to data: {str(e)}")
-            logger.info(f"🔧 DEBUG: Exception handler - creating minimal email data")
+            logger.debug("Exception handler - creating minimal email data")
             
             # Return minimal email data if transformation fails
             email_id = getattr(email_item, 'EntryID', f"unknown_{id(email_item)}")
@@ -2139,23 +2508,23 @@ class OutlookAdapter:
             sender_name = getattr(email_item, 'SenderName', 'Unknown Sender')
             sender_email = getattr(email_item, 'SenderEmailAddress', 'unknown@unknown.com')
             
-            logger.info(f"🔧 DEBUG: Exception handler - Raw sender: Name='{sender_name}', Email='{sender_email}'")
+            logger.debug("Exception handler - Raw sender: Name='%s', Email='%s'", sender_name, sender_email)
             
             # Handle Exchange addresses in error handler too
             if sender_email and (sender_email.startswith('/o=') or sender_email.startswith('/O=')):
-                logger.info(f"🔧 DEBUG: Exception handler - Found Exchange address, converting...")
+                logger.debug("Exception handler - Found Exchange address, converting...")
                 if sender_name and sender_name != sender_email:
-                    clean_name = ''.join(c for c in sender_name if c.isalnum() or c in '._-')
+                    clean_name = _NON_ADDRESS_CHARS_RE.sub('', sender_name)
                     sender_email = f"{clean_name}@internal.exchange" if clean_name else "unknown@internal.exchange"
                 else:
                     sender_email = "unknown@internal.exchange"
-                logger.info(f"🔧 DEBUG: Exception handler - Converted to: '{sender_email}'")
+                logger.debug("Exception handler - Converted to: '%s'", sender_email)
             
             # Ensure valid email format
             elif not sender_email or '@' not in sender_email:
                 if sender_name and sender_name != 'Unknown Sender':
                     # Remove any invalid characters from sender name for email
-                    clean_name = ''.join(c for c in sender_name if c.isalnum() or c in '._-')
+                    clean_name = _NON_ADDRESS_CHARS_RE.sub('', sender_name)
                     sender_email = f"{clean_name}@unknown.com" if clean_name else "unknown@unknown.com"
                 else:
                     sender_email = "unknown@unknown.com"
@@ -2207,26 +2576,26 @@ class OutlookAdapter:
                 email_id = f"unknown_{id(email_item)}"
             
             # Get enhanced recipient information
-            logger.info(f"🔧 DEBUG: About to extract recipients...")
+            logger.debug("About to extract recipients...")
             try:
                 recipients, cc_recipients, bcc_recipients = self._extract_recipients(email_item)
-                logger.info(f"🔧 DEBUG: Recipients extracted - To: {len(recipients)}, CC: {len(cc_recipients)}, BCC: {len(bcc_recipients)}")
+                logger.debug("Recipients extracted - To: %s, CC: %s, BCC: %s", len(recipients), len(cc_recipients), len(bcc_recipients))
             except Exception as recipient_error:
-                logger.info(f"🔧 DEBUG: Recipient extraction failed: {recipient_error}")
+                logger.debug("Recipient extraction failed: %s", recipient_error)
                 recipients, cc_recipients, bcc_recipients = [], [], []
             
             # Get email body with enhanced content extraction
-            logger.info(f"🔧 DEBUG: About to extract body...")
+            logger.debug("About to extract body...")
             body, body_html = self._extract_email_body(email_item)
-            logger.info(f"🔧 DEBUG: Body extracted - Text: {len(body)}, HTML: {len(body_html)}")
+            logger.debug("Body extracted - Text: %s, HTML: %s", len(body), len(body_html))
             
             # Additional fallback: if we have HTML but no plain text, extract text from HTML
             if body_html and not body:
                 try:
                     body = self._extract_text_from_html(body_html)
-                    logger.debug(f"Extracted text from HTML: {len(body)} chars")
+                    logger.debug("Extracted text from HTML: %s chars", len(body))
                 except Exception as e:
-                    logger.debug(f"Failed to extract text from HTML: {e}")
+                    logger.debug("Failed to extract text from HTML: %s", e)
             
             # Get timestamps with proper handling
             received_time, sent_time = self._extract_timestamps(email_item)
@@ -2247,13 +2616,13 @@ class OutlookAdapter:
             folder_name = self._extract_folder_name(email_item)
             
             # Validate and fix sender information
-            logger.info(f"🔧 DEBUG: About to validate sender info...")
+            logger.debug("About to validate sender info...")
             sender_name, sender_email = self._validate_sender_info(sender_name, sender_email)
-            logger.info(f"🔧 DEBUG: Sender validated - Name: '{sender_name}', Email: '{sender_email}'")
+            logger.debug("Sender validated - Name: '%s', Email: '%s'", sender_name, sender_email)
             
             # Create EmailData with all extracted information
-            logger.info(f"🔧 DEBUG: About to create EmailData object...")
-            logger.info(f"🔧 DEBUG: Recipients for EmailData - To: {recipients}, CC: {cc_recipients}, BCC: {bcc_recipients}")
+            logger.debug("About to create EmailData object...")
+            logger.debug("Recipients for EmailData - To: %s, CC: %s, BCC: %s", recipients, cc_recipients, bcc_recipients)
             
             email_data = EmailData(
                 id=email_id,
@@ -2274,7 +2643,7 @@ class OutlookAdapter:
                 size=size
             )
             
-            logger.debug(f"Successfully transformed email to detailed data: {email_id}")
+            logger.debug("Successfully transformed email to detailed data: %s", email_id)
             return email_data
             
         except Exception as e:
@@ -2321,28 +2690,27 @@ class OutlookAdapter:
             Property value or default value
         """
         try:
-            # Method 1: Standard attribute access
-            if hasattr(email_item, property_name):
-                value = getattr(email_item, property_name)
-                if value is not None:
-                    logger.info(f"🔧 DEBUG: Got {property_name}={value} via standard access")
-                    return value
-            
-            # Method 2: Try case variations
-            property_variations = [
-                property_name,
+            # Method 1: Standard attribute access; hasattr() would fetch the
+            # property from Outlook once more before getattr() does
+            value = getattr(email_item, property_name, None)
+            if value is not None:
+                logger.debug("Got %s=%s via standard access", property_name, value)
+                return value
+            
+            # Method 2: Try case variations not already tried
+            property_variations = dict.fromkeys([
                 property_name.lower(),
                 property_name.upper(),
                 property_name.capitalize()
-            ]
+            ])
+            property_variations.pop(property_name, None)
             
             for prop_var in property_variations:
                 try:
-                    if hasattr(email_item, prop_var):
-                        value = getattr(email_item, prop_var)
-                        if value is not None:
-                            logger.info(f"🔧 DEBUG: Got {property_name}={value} via case variation {prop_var}")
-                            return value
+                    value = getattr(email_item, prop_var, None)
+                    if value is not None:
+                        logger.debug("Got %s=%s via case variation %s", property_name, value, prop_var)
+                        return value
                 except:
                     continue
             
@@ -2355,17 +2723,16 @@ class OutlookAdapter:
                     # Invoke the property getter
                     value = email_item._oleobj_.Invoke(disp_id, 0, pythoncom.DISPATCH_PROPERTYGET, 1)
                     if value is not None:
-                        logger.info(f"🔧 DEBUG: Got {property_name}={value} via COM invoke")
+                        logger.debug("Got %s=%s via COM invoke", property_name, value)
                         return value
             except Exception as com_e:
-                logger.info(f"🔧 DEBUG: COM invoke failed for {property_name}: {com_e}")
+                logger.debug("COM invoke failed for %s: %s", property_name, com_e)
             
-            logger.info(f"🔧 DEBUG: All methods failed for {property_name}, using default: {default_value}")
+            logger.debug("All methods failed for %s, using default: %s", property_name, default_value)
             return default_value
             
         except Exception as e:
-            logger.info(f"🔧 DEBUG: Error getting property '{property_name}': {str(e)}")
-            logger.debug(f"Error getting property '{property_name}': {str(e)}")
+            logger.debug("Error getting property '%s': %s", property_name, e)
             return default_value
     
     def _extract_recipients(self, email_item: Any) -> tuple[List[str], List[str], List[str]]:
@@ -2383,16 +2750,21 @@ class OutlookAdapter:
         bcc_recipients = []
         
         try:
-            logger.info(f"🔧 DEBUG: Starting recipient extraction...")
-            if hasattr(email_item, 'Recipients') and email_item.Recipients:
-                logger.info(f"🔧 DEBUG: Found {email_item.Recipients.Count} recipients")
-                for recipient in email_item.Recipients:
+            # Fetch the collection once; every access to email_item.Recipients
+            # is a separate call into Outlook
+            item_recipients = getattr(email_item, 'Recipients', None)
+            if item_recipients:
+                # List to add an address to, by OlMailRecipientType
+                appenders = {1: recipients.append, 2: cc_recipients.append, 3: bcc_recipients.append}
+                for recipient in item_recipients:
                     try:
-                        recipient_email = self._get_email_property(recipient, 'Address', '')
-                        recipient_name = self._get_email_property(recipient, 'Name', '')
-                        recipient_type = self._get_email_property(recipient, 'Type', 1)  # 1=To, 2=CC, 3=BCC
-                        
-                        logger.info(f"🔧 DEBUG: Processing recipient - Email: '{recipient_email}', Name: '{recipient_name}', Type: {recipient_type}")
+                        # Read directly; _get_email_property() adds a log line and
+                        # fallback lookups for every property of every recipient
+                        recipient_email = getattr(recipient, 'Address', None) or ''
+                        recipient_name = getattr(recipient, 'Name', None) or ''
+                        recipient_type = getattr(recipient, 'Type', None)  # 1=To, 2=CC, 3=BCC
+                        if recipient_type is None:
+                            recipient_type = 1
                         
                         # Use email address if available, otherwise use name
                         recipient_address = recipient_email if recipient_email else recipient_name
@@ -2401,13 +2773,13 @@ class OutlookAdapter:
                         if recipient_address:
                             # Convert Exchange internal addresses to a readable format
                             if recipient_address.startswith('/o=') or recipient_address.startswith('/O='):
-                                logger.info(f"🔧 DEBUG: Found Exchange address: '{recipient_address}' - converting...")
+                                logger.debug("Found Exchange address: '%s' - converting...", recipient_address)
                                 # This is an Exchange internal address - convert to name@internal.exchange
                                 if recipient_name and recipient_name != recipient_address:
                                     # Use the display name if available
-                                    clean_name = ''.join(c for c in recipient_name if c.isalnum() or c in '._-')
+                                    clean_name = _NON_ADDRESS_CHARS_RE.sub('', recipient_name)
                                     recipient_address = f"{clean_name}@internal.exchange" if clean_name else "unknown@internal.exchange"
-                                    logger.info(f"🔧 DEBUG: Converted using name: '{recipient_address}'")
+                                    logger.debug("Converted using name: '%s'", recipient_address)
                                 else:
                                     # Extract some identifier from the Exchange address
                                     if 'cn=' in recipient_address.lower():
@@ -2415,33 +2787,30 @@ class OutlookAdapter:
                                             # Extract the CN (Common Name) part
                                             cn_part = recipient_address.lower().split('cn=')[-1].split('/')[0].split('-')[0]
                                             recipient_address = f"{cn_part}@internal.exchange"
-                                            logger.info(f"🔧 DEBUG: Converted using CN: '{recipient_address}'")
+                                            logger.debug("Converted using CN: '%s'", recipient_address)
                                         except:
                                             recipient_address = "unknown@internal.exchange"
-                                            logger.info(f"🔧 DEBUG: Conversion failed, using default: '{recipient_address}'")
+                                            logger.debug("Conversion failed, using default: '%s'", recipient_address)
                                     else:
                                         recipient_address = "unknown@internal.exchange"
-                                        logger.info(f"🔧 DEBUG: No CN found, using default: '{recipient_address}'")
+                                        logger.debug("No CN found, using default: '%s'", recipient_address)
                             
                             # Now validate the cleaned email format
                             if self._is_valid_email_format(recipient_address):
-                                if recipient_type == 1:  # To
-                                    recipients.append(recipient_address)
-                                elif recipient_type == 2:  # CC
-                                    cc_recipients.append(recipient_address)
-                                elif recipient_type == 3:  # BCC
-                                    bcc_recipients.append(recipient_address)
+                                append = appenders.get(recipient_type)
+                                if append is not None:
+                                    append(recipient_address)
                             else:
                                 # Skip invalid addresses to prevent EmailData validation errors
-                                logger.debug(f"Skipping invalid recipient address: {recipient_address}")
+                                logger.debug("Skipping invalid recipient address: %s", recipient_address)
                                 continue
                                 
                     except Exception as e:
-                        logger.debug(f"Error processing recipient: {str(e)}")
+                        logger.debug("Error processing recipient: %s", e)
                         continue
                         
         except Exception as e:
-            logger.debug(f"Error extracting recipients: {str(e)}")
+            logger.debug("Error extracting recipients: %s", e)
         
         return recipients, cc_recipients, bcc_recipients
     
@@ -2459,36 +2828,36 @@ class OutlookAdapter:
         body_html = ""
         
         try:
-            logger.info(f"🔧 DEBUG: Starting body extraction...")
+            logger.debug("Starting body extraction...")
             
             # Get plain text body
             body = self._get_email_property(email_item, 'Body', '')
-            logger.info(f"🔧 DEBUG: Plain text body length: {len(body)}")
+            logger.debug("Plain text body length: %s", len(body))
             
             # Get HTML body
             body_html = self._get_email_property(email_item, 'HTMLBody', '')
-            logger.info(f"🔧 DEBUG: HTML body length: {len(body_html)}")
+            logger.debug("HTML body length: %s", len(body_html))
             
             # If we have HTML but no plain text, try to extract text from HTML
             if body_html and not body:
-                logger.info(f"🔧 DEBUG: Extracting text from HTML...")
+                logger.debug("Extracting text from HTML...")
                 body = self._extract_text_from_html(body_html)
-                logger.info(f"🔧 DEBUG: Extracted text length: {len(body)}")
+                logger.debug("Extracted text length: %s", len(body))
             
             # If we have plain text but no HTML, create basic HTML
             elif body and not body_html:
-                logger.info(f"🔧 DEBUG: Creating HTML from text...")
+                logger.debug("Creating HTML from text...")
                 body_html = self._create_html_from_text(body)
             
             # Clean up the content
             body = self._clean_text_content(body)
             body_html = self._clean_html_content(body_html)
             
-            logger.info(f"🔧 DEBUG: Final body lengths - Text: {len(body)}, HTML: {len(body_html)}")
+            logger.debug("Final body lengths - Text: %s, HTML: %s", len(body), len(body_html))
             
         except Exception as e:
-            logger.info(f"🔧 DEBUG: Error extracting email body: {str(e)}")
-            logger.debug(f"Error extracting email body: {str(e)}")
+            logger.debug("Error extracting email body: %s", e)
+            logger.debug("Error extracting email body: %s", e)
         
         return body, body_html
     
@@ -2518,7 +2887,7 @@ class OutlookAdapter:
                 sent_time = email_item.CreationTime
                 
         except Exception as e:
-            logger.debug(f"Error extracting timestamps: {str(e)}")
+            logger.debug("Error extracting timestamps: %s", e)
         
         return received_time, sent_time
     
@@ -2541,10 +2910,10 @@ class OutlookAdapter:
                 has_attachments = attachment_count > 0
                 
                 if has_attachments:
-                    logger.debug(f"Email has {attachment_count} attachments")
+                    logger.debug("Email has %s attachments", attachment_count)
                     
         except Exception as e:
-            logger.debug(f"Error extracting attachment info: {str(e)}")
+            logger.debug("Error extracting attachment info: %s", e)
         
         return has_attachments, attachment_count
     
@@ -2560,10 +2929,9 @@ class OutlookAdapter:
         """
         try:
             importance_value = self._get_email_property(email_item, 'Importance', 1)
-            importance_map = {0: "Low", 1: "Normal", 2: "High"}
-            return importance_map.get(importance_value, "Normal")
+            return _IMPORTANCE_NAMES.get(importance_value, "Normal")
         except Exception as e:
-            logger.debug(f"Error extracting importance: {str(e)}")
+            logger.debug("Error extracting importance: %s", e)
             return "Normal"
     
     def _extract_folder_name(self, email_item: Any) -> str:
@@ -2582,10 +2950,11 @@ class OutlookAdapter:
                 if hasattr(parent_folder, 'Name'):
                     return parent_folder.Name
         except Exception as e:
-            logger.debug(f"Error extracting folder name: {str(e)}")
+            logger.debug("Error extracting folder name: %s", e)
         
         return "Unknown"
     
+    @_on_com_thread
     def send_email(self, 
                    to_recipients: List[str], 
                    subject: str, 
@@ -2647,34 +3016,34 @@ class OutlookAdapter:
                     raise ValidationError(f"Invalid BCC email address: {email}", "bcc_recipients")
         
         # Validate body format
-        valid_formats = {"html": 2, "text": 1, "rtf": 3}  # Outlook constants
-        if body_format.lower() not in valid_formats:
-            raise ValidationError(f"Invalid body format. Must be one of: {list(valid_formats.keys())}", "body_format")
+        if body_format.lower() not in _BODY_FORMATS:
+            raise ValidationError(f"Invalid body format. Must be one of: {list(_BODY_FORMATS)}", "body_format")
         
         # Validate importance
-        importance_map = {"low": 0, "normal": 1, "high": 2}  # Outlook constants
-        if importance.lower() not in importance_map:
-            raise ValidationError(f"Invalid importance. Must be one of: {list(importance_map.keys())}", "importance")
+        if importance.lower() not in _IMPORTANCE_VALUES:
+            raise ValidationError(f"Invalid importance. Must be one of: {list(_IMPORTANCE_VALUES)}", "importance")
         
         try:
-            # Initialize COM for this thread
-            pythoncom.CoInitialize()
-            
             logger.info(f"Sending email to {len(to_recipients)} recipients: {', '.join(to_recipients)}")
             
-            # Create a new Outlook application instance for this thread
-            # This is necessary because COM objects can't be shared across threads
-            try:
-                outlook_app = win32com.client.GetActiveObject("Outlook.Application")
-                logger.info("Using existing Outlook instance for sending email")
-            except Exception as e:
-                logger.info(f"Could not get existing Outlook instance: {e}")
+            if self._com_executor is not None:
+                # Already on the COM thread that owns the connected application
+                outlook_app = self._outlook_app
+            else:
+                self._ensure_com_on_thread()
+                # Create a new Outlook application instance for this thread
+                # This is necessary because COM objects can't be shared across threads
                 try:
-                    outlook_app = win32com.client.Dispatch("Outlook.Application")
-                    logger.info("Created new Outlook instance for sending email")
-                except Exception as e2:
-                    logger.error(f"Failed to create Outlook instance: {e2}")
-                    raise OutlookConnectionError(f"Cannot create Outlook application: {e2}")
+                    outlook_app = win32com.client.GetActiveObject("Outlook.Application")
+                    logger.info("Using existing Outlook instance for sending email")
+                except Exception as e:
+                    logger.info(f"Could not get existing Outlook instance: {e}")
+                    try:
+                        outlook_app = win32com.client.Dispatch("Outlook.Application")
+                        logger.info("Created new Outlook instance for sending email")
+                    except Exception as e2:
+                        logger.error(f"Failed to create Outlook instance: {e2}")
+                        raise OutlookConnectionError(f"Cannot create Outlook application: {e2}")
             
             # Create a new mail item
             try:
@@ -2711,7 +3080,7 @@ class OutlookAdapter:
                 mail_item.RTFBody = body
             
             # Set importance
-            mail_item.Importance = importance_map[importance.lower()]
+            mail_item.Importance = _IMPORTANCE_VALUES[importance.lower()]
             
             # Add attachments if provided
             if attachments:
@@ -2724,7 +3093,7 @@ class OutlookAdapter:
                         import os
                         if os.path.exists(attachment_path):
                             mail_item.Attachments.Add(attachment_path)
-                            logger.debug(f"Added attachment: {attachment_path}")
+                            logger.debug("Added attachment: %s", attachment_path)
                         else:
                             logger.warning(f"Attachment file not found: {attachment_path}")
                     except Exception as e:
@@ -2767,21 +3136,17 @@ class OutlookAdapter:
         except Exception as e:
             logger.error(f"Failed to send email: {str(e)}")
             
+            message = str(e)
+            
             # Check for permission-related errors
-            if any(keyword in str(e).lower() for keyword in ['access', 'permission', 'denied', 'unauthorized', 'policy']):
-                raise PermissionError("send_email", f"Permission denied to send email: {str(e)}")
+            if _SEND_ACCESS_ERR_RE.search(message):
+                raise OutlookPermissionError("send_email", f"Permission denied to send email: {message}")
             
             # Check for validation errors
-            if any(keyword in str(e).lower() for keyword in ['invalid', 'malformed', 'resolve', 'recipient']):
-                raise ValidationError(f"Email validation failed: {str(e)}")
+            if _SEND_INVALID_ERR_RE.search(message):
+                raise ValidationError(f"Email validation failed: {message}")
             
             raise OutlookConnectionError(f"Failed to send email: {str(e)}")
-        
-        finally:
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass  # Ignore cleanup errors
     
     def _validate_email_address(self, email: str) -> bool:
         """
@@ -2812,17 +3177,17 @@ class OutlookAdapter:
         Returns:
             Tuple of (validated_sender_name, validated_sender_email)
         """
-        logger.info(f"🔧 DEBUG: Validating sender - Name: '{sender_name}', Email: '{sender_email}'")
+        logger.debug("Validating sender - Name: '%s', Email: '%s'", sender_name, sender_email)
         
         # Handle Exchange internal addresses first
         if sender_email and (sender_email.startswith('/o=') or sender_email.startswith('/O=')):
-            logger.info(f"🔧 DEBUG: Found Exchange sender address: '{sender_email}' - converting...")
+            logger.debug("Found Exchange sender address: '%s' - converting...", sender_email)
             # This is an Exchange internal address - convert to name@internal.exchange
             if sender_name and sender_name != sender_email:
                 # Use the display name if available
-                clean_name = ''.join(c for c in sender_name if c.isalnum() or c in '._-')
+                clean_name = _NON_ADDRESS_CHARS_RE.sub('', sender_name)
                 sender_email = f"{clean_name}@internal.exchange" if clean_name else "unknown@internal.exchange"
-                logger.info(f"🔧 DEBUG: Converted sender using name: '{sender_email}'")
+                logger.debug("Converted sender using name: '%s'", sender_email)
             else:
                 # Extract some identifier from the Exchange address
                 if 'cn=' in sender_email.lower():
@@ -2830,31 +3195,31 @@ class OutlookAdapter:
                         # Extract the CN (Common Name) part
                         cn_part = sender_email.lower().split('cn=')[-1].split('/')[0].split('-')[0]
                         sender_email = f"{cn_part}@internal.exchange"
-                        logger.info(f"🔧 DEBUG: Converted sender using CN: '{sender_email}'")
+                        logger.debug("Converted sender using CN: '%s'", sender_email)
                     except:
                         sender_email = "unknown@internal.exchange"
-                        logger.info(f"🔧 DEBUG: Sender conversion failed, using default: '{sender_email}'")
+                        logger.debug("Sender conversion failed, using default: '%s'", sender_email)
                 else:
                     sender_email = "unknown@internal.exchange"
-                    logger.info(f"🔧 DEBUG: No CN found in sender, using default: '{sender_email}'")
+                    logger.debug("No CN found in sender, using default: '%s'", sender_email)
         
         # Fix sender email if invalid
         elif not sender_email or not self._is_valid_email_format(sender_email):
-            logger.info(f"🔧 DEBUG: Invalid sender email format, creating from name...")
+            logger.debug("Invalid sender email format, creating from name...")
             if sender_name:
                 # Create email from sender name
-                clean_name = ''.join(c for c in sender_name if c.isalnum() or c in '._-')
+                clean_name = _NON_ADDRESS_CHARS_RE.sub('', sender_name)
                 sender_email = f"{clean_name}@unknown.com" if clean_name else "unknown@unknown.com"
             else:
                 sender_email = "unknown@unknown.com"
-            logger.info(f"🔧 DEBUG: Created sender email: '{sender_email}'")
+            logger.debug("Created sender email: '%s'", sender_email)
         
         # Fix sender name if missing
         if not sender_name:
             sender_name = sender_email.split('@')[0] if '@' in sender_email else "Unknown Sender"
-            logger.info(f"🔧 DEBUG: Created sender name: '{sender_name}'")
+            logger.debug("Created sender name: '%s'", sender_name)
         
-        logger.info(f"🔧 DEBUG: Final sender - Name: '{sender_name}', Email: '{sender_email}'")
+        logger.debug("Final sender - Name: '%s', Email: '%s'", sender_name, sender_email)
         return sender_name, sender_email
     
     def _is_valid_email_format(self, email: str) -> bool:
@@ -2870,30 +3235,7 @@ class OutlookAdapter:
         if not email or not isinstance(email, str):
             return False
         
-        # Must contain @ and have content before and after @
-        if '@' not in email:
-            return False
-        
-        parts = email.split('@')
-        if len(parts) != 2:
-            return False
-        
-        local_part, domain_part = parts
-        
-        # Local part (before @) must not be empty
-        if not local_part:
-            return False
-        
-        # Domain part must contain at least one dot and have content before and after
-        if '.' not in domain_part:
-            return False
-        
-        domain_parts = domain_part.split('.')
-        # Must have at least 2 parts and none can be empty
-        if len(domain_parts) < 2 or any(not part for part in domain_parts):
-            return False
-        
-        return True
+        return _EMAIL_FORMAT_RE.fullmatch(email) is not None
     
     def _extract_text_from_html(self, html_content: str) -> str:
         """
@@ -2907,15 +3249,14 @@ class OutlookAdapter:
         """
         try:
             # Basic HTML tag removal (for simple cases)
-            import re
-            text = re.sub(r'<[^>]+>', '', html_content)
+            text = _HTML_TAG_RE.sub('', html_content)
             text = text.replace('&nbsp;', ' ')
             text = text.replace('&lt;', '<')
             text = text.replace('&gt;', '>')
             text = text.replace('&amp;', '&')
             return text.strip()
         except Exception as e:
-            logger.debug(f"Error extracting text from HTML: {str(e)}")
+            logger.debug("Error extracting text from HTML: %s", e)
             return html_content
     
     def _create_html_from_text(self, text_content: str) -> str:
@@ -2933,7 +3274,7 @@ class OutlookAdapter:
             html_content = text_content.replace('\n', '<br>\n')
             return f"<html><body>{html_content}</body></html>"
         except Exception as e:
-            logger.debug(f"Error creating HTML from text: {str(e)}")
+            logger.debug("Error creating HTML from text: %s", e)
             return text_content
     
     def _clean_text_content(self, content: str) -> str:
@@ -2951,11 +3292,11 @@ class OutlookAdapter:
         
         try:
             # Remove excessive whitespace
-            content = re.sub(r'\s+', ' ', content)
+            content = _WHITESPACE_RE.sub(' ', content)
             content = content.strip()
             return content
         except Exception as e:
-            logger.debug(f"Error cleaning text content: {str(e)}")
+            logger.debug("Error cleaning text content: %s", e)
             return content
     
     def _clean_html_content(self, content: str) -> str:
@@ -2973,11 +3314,11 @@ class OutlookAdapter:
         
         try:
             # Basic HTML cleanup - remove excessive whitespace between tags
-            content = re.sub(r'>\s+<', '><', content)
+            content = _INTER_TAG_SPACE_RE.sub('><', content)
             content = content.strip()
             return content
         except Exception as e:
-            logger.debug(f"Error cleaning HTML content: {str(e)}")
+            logger.debug("Error cleaning HTML content: %s", e)
             return content
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -0,0 +1,213 @@
+"""
+Command-line interface for the Outlook MCP Server.
+
+Runs the server in different modes:
+- stdio: Standard MCP stdio transport (default)
+- http: MCP over HTTP for remote access
+- interactive: Interactive mode with console output
+- test: Test Outlook connection and exit
+- create-config: Write a sample configuration file
+- single-request: Handle one MCP request from stdin and exit
+
+The root ``main.py`` script is a thin wrapper around :func:`main`.
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+# Server modules are imported inside main() by the mode that needs them, so
+# --help and create-config never load the server or Outlook COM stack.
+
+
+# Reused encoder for single-request responses (same output as json.dumps)
+_encode_response = json.JSONEncoder(ensure_ascii=False).encode
+
+
+async def handle_single_request(config):
+    """Handle a single MCP request from stdin and exit."""
+    try:
+        # Read JSON request from stdin
+        input_line = sys.stdin.readline().strip()
+        if not input_line:
+            print('{"jsonrpc": "2.0", "id": null, "error": {"code": -32700, "message": "No input provided"}}')
+            return
+        
+        # Parse JSON request
+        try:
+            request_data = json.loads(input_line)
+        except json.JSONDecodeError as e:
+            # Encode the message so quotes in the decoder error stay valid JSON
+            print(json.dumps({
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32700, "message": f"Parse error: {e}"}
+            }))
+            return
+        
+        # Create and start server
+        from .server import OutlookMCPServer
+        server = OutlookMCPServer(config)
+        await server.start()
+        
+        try:
+            # Handle the request
+            response = await server.handle_request(request_data)
+            
+            # Output response
+            print(_encode_response(response))
+            
+        finally:
+            # Clean up
+            await server.stop()
+            
+    except Exception as e:
+        error_response = {
+            "jsonrpc": "2.0",
+            "id": request_data.get("id") if 'request_data' in locals() else None,
+            "error": {
+                "code": -32603,
+                "message": f"Internal error: {str(e)}"
+            }
+        }
+        print(json.dumps(error_response))
+
+
+def _run(coro, libuv=False):
+    """
+    Run a coroutine to completion.
+    
+    With libuv=True, uses winloop on Windows or uvloop elsewhere when
+    installed; both are optional and the stock asyncio loop is used
+    otherwise. Only the long-running servers, which spend their time on
+    transport I/O, ask for it.
+    """
+    import asyncio
+    
+    libuv_loop = None
+    if libuv:
+        try:
+            if sys.platform == "win32":
+                import winloop as libuv_loop
+            else:
+                import uvloop as libuv_loop
+        except ImportError:
+            pass
+    
+    if libuv_loop is not None:
+        asyncio.set_event_loop_policy(libuv_loop.EventLoopPolicy())
+    
+    return asyncio.run(coro)
+
+
+MODES = ("stdio", "http", "interactive", "test", "create-config", "single-request")
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+def _build_parser():
+    """Build the command-line argument parser."""
+    from ._version import __version__
+    
+    parser = argparse.ArgumentParser(description="Outlook MCP Server")
+    parser.add_argument(
+        "-V", "--version",
+        action="version",
+        version=f"Outlook MCP Server {__version__}"
+    )
+    parser.add_argument(
+        "mode",
+        nargs="?",
+        default="stdio",
+        choices=MODES,
+        help="Server mode (default: stdio)"
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        help="Path to configuration file (JSON format)"
+    )
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        default="INFO",
+        choices=LOG_LEVELS,
+        help="Logging level"
+    )
+    parser.add_argument(
+        "--log-dir",
+        type=str,
+        default="logs",
+        help="Directory for log files"
+    )
+    return parser
+
+
+def main():
+    """Main entry point with mode selection."""
+    # Answer --version before building any parser
+    if len(sys.argv) == 2 and sys.argv[1] in ("-V", "--version"):
+        from ._version import __version__
+        print(f"Outlook MCP Server {__version__}")
+        return
+    
+    args = _build_parser().parse_args()
+    
+    if args.mode == "create-config":
+        from .main import create_sample_config
+        create_sample_config()
+        return
+    
+    from .server import create_server_config
+    
+    # Create basic config
+    config = create_server_config(
+        log_level=args.log_level,
+        log_dir=args.log_dir,
+        enable_console_output=(args.mode != "stdio")
+    )
+    
+    # Load config file if specified
+    if args.config:
+        config_path = Path(args.config)
+        try:
+            # A single open() doubles as the existence check; json detects
+            # the encoding from the raw bytes
+            with open(config_path, 'rb') as f:
+                file_config = json.load(f)
+            config.update(file_config)
+        except FileNotFoundError:
+            print(f"Config file not found: {args.config}")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Error loading config file: {e}")
+            sys.exit(1)
+    
+    try:
+        if args.mode == "stdio":
+            # Run as MCP stdio server (standard mode)
+            from .mcp_stdio_server import run_stdio_server
+            _run(run_stdio_server(config), libuv=True)
+        elif args.mode == "http":
+            # Run as MCP HTTP server (remote access mode)
+            from .http_server import run_http_server
+            _run(run_http_server(config), libuv=True)
+        elif args.mode == "interactive":
+            # Run in interactive mode with console output
+            from .main import main as run_interactive_server
+            _run(run_interactive_server())
+        elif args.mode == "test":
+            # Test connection and exit
+            from .main import test_outlook_connection
+            from .logging.logger import get_logger
+            logger = get_logger(__name__)
+            _run(test_outlook_connection(config, logger))
+        elif args.mode == "single-request":
+            # Process a single request from stdin and exit
+            _run(handle_single_request(config))
+            
+    except KeyboardInterrupt:
+        print("\nServer stopped by user")
+        sys.exit(0)
+    except Exception as e:
+        print(f"Fatal error: {e}")
+        sys.exit(1)
@@ -36,25 +36,30 @@ import asyncio
 import json
 import sys
 import argparse
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List, NoReturn
+from typing import Dict, Any, Optional, List, NoReturn, TYPE_CHECKING
 
-from .server import OutlookMCPServer, create_server_config
-from .logging.logger import get_logger
+from ._version import __version__
 
+# The server and logging stack are imported where they are used so that
+# create_sample_config() stays importable without loading Outlook COM.
+if TYPE_CHECKING:
+    from .server import OutlookMCPServer
 
-async def main() -> None:
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Main entry point for the Outlook MCP Server.
+    Build the command line parser for the interactive server.
     
-    Parses command line arguments, loads configuration, and starts the appropriate
-    server mode based on the provided arguments.
+    The parser is cached so repeated calls in the same process reuse it.
     
-    Raises:
-        SystemExit: On configuration errors or startup failures
-        KeyboardInterrupt: On user interruption (Ctrl+C)
+    Returns:
+        argparse.ArgumentParser: Configured argument parser
     """
-    # Parse command line arguments with comprehensive help
     parser = argparse.ArgumentParser(
         description="Outlook MCP Server - Provides MCP access to Microsoft Outlook",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -69,6 +74,12 @@ For more information, see the documentation in the docs/ directory.
         """
     )
     
+    parser.add_argument(
+        "-V", "--version",
+        action="version",
+        version=f"Outlook MCP Server {__version__}"
+    )
+    
     # Configuration options
     parser.add_argument(
         "--config", 
@@ -82,7 +93,7 @@ For more information, see the documentation in the docs/ directory.
         "--log-level", 
         type=str, 
         default="INFO",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=LOG_LEVELS,
         help="Set the logging level (default: %(default)s)"
     )
     parser.add_argument(
@@ -116,8 +127,25 @@ For more information, see the documentation in the docs/ directory.
         help="Test Outlook connection and exit without starting server"
     )
     
+    return parser
+
+
+async def main() -> None:
+    """
+    Main entry point for the Outlook MCP Server.
+    
+    Parses command line arguments, loads configuration, and starts the appropriate
+    server mode based on the provided arguments.
+    
+    Raises:
+        SystemExit: On configuration errors or startup failures
+        KeyboardInterrupt: On user interruption (Ctrl+C)
+    """
     # Parse arguments
-    args = parser.parse_args()
+    args = _build_parser().parse_args()
+    
+    from .server import OutlookMCPServer
+    from .logging.logger import get_logger
     
     # Load configuration
     config = load_config(args)
@@ -181,6 +209,8 @@ def load_config(args: argparse.Namespace) -> Dict[str, Any]:
         >>> config['log_level']
         'DEBUG'
     """
+    from .server import create_server_config
+    
     # Start with default configuration
     config = create_server_config()
     
@@ -188,14 +218,10 @@ def load_config(args: argparse.Namespace) -> Dict[str, Any]:
     if args.config:
         config_path = Path(args.config)
         
-        if not config_path.exists():
-            print(f"❌ Configuration file not found: {args.config}")
-            print(f"   Please check the file path or create the file using:")
-            print(f"   python main.py create-config")
-            sys.exit(1)
-        
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
+            # A single open() doubles as the existence check; json detects
+            # the encoding from the raw bytes
+            with open(config_path, 'rb') as f:
                 file_config = json.load(f)
             
             # Validate configuration structure
@@ -206,6 +232,11 @@ def load_config(args: argparse.Namespace) -> Dict[str, Any]:
             config.update(file_config)
             print(f"✅ Loaded configuration from: {config_path}")
             
+        except FileNotFoundError:
+            print(f"❌ Configuration file not found: {args.config}")
+            print(f"   Please check the file path or create the file using:")
+            print(f"   python main.py create-config")
+            sys.exit(1)
         except json.JSONDecodeError as e:
             print(f"❌ Invalid JSON in configuration file: {args.config}")
             print(f"   Error: {e}")
@@ -291,10 +322,12 @@ async def test_outlook_connection(config: Dict[str, Any], logger) -> None:
         This function provides detailed output to help diagnose connection issues.
         Warnings are non-fatal and indicate partial functionality.
     """
+    from .server import OutlookMCPServer
+    
     print("🔍 Testing Outlook MCP Server Connection")
     print("=" * 50)
     
-    server: Optional[OutlookMCPServer] = None
+    server: Optional["OutlookMCPServer"] = None
     
     try:
         # Initialize server
@@ -422,7 +455,7 @@ async def test_outlook_connection(config: Dict[str, Any], logger) -> None:
         print("=" * 50)
 
 
-async def run_server_loop(server: OutlookMCPServer, logger) -> None:
+async def run_server_loop(server: "OutlookMCPServer", logger) -> None:
     """Run the main server loop."""
     logger.info("Server is running. Press Ctrl+C to stop.")
     
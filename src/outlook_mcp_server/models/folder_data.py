@@ -3,10 +3,16 @@
 from dataclasses import dataclass
 from typing import Optional
 import re
+import sys
 from .exceptions import ValidationError
 
 
-@dataclass
+# One instance is built per folder during enumeration, so drop the
+# per-instance __dict__ where dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FolderData:
     """Data model for folder information."""
     
@@ -318,12 +318,12 @@ class EmailService:
                         
                         email_data = temp_adapter.get_email_by_id(email_id)
                 else:
-                    # Ensure we're connected
-                    if not self.outlook_adapter.is_connected():
+                    # Ensure we're connected, without blocking the event loop
+                    if not await self.outlook_adapter.ais_connected():
                         raise OutlookConnectionError("Not connected to Outlook")
                     
-                    # Get the email from adapter
-                    email_data = self.outlook_adapter.get_email_by_id(email_id)
+                    # Get the email from adapter off the event loop
+                    email_data = await self.outlook_adapter.aget_email_by_id(email_id)
             
             # Cache the email if memory manager is available
             if self.memory_manager:
@@ -414,12 +414,12 @@ class EmailService:
                     
                     email_data_list = temp_adapter.search_emails(query, folder_identifier=folder_id, limit=limit)
             else:
-                # Ensure we're connected
-                if not self.outlook_adapter.is_connected():
+                # Ensure we're connected, without blocking the event loop
+                if not await self.outlook_adapter.ais_connected():
                     raise OutlookConnectionError("Not connected to Outlook")
                 
-                # Perform search using adapter
-                email_data_list = self.outlook_adapter.search_emails(query, folder_identifier=folder_id, limit=limit)
+                # Perform search using adapter off the event loop
+                email_data_list = await self.outlook_adapter.asearch_emails(query, folder_identifier=folder_id, limit=limit)
             
             # Transform to JSON format
             json_emails = []
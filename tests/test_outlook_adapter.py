@@ -49,7 +49,8 @@ class TestOutlookAdapter:
         mock_pythoncom.CoInitialize.assert_called_once()
         mock_client.GetActiveObject.assert_called_once_with("Outlook.Application")
         mock_outlook_app.GetNamespace.assert_called_once_with("MAPI")
-        mock_namespace.GetDefaultFolder.assert_called_with(6)  # Inbox
+        # The inbox resolved by the connection test is reused as the probe
+        mock_namespace.GetDefaultFolder.assert_called_once_with(6)  # Inbox
     
     @patch('src.outlook_mcp_server.adapters.outlook_adapter.pythoncom')
     @patch('src.outlook_mcp_server.adapters.outlook_adapter.win32com.client')
@@ -260,6 +261,51 @@ class TestOutlookAdapter:
         with pytest.raises(FolderNotFoundError):
             self.adapter.get_folder_by_name("NonExistentFolder")
     
+    @patch('src.outlook_mcp_server.adapters.outlook_adapter.pythoncom')
+    @patch('src.outlook_mcp_server.adapters.outlook_adapter.win32com.client')
+    def test_get_folder_by_name_caches_results(self, mock_client, mock_pythoncom):
+        """Test get_folder_by_name reuses earlier hits, and misses until they expire."""
+        mock_outlook_app = Mock()
+        mock_namespace = Mock()
+        mock_inbox = Mock()
+        mock_inbox.Name = "Inbox"
+        
+        mock_client.GetActiveObject.return_value = mock_outlook_app
+        mock_outlook_app.GetNamespace.return_value = mock_namespace
+        mock_namespace.GetDefaultFolder.return_value = mock_inbox
+        mock_stores = PropertyMock(return_value=[])
+        type(mock_namespace).Folders = mock_stores
+        
+        self.adapter.connect()
+        
+        assert self.adapter.get_folder_by_name("Inbox") == mock_inbox
+        with pytest.raises(FolderNotFoundError):
+            self.adapter.get_folder_by_name("Projects")
+        
+        assert self.adapter.get_folder_by_name("Inbox") == mock_inbox
+        with pytest.raises(FolderNotFoundError):
+            self.adapter.get_folder_by_name("Projects")
+        
+        # The folder tree was only walked for the first miss
+        assert mock_stores.call_count == 1
+        
+        # A folder created later is found once the miss expires
+        import time
+        from src.outlook_mcp_server.adapters.outlook_adapter import _FOLDER_MISS_TTL
+        
+        mock_projects = Mock()
+        mock_projects.Name = "Projects"
+        mock_stores.return_value = [mock_projects]
+        later = time.monotonic() + _FOLDER_MISS_TTL
+        with patch('src.outlook_mcp_server.adapters.outlook_adapter.time.monotonic', return_value=later):
+            assert self.adapter.get_folder_by_name("Projects") == mock_projects
+        
+        # Invalidating drops found folders as well
+        mock_stores.return_value = []
+        self.adapter.invalidate_folder_cache()
+        with pytest.raises(FolderNotFoundError):
+            self.adapter.get_folder_by_name("Projects")
+    
     def test_get_email_by_id_when_not_connected(self):
         """Test get_email_by_id raises error when not connected."""
         with pytest.raises(OutlookConnectionError):
@@ -334,6 +380,56 @@ class TestOutlookAdapter:
         assert result.sender_email == "test@example.com"
         mock_namespace.GetItemFromID.assert_called_once_with("test_email_id")
     
+    @patch('src.outlook_mcp_server.adapters.outlook_adapter.pythoncom')
+    @patch('src.outlook_mcp_server.adapters.outlook_adapter.win32com.client')
+    def test_get_email_by_id_caches_results(self, mock_client, mock_pythoncom):
+        """Test get_email_by_id serves repeat lookups from its cache until cleared."""
+        from datetime import datetime
+        
+        mock_outlook_app = Mock()
+        mock_namespace = Mock()
+        
+        mock_email = Mock()
+        mock_email.Class = 43  # olMail
+        mock_email.EntryID = "test_email_id"
+        mock_email.Subject = "Test Email Subject"
+        mock_email.SenderName = "Test Sender"
+        mock_email.SenderEmailAddress = "test@example.com"
+        mock_email.Body = "Test body content"
+        mock_email.HTMLBody = ""
+        mock_email.ReceivedTime = datetime(2023, 1, 15, 10, 30, 0)
+        mock_email.UnRead = False
+        mock_email.Importance = 1
+        mock_email.Size = 1024
+        mock_email.Attachments.Count = 0
+        mock_email.Recipients = []
+        mock_email.Parent.Name = "Inbox"
+        
+        mock_inbox = Mock()
+        mock_inbox.Name = "Inbox"
+        
+        mock_client.GetActiveObject.return_value = mock_outlook_app
+        mock_client.Dispatch.return_value = mock_outlook_app
+        mock_outlook_app.GetNamespace.return_value = mock_namespace
+        mock_folders = MagicMock()
+        mock_folders.Count = 1
+        mock_folders.__iter__.side_effect = lambda: iter([mock_inbox])
+        mock_namespace.Folders = mock_folders
+        mock_namespace.GetItemFromID.return_value = mock_email
+        
+        self.adapter.connect()
+        
+        first = self.adapter.get_email_by_id("test_email_id")
+        second = self.adapter.get_email_by_id("test_email_id")
+        assert second == first
+        # Each caller gets its own copy to modify
+        assert second is not first
+        assert mock_namespace.GetItemFromID.call_count == 1
+        
+        self.adapter.clear_email_cache()
+        self.adapter.get_email_by_id("test_email_id")
+        assert mock_namespace.GetItemFromID.call_count == 2
+    
     @patch('src.outlook_mcp_server.adapters.outlook_adapter.pythoncom')
     @patch('src.outlook_mcp_server.adapters.outlook_adapter.win32com.client')
     def test_get_email_by_id_not_found(self, mock_client, mock_pythoncom):
@@ -847,43 +943,25 @@ class TestOutlookAdapter:
     @patch('src.outlook_mcp_server.adapters.outlook_adapter.pythoncom')
     @patch('src.outlook_mcp_server.adapters.outlook_adapter.win32com.client')
     def test_search_emails_global_search(self, mock_client, mock_pythoncom):
-        """Test search_emails with global search across all folders."""
+        """Test search_emails with global search across all mail folders."""
         from datetime import datetime
         
         # Set up successful connection
         mock_outlook_app = Mock()
         mock_namespace = Mock()
-        mock_inbox = Mock()
+        
+        # Default folders by olDefaultFolders constant; only Inbox and
+        # Sent Items hold mail items
+        default_folders = {}
+        for folder_id, name, item_type in ((6, "Inbox", 0), (5, "Sent Items", 0), (9, "Calendar", 1)):
+            folder = Mock()
+            folder.Name = name
+            folder.DefaultItemType = item_type
+            default_folders[folder_id] = folder
         
         mock_client.GetActiveObject.return_value = mock_outlook_app
         mock_outlook_app.GetNamespace.return_value = mock_namespace
-        mock_namespace.GetDefaultFolder.return_value = mock_inbox
-        
-        # Mock get_folders to return test folders
-        from src.outlook_mcp_server.models.folder_data import FolderData
-        test_folders = [
-            FolderData(
-                id="folder1_id",
-                name="Inbox",
-                full_path="Inbox",
-                item_count=10,
-                unread_count=2,
-                parent_folder="",
-                folder_type="Mail"
-            ),
-            FolderData(
-                id="folder2_id",
-                name="Sent Items",
-                full_path="Sent Items",
-                item_count=5,
-                unread_count=0,
-                parent_folder="",
-                folder_type="Mail"
-            )
-        ]
-        
-        # Mock the get_folders method
-        self.adapter.get_folders = Mock(return_value=test_folders)
+        mock_namespace.GetDefaultFolder.side_effect = lambda folder_id: default_folders.get(folder_id)
         
         # Mock search results for each folder
         mock_email1 = Mock()
@@ -907,13 +985,13 @@ class TestOutlookAdapter:
         mock_parent1.Name = "Inbox"
         mock_email1.Parent = mock_parent1
         
-        # Mock _search_in_folder to return results
-        def mock_search_in_folder(query, folder_name, limit):
+        # Mock _perform_folder_search to return results
+        def mock_perform_folder_search(folder, query, limit, folder_name):
             if folder_name == "Inbox":
                 return [self.adapter._transform_email_to_data(mock_email1, "Inbox")]
             return []
         
-        self.adapter._search_in_folder = Mock(side_effect=mock_search_in_folder)
+        self.adapter._perform_folder_search = Mock(side_effect=mock_perform_folder_search)
         
         self.adapter.connect()
         
@@ -925,11 +1003,9 @@ class TestOutlookAdapter:
         assert results[0].subject == "Global Search Result 1"
         assert results[0].sender == "Global Sender"
         
-        # Verify get_folders was called
-        self.adapter.get_folders.assert_called_once()
-        
-        # Verify search was attempted in folders
-        assert self.adapter._search_in_folder.call_count >= 1
+        # Only the mail folders were searched, through their handles
+        searched = [call.args[0] for call in self.adapter._perform_folder_search.call_args_list]
+        assert searched == [default_folders[6], default_folders[5]]
     
     @patch('src.outlook_mcp_server.adapters.outlook_adapter.pythoncom')
     @patch('src.outlook_mcp_server.adapters.outlook_adapter.win32com.client')
@@ -1221,6 +1297,22 @@ class TestOutlookAdapter:
         # Test query with from syntax
         result = self.adapter._process_search_query("from:sender@example.com")
         assert result == "from:sender@example.com"
+    
+    def test_build_dasl_filter(self):
+        """Test _build_dasl_filter translates parsed terms into a DASL filter."""
+        search_terms = {'subject': ["o'brien"], 'body': [], 'from': ["alice"], 'to': [], 'general': []}
+        
+        result = self.adapter._build_dasl_filter(search_terms)
+        
+        assert result == (
+            "@SQL=\"urn:schemas:httpmail:subject\" LIKE '%o''brien%'"
+            " OR \"urn:schemas:httpmail:fromname\" LIKE '%alice%'"
+            " OR \"urn:schemas:httpmail:fromemail\" LIKE '%alice%'"
+        )
+        
+        # Nothing to search for
+        empty_terms = {'subject': [], 'body': [], 'from': [], 'to': [], 'general': []}
+        assert self.adapter._build_dasl_filter(empty_terms) is None
 
 
 class TestOutlookAdapterFolderOperations:
@@ -1243,6 +1335,52 @@ class TestOutlookAdapterFolderOperations:
         with pytest.raises(OutlookConnectionError):
             self.adapter.get_folders()
     
+    @patch('src.outlook_mcp_server.adapters.outlook_adapter.pythoncom')
+    def test_iter_folders_reads_folders_lazily(self, mock_pythoncom):
+        """Test iter_folders only reads the folders the caller consumes."""
+        mock_namespace = Mock()
+        mock_inbox = Mock()
+        mock_inbox.Name = "Inbox"
+        mock_inbox.EntryID = "inbox_id"
+        mock_inbox.Items.Count = 3
+        mock_inbox.UnReadItemCount = 1
+        mock_namespace.GetDefaultFolder.return_value = mock_inbox
+        
+        self.adapter._connected = True
+        self.adapter._outlook_app = Mock()
+        self.adapter._namespace = mock_namespace
+        
+        folders = self.adapter.iter_folders()
+        first = next(folders)
+        folders.close()
+        
+        assert first.name == "Inbox"
+        assert first.item_count == 3
+        # One lookup for the connection probe, one for the folder that was read
+        assert mock_namespace.GetDefaultFolder.call_count == 2
+    
+    @pytest.mark.asyncio
+    @patch('src.outlook_mcp_server.adapters.outlook_adapter.pythoncom')
+    async def test_aget_folders_runs_on_com_thread(self, mock_pythoncom):
+        """Test aget_folders runs get_folders on the adapter's COM thread."""
+        import threading
+        
+        calling_threads = []
+        
+        def fake_get_folders():
+            calling_threads.append(threading.current_thread())
+            return []
+        
+        self.adapter.get_folders = fake_get_folders
+        
+        assert await self.adapter.aget_folders() == []
+        assert await self.adapter.aget_folders() == []
+        
+        # Both calls share one worker thread, which initialized COM once
+        assert len(set(calling_threads)) == 1
+        assert calling_threads[0] is not threading.current_thread()
+        mock_pythoncom.CoInitialize.assert_called_once()
+    
     @patch('src.outlook_mcp_server.adapters.outlook_adapter.pythoncom')
     @patch('src.outlook_mcp_server.adapters.outlook_adapter.win32com.client')
     def test_get_folders_success(self, mock_client, mock_pythoncom):